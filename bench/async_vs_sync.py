@@ -0,0 +1,60 @@
+# 동기(threadpool) 스택 vs async(AsyncSession) 스택 처리량 비교용 간단 부하 스크립트.
+# 서버를 ASYNC_DB_ENABLED=false / true 로 각각 띄운 뒤 같은 옵션으로 실행해서 결과를 비교한다.
+#
+#   python bench/async_vs_sync.py --base-url http://127.0.0.1:8080/api/v1 \
+#       --path /items/1/bids/highest --path /users/me --token <accessToken> --concurrency 200 --duration 15
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+async def worker(client: httpx.AsyncClient, paths: list[str], headers: dict, deadline: float, latencies: list, errors: list):
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        t = time.perf_counter()
+        try:
+            r = await client.get(path, headers=headers)
+            if r.status_code >= 400:
+                errors.append(r.status_code)
+                continue
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append(time.perf_counter() - t)
+
+async def run(args):
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    latencies: list[float] = []
+    errors: list = []
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        # warm-up
+        for p in args.path:
+            await client.get(p, headers=headers)
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*[
+            worker(client, args.path, headers, deadline, latencies, errors) for _ in range(args.concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    q = statistics.quantiles(latencies, n=100) if len(latencies) >= 2 else [0] * 99
+    print(f"requests={len(latencies)} errors={len(errors)} elapsed={elapsed:.1f}s")
+    print(f"rps={len(latencies) / elapsed:.1f} p50={q[49] * 1000:.1f}ms p95={q[94] * 1000:.1f}ms p99={q[98] * 1000:.1f}ms")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--base-url", default="http://127.0.0.1:8080/api/v1")
+    ap.add_argument("--path", action="append", required=True)
+    ap.add_argument("--token", default="")
+    ap.add_argument("--concurrency", type=int, default=100)
+    ap.add_argument("--duration", type=float, default=10)
+    asyncio.run(run(ap.parse_args()))
+
+if __name__ == "__main__":
+    main()
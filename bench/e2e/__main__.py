@@ -0,0 +1,114 @@
+# 엔드투엔드 HTTP 부하 테스트. 로컬 서버에 가상 사용자 N명이 시나리오(journeys.py)를 섞어 반복하고
+# 라우트별 rps / p50 / p95 / p99를 출력 + JSON으로 저장. 커밋 간 비교는 compare.
+#
+#   python -m bench.e2e run --base-url http://127.0.0.1:8080/api/v1 \
+#       --users 50 --items 200 --concurrency 50 --duration 30 --mix browse=55,bid=25,watch=10,mypage=5,close=5
+#   python -m bench.e2e compare bench/results/<base>.json bench/results/<new>.json
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+from .dataset import prepare
+from .journeys import parse_mix, virtual_user
+from .stats import Recorder, compare, print_report, save
+
+def _commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+    except OSError:
+        return None
+    if out.returncode != 0:
+        return None
+    dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True)
+    return out.stdout.strip() + ("-dirty" if dirty.stdout.strip() else "")
+
+async def run(args):
+    rng = random.Random(args.seed)
+    mix = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        t = time.perf_counter()
+        ds = await prepare(client, args, rng)
+        print(f"dataset: users={len(ds.users)} items={len(ds.item_ids)} categories={len(ds.category_ids)} "
+              f"({time.perf_counter() - t:.1f}s)")
+
+        rec = Recorder()
+        start = time.perf_counter()
+        recording_from = start + args.warmup
+        deadline = recording_from + args.duration
+
+        async def start_recording():
+            await asyncio.sleep(args.warmup)
+            rec.recording = True
+
+        # 가상 사용자마다 독립된 난수열 (--seed가 같으면 시나리오 순서 재현)
+        await asyncio.gather(start_recording(), *[
+            virtual_user(client, ds, rec, random.Random(rng.random()), ds.users[i % len(ds.users)], mix, deadline, args.think)
+            for i in range(args.concurrency)
+        ])
+        elapsed = time.perf_counter() - recording_from
+
+    result = rec.summary(elapsed)
+    result["meta"] = {
+        "startedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "baseUrl": args.base_url,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "warmup": args.warmup,
+        "mix": mix,
+        "seed": args.seed,
+        "dataset": {"users": len(ds.users), "items": len(ds.item_ids), "categories": len(ds.category_ids)},
+    }
+    print_report(result)
+
+    out = args.out
+    if not out:
+        os.makedirs("bench/results", exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        out = f"bench/results/{stamp}-{result['meta']['commit'] or 'nogit'}.json"
+    save(result, out)
+    print(f"saved: {out}")
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m bench.e2e")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    r = sub.add_parser("run")
+    r.add_argument("--base-url", default="http://127.0.0.1:8080/api/v1")
+    r.add_argument("--users", type=int, default=20, help="가상 사용자 계정 수 (재실행 시 재사용)")
+    r.add_argument("--items", type=int, default=100, help="새로 만들 OPEN 아이템 수 (0이면 기존 OPEN 아이템 사용)")
+    r.add_argument("--max-existing-items", type=int, default=5000)
+    r.add_argument("--tag", default="e2e", help="벤치 계정 이메일 구분자")
+    r.add_argument("--admin-email", default="admin@example.com")
+    r.add_argument("--admin-password", default="P@ssw0rd!")
+    r.add_argument("--setup-concurrency", type=int, default=8)
+    r.add_argument("--concurrency", type=int, default=20, help="동시 가상 사용자 수")
+    r.add_argument("--duration", type=float, default=30, help="측정 시간 (초)")
+    r.add_argument("--warmup", type=float, default=3, help="집계하지 않는 시작 구간 (초)")
+    r.add_argument("--think", type=float, default=0, help="시나리오 사이 평균 대기 (초)")
+    r.add_argument("--mix", default="browse=55,bid=25,watch=10,mypage=5,close=5")
+    r.add_argument("--seed", type=int, default=1)
+    r.add_argument("--timeout", type=float, default=30)
+    r.add_argument("--out", help="결과 JSON 경로 (기본 bench/results/<시각>-<커밋>.json)")
+
+    c = sub.add_parser("compare")
+    c.add_argument("base")
+    c.add_argument("new")
+
+    args = ap.parse_args()
+    if args.cmd == "run":
+        asyncio.run(run(args))
+    else:
+        compare(args.base, args.new)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
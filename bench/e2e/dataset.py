@@ -0,0 +1,110 @@
+import asyncio
+import random
+from dataclasses import dataclass, field
+
+import httpx
+
+# 부하 전에 API로 준비하는 데이터 (사용자 N명 + 판매자별 OPEN 아이템)
+# - 같은 --tag면 사용자는 재사용 (409 -> 로그인), 아이템은 실행마다 새로 만듦
+# - 수십만 건 이상은 API로 만들기엔 느리므로 seed로 DB를 먼저 채우고 --items 0 으로 기존 OPEN 아이템을 사용
+
+PASSWORD = "P@ssw0rd!"
+# 벤치에서 만드는 아이템의 가격 (기존/seed 아이템은 제각각이므로 입찰 시 Dataset.bid_units를 사용)
+START_PRICE = 1000
+BID_UNIT = 100
+
+@dataclass
+class BenchUser:
+    email: str
+    user_id: int
+    token: str
+
+    @property
+    def headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"}
+
+@dataclass
+class Dataset:
+    users: list[BenchUser]
+    category_ids: list[int]
+    item_ids: list[int] = field(default_factory=list)  # 부하 중 입찰/조회 대상 OPEN 아이템
+    sellers: dict[int, int] = field(default_factory=dict)  # item_id -> seller user_id (본인 아이템 입찰 제외용)
+    bid_units: dict[int, int] = field(default_factory=dict)  # item_id -> bidUnit (입찰가 = 최고가 + bidUnit)
+
+async def _gather_limited(limit: int, coros):
+    sem = asyncio.Semaphore(limit)
+
+    async def run(c):
+        async with sem:
+            return await c
+
+    return await asyncio.gather(*[run(c) for c in coros])
+
+async def _user(client: httpx.AsyncClient, email: str) -> BenchUser:
+    r = await client.post("/auth/register", json={"email": email, "password": PASSWORD, "nickname": "bench"})
+    if r.status_code == 409:
+        r = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+    if r.status_code != 200:
+        raise SystemExit(f"user setup failed ({email}): {r.status_code} {r.text}")
+    token = r.json()["accessToken"]
+    me = await client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+    return BenchUser(email=email, user_id=me.json()["id"], token=token)
+
+async def _categories(client: httpx.AsyncClient, admin_email: str, admin_password: str) -> list[int]:
+    cats = (await client.get("/categories")).json()
+    if cats:
+        return [c["id"] for c in cats]
+    r = await client.post("/auth/login", json={"email": admin_email, "password": admin_password})
+    if r.status_code != 200:
+        raise SystemExit("카테고리가 없고 관리자 로그인도 실패했습니다 (--admin-email/--admin-password 또는 seed 먼저 실행)")
+    headers = {"Authorization": f"Bearer {r.json()['accessToken']}"}
+    r = await client.post("/categories", headers=headers, json={"name": "벤치"})
+    return [r.json()["id"]]
+
+async def create_open_item(client: httpx.AsyncClient, seller: BenchUser, category_id: int, title: str) -> int:
+    r = await client.post("/items", headers=seller.headers, json={
+        "categoryId": category_id, "title": title, "description": "bench",
+        "startPrice": START_PRICE, "bidUnit": BID_UNIT,
+    })
+    if r.status_code != 200:
+        raise RuntimeError(f"create item: {r.status_code}")
+    item_id = r.json()["id"]
+    r = await client.post(f"/items/{item_id}/publish", headers=seller.headers)
+    if r.status_code != 200:
+        raise RuntimeError(f"publish item: {r.status_code}")
+    return item_id
+
+async def _existing_open_items(client: httpx.AsyncClient, limit: int) -> dict[int, int]:
+    # item_id -> bidUnit
+    units: dict[int, int] = {}
+    cursor = ""
+    while len(units) < limit:
+        r = await client.get("/items", params={"status": "OPEN", "size": 100, "cursor": cursor})
+        body = r.json()
+        units.update((i["id"], i["bidUnit"]) for i in body["content"])
+        if not body["hasNext"]:
+            break
+        cursor = body["nextCursor"]
+    return dict(list(units.items())[:limit])
+
+async def prepare(client: httpx.AsyncClient, args, rng: random.Random) -> Dataset:
+    emails = [f"bench-{args.tag}-{i}@example.com" for i in range(args.users)]
+    # 회원가입/로그인은 bcrypt라 느림 -> 동시 수 제한
+    users = await _gather_limited(args.setup_concurrency, [_user(client, e) for e in emails])
+    category_ids = await _categories(client, args.admin_email, args.admin_password)
+
+    ds = Dataset(users=list(users), category_ids=category_ids)
+    if args.items > 0:
+        sellers = [users[i % len(users)] for i in range(args.items)]
+        ds.item_ids = list(await _gather_limited(args.setup_concurrency, [
+            create_open_item(client, seller, rng.choice(category_ids), f"bench item {i}")
+            for i, seller in enumerate(sellers)
+        ]))
+        ds.sellers = {item_id: s.user_id for item_id, s in zip(ds.item_ids, sellers)}
+        ds.bid_units = dict.fromkeys(ds.item_ids, BID_UNIT)
+    else:
+        ds.bid_units = await _existing_open_items(client, args.max_existing_items)
+        ds.item_ids = list(ds.bid_units)
+    if not ds.item_ids:
+        raise SystemExit("입찰 대상 OPEN 아이템이 없습니다 (--items > 0 또는 seed 먼저 실행)")
+    return ds
@@ -0,0 +1,113 @@
+import asyncio
+import random
+import time
+
+import httpx
+
+from .dataset import BID_UNIT, START_PRICE, BenchUser, Dataset, create_open_item
+from .stats import Recorder
+
+# 가상 사용자 1명이 반복하는 시나리오들. 라우트는 경로 템플릿 이름으로 집계 ("GET /items/{id}")
+
+class Session:
+    def __init__(self, client: httpx.AsyncClient, ds: Dataset, rec: Recorder, rng: random.Random, user: BenchUser):
+        self.client = client
+        self.ds = ds
+        self.rec = rec
+        self.rng = rng
+        self.user = user
+
+    async def call(self, route: str, method: str, url: str, auth: bool = False, **kw):
+        t = time.perf_counter()
+        try:
+            r = await self.client.request(method, url, headers=self.user.headers if auth else None, **kw)
+        except httpx.HTTPError as e:
+            self.rec.record(route, type(e).__name__, time.perf_counter() - t)
+            return None
+        self.rec.record(route, r.status_code, time.perf_counter() - t)
+        return r
+
+    def biddable_item(self) -> int:
+        # 본인 아이템은 입찰 불가 -> 다른 판매자 아이템 중에서
+        for _ in range(5):
+            item_id = self.rng.choice(self.ds.item_ids)
+            if self.ds.sellers.get(item_id) != self.user.user_id:
+                return item_id
+        return item_id
+
+async def browse(s: Session):
+    # 목록(앞쪽 페이지, 가끔 카테고리 필터) -> 상세 -> 입찰 내역
+    params = {"page": s.rng.choice((0, 0, 0, 1, 2)), "size": 20, "status": "OPEN"}
+    if s.rng.random() < 0.3:
+        params["categoryId"] = s.rng.choice(s.ds.category_ids)
+    r = await s.call("GET /items", "GET", "/items", params=params)
+    ids = [i["id"] for i in r.json()["content"]] if r is not None and r.status_code == 200 else []
+    item_id = s.rng.choice(ids) if ids else s.rng.choice(s.ds.item_ids)
+    await s.call("GET /items/{id}", "GET", f"/items/{item_id}")
+    await s.call("GET /items/{id}/bids", "GET", f"/items/{item_id}/bids", params={"size": 20})
+
+async def bid(s: Session):
+    # 현재가 확인 후 그 아이템의 bidUnit만큼 올려 입찰 (동시 입찰에 밀리면 409 -> 4xx로 집계)
+    item_id = s.biddable_item()
+    r = await s.call("GET /items/{id}/bids/highest", "GET", f"/items/{item_id}/bids/highest")
+    if r is None or r.status_code != 200:
+        return
+    amount = r.json()["highestBid"] + s.ds.bid_units[item_id]
+    await s.call("POST /items/{id}/bids", "POST", f"/items/{item_id}/bids", auth=True, json={"amount": amount})
+
+async def watch_highest(s: Session):
+    # 경매 화면을 띄워 두고 최고가를 짧은 간격으로 폴링
+    item_id = s.rng.choice(s.ds.item_ids)
+    for _ in range(5):
+        await s.call("GET /items/{id}/bids/highest", "GET", f"/items/{item_id}/bids/highest")
+        await asyncio.sleep(0.2)
+
+async def my_pages(s: Session):
+    await s.call("GET /users/me/bids", "GET", "/users/me/bids", auth=True, params={"size": 20})
+    await s.call("GET /orders", "GET", "/orders", auth=True, params={"size": 20})
+
+async def close_and_order(s: Session):
+    # 판매자: 등록 -> 오픈, 구매자: 입찰, 판매자: 마감, 구매자: 주문 생성
+    # 공용 아이템 풀은 건드리지 않도록 매번 새 아이템 사용
+    seller = s.user
+    buyer = s.rng.choice([u for u in s.ds.users if u.user_id != seller.user_id] or [seller])
+    try:
+        t = time.perf_counter()
+        item_id = await create_open_item(s.client, seller, s.rng.choice(s.ds.category_ids), "bench close")
+        s.rec.record("POST /items + publish", 200, time.perf_counter() - t)
+    except (RuntimeError, httpx.HTTPError) as e:
+        s.rec.record("POST /items + publish", type(e).__name__, 0.0)
+        return
+    as_buyer = Session(s.client, s.ds, s.rec, s.rng, buyer)
+    r = await as_buyer.call("POST /items/{id}/bids", "POST", f"/items/{item_id}/bids", auth=True, json={"amount": START_PRICE + BID_UNIT})
+    await s.call("POST /items/{id}/close", "POST", f"/items/{item_id}/close", auth=True)
+    if r is not None and r.status_code == 200:
+        await as_buyer.call("POST /items/{id}/orders", "POST", f"/items/{item_id}/orders", auth=True, json={"address": "bench"})
+
+JOURNEYS = {
+    "browse": browse,
+    "bid": bid,
+    "watch": watch_highest,
+    "mypage": my_pages,
+    "close": close_and_order,
+}
+
+def parse_mix(text: str) -> dict[str, float]:
+    # "browse=60,bid=25,watch=10,close=5" -> 가중치
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in JOURNEYS:
+            raise SystemExit(f"unknown journey: {name} (choose from {', '.join(JOURNEYS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+async def virtual_user(client, ds: Dataset, rec: Recorder, rng: random.Random, user: BenchUser, mix: dict, deadline: float, think: float):
+    s = Session(client, ds, rec, rng, user)
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        await JOURNEYS[name](s)
+        if think:
+            await asyncio.sleep(rng.uniform(0, think * 2))
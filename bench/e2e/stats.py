@@ -0,0 +1,102 @@
+import json
+import statistics
+from collections import defaultdict
+
+# 라우트(템플릿)별 지연/상태 코드 집계 + 결과 JSON 저장/비교
+
+def _pct(sorted_vals: list[float], p: int) -> float:
+    if not sorted_vals:
+        return 0.0
+    if len(sorted_vals) == 1:
+        return sorted_vals[0]
+    return statistics.quantiles(sorted_vals, n=100, method="inclusive")[p - 1]
+
+class Recorder:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.recording = False  # warm-up 동안은 False
+
+    def record(self, route: str, status, seconds: float):
+        # status: HTTP 코드 또는 예외 이름 (연결 실패/타임아웃)
+        if not self.recording:
+            return
+        self.statuses[route][str(status)] += 1
+        if isinstance(status, int) and status < 500:
+            self.latencies[route].append(seconds)
+
+    def summary(self, elapsed: float) -> dict:
+        routes = {}
+        all_lat: list[float] = []
+        all_requests = 0
+        all_errors = 0
+        for route in sorted(self.statuses):
+            lat = sorted(self.latencies[route])
+            all_lat.extend(lat)
+            st = dict(self.statuses[route])
+            requests = sum(st.values())
+            errors = sum(n for s, n in st.items() if not s.isdigit() or int(s) >= 500)
+            rejected = sum(n for s, n in st.items() if s.isdigit() and 400 <= int(s) < 500)
+            all_requests += requests
+            all_errors += errors
+            routes[route] = {
+                "requests": requests,
+                "rps": round(requests / elapsed, 2),
+                "errors": errors,
+                "rejected4xx": rejected,
+                "statuses": st,
+                **_latency(lat),
+            }
+        all_lat.sort()
+        return {
+            "total": {
+                "requests": all_requests,
+                "rps": round(all_requests / elapsed, 2),
+                "errors": all_errors,
+                **_latency(all_lat),
+            },
+            "routes": routes,
+        }
+
+def _latency(lat: list[float]) -> dict:
+    ms = lambda v: round(v * 1000, 2)
+    return {
+        "p50Ms": ms(_pct(lat, 50)),
+        "p95Ms": ms(_pct(lat, 95)),
+        "p99Ms": ms(_pct(lat, 99)),
+        "maxMs": ms(lat[-1]) if lat else 0.0,
+    }
+
+def print_report(result: dict):
+    rows = [("TOTAL", result["total"])] + list(result["routes"].items())
+    print(f"{'route':<40} {'req':>7} {'rps':>8} {'err':>5} {'4xx':>5} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for name, r in rows:
+        print(
+            f"{name:<40} {r['requests']:>7} {r['rps']:>8.1f} {r['errors']:>5} {r.get('rejected4xx', 0):>5} "
+            f"{r['p50Ms']:>7.1f}ms {r['p95Ms']:>6.1f}ms {r['p99Ms']:>6.1f}ms"
+        )
+
+def save(result: dict, path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+def compare(base_path: str, new_path: str):
+    # 두 실행 결과의 라우트별 rps / p95 / p99 변화율
+    with open(base_path, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)
+
+    def delta(a, b):
+        return f"{(b - a) / a * 100:+.1f}%" if a else "-"
+
+    print(f"base: {base['meta'].get('commit')}  new: {new['meta'].get('commit')}")
+    print(f"{'route':<40} {'rps':>18} {'p95':>22} {'p99':>22}")
+    pairs = [("TOTAL", base["total"], new["total"])]
+    pairs += [(k, base["routes"][k], new["routes"][k]) for k in new["routes"] if k in base["routes"]]
+    for name, a, b in pairs:
+        print(
+            f"{name:<40} {b['rps']:>9.1f} {delta(a['rps'], b['rps']):>8} "
+            f"{b['p95Ms']:>11.1f}ms {delta(a['p95Ms'], b['p95Ms']):>8} "
+            f"{b['p99Ms']:>11.1f}ms {delta(a['p99Ms'], b['p99Ms']):>8}"
+        )
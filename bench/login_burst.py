@@ -0,0 +1,94 @@
+# 로그인 폭주 중 처리량 + 같은 워커의 다른 요청 지연 측정.
+# 서버를 PASSWORD_POOL_WORKERS=0 (요청 스레드에서 bcrypt) / N (프로세스 풀) 으로 각각 띄운 뒤 같은 옵션으로 실행.
+#
+#   python bench/login_burst.py --base-url http://127.0.0.1:8080/api/v1 \
+#       --login-concurrency 32 --read-path /categories --read-concurrency 8 --duration 15
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+PASSWORD = "P@ssw0rd!"
+
+def _summary(name: str, latencies: list[float], elapsed: float, extra: str = ""):
+    latencies.sort()
+    q = statistics.quantiles(latencies, n=100) if len(latencies) >= 2 else [0] * 99
+    print(
+        f"{name}: ok={len(latencies)} rps={len(latencies) / elapsed:.1f} "
+        f"p50={q[49] * 1000:.1f}ms p95={q[94] * 1000:.1f}ms p99={q[98] * 1000:.1f}ms {extra}"
+    )
+
+async def login_worker(client, emails, deadline, latencies, rejected, errors):
+    i = 0
+    while time.perf_counter() < deadline:
+        email = emails[i % len(emails)]
+        i += 1
+        t = time.perf_counter()
+        try:
+            r = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+            continue
+        if r.status_code == 503:
+            rejected.append(1)
+            await asyncio.sleep(float(r.headers.get("retry-after", "1")))
+        elif r.status_code != 200:
+            errors.append(r.status_code)
+        else:
+            latencies.append(time.perf_counter() - t)
+
+async def read_worker(client, path, deadline, latencies, errors):
+    while time.perf_counter() < deadline:
+        t = time.perf_counter()
+        try:
+            r = await client.get(path)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+            continue
+        if r.status_code >= 400:
+            errors.append(r.status_code)
+        else:
+            latencies.append(time.perf_counter() - t)
+
+async def run(args):
+    n = args.login_concurrency + args.read_concurrency
+    limits = httpx.Limits(max_connections=n, max_keepalive_connections=n)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        emails = [f"bench-login-{i}@example.com" for i in range(args.users)]
+        for e in emails:
+            r = await client.post("/auth/register", json={"email": e, "password": PASSWORD, "nickname": "bench"})
+            if r.status_code not in (200, 409):
+                raise SystemExit(f"register failed: {r.status_code} {r.text}")
+
+        # 로그인 없이 읽기만 했을 때 기준값
+        base: list[float] = []
+        deadline = time.perf_counter() + min(3.0, args.duration)
+        await asyncio.gather(*[read_worker(client, args.read_path, deadline, base, []) for _ in range(args.read_concurrency)])
+        _summary(f"read {args.read_path} (idle)", base, min(3.0, args.duration))
+
+        logins, reads, rejected, errors = [], [], [], []
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *[login_worker(client, emails, deadline, logins, rejected, errors) for _ in range(args.login_concurrency)],
+            *[read_worker(client, args.read_path, deadline, reads, errors) for _ in range(args.read_concurrency)],
+        )
+        elapsed = time.perf_counter() - started
+
+    _summary("login", logins, elapsed, f"rejected(503)={len(rejected)} errors={len(errors)}")
+    _summary(f"read {args.read_path} (during login burst)", reads, elapsed)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--base-url", default="http://127.0.0.1:8080/api/v1")
+    ap.add_argument("--users", type=int, default=20)
+    ap.add_argument("--login-concurrency", type=int, default=32)
+    ap.add_argument("--read-path", default="/categories")
+    ap.add_argument("--read-concurrency", type=int, default=8)
+    ap.add_argument("--duration", type=float, default=15)
+    asyncio.run(run(ap.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# 목록 응답 직렬화 마이크로벤치: 기존 경로(행 -> DTO -> PageRes -> FastAPI response_model 검증/직렬화)
+# vs fast path(행 -> dict -> JSON bytes, app/api/fastjson.py). DB/HTTP 없이 직렬화 비용만 측정.
+#
+#   PYTHONPATH=src python bench/serialize_lists.py --size 20 --size 100 --repeat 2000
+import argparse
+import asyncio
+import os
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+# 라우터 모듈 import에 필요한 설정 (DB에는 접속하지 않음)
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("JWT_SECRET", "bench")
+
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+
+from app.api import fastjson  # noqa: E402
+from app.api.v1.bids import _BID_COLUMNS, _bid_json  # noqa: E402
+from app.api.v1.items import _ITEM_COLUMNS, _item_json  # noqa: E402
+from app.models.item import ItemStatus  # noqa: E402
+from app.schemas.bid import BidRes  # noqa: E402
+from app.schemas.common import CursorPageRes, PageRes  # noqa: E402
+from app.schemas.item import ItemRes  # noqa: E402
+
+TOTAL = 1000
+
+_loop = asyncio.new_event_loop()
+
+def _serialize(field, page) -> bytes:
+    # FastAPI가 response_model 라우트의 반환값에 하는 처리 (검증 + dump_json)
+    return _loop.run_until_complete(serialize_response(field=field, response_content=page, dump_json=True))
+
+def _rows(columns, values: list[tuple]) -> list:
+    # DB 없이 select(*columns) 결과 행과 같은 속성 접근(r.title)이 되는 행
+    row = namedtuple("Row", [c.key for c in columns])
+    return [row(*v) for v in values]
+
+def item_rows(n: int) -> list:
+    t = datetime(2026, 1, 1, 12, 0, 0, 123456)
+    return _rows(_ITEM_COLUMNS, [
+        (i, 10 + i % 7, 1 + i % 5, f"아이템 제목 {i}", 1000 * i, 100, ItemStatus.OPEN, t + timedelta(days=7), t + timedelta(seconds=i))
+        for i in range(n)
+    ])
+
+def bid_rows(n: int) -> list:
+    t = datetime(2026, 1, 1, 12, 0, 0)
+    return _rows(_BID_COLUMNS, [(i, 1, 10 + i % 7, 1000 + 100 * i, t + timedelta(seconds=i)) for i in range(n)])
+
+def old_items(rows, field):
+    content = [
+        ItemRes(
+            id=r.id, sellerId=r.seller_id, categoryId=r.category_id, title=r.title,
+            startPrice=r.start_price, bidUnit=r.bid_unit, status=r.status.value,
+            endsAt=r.ends_at, createdAt=r.created_at,
+        )
+        for r in rows
+    ]
+    page = PageRes[ItemRes](
+        content=content, page=0, size=len(rows), totalElements=TOTAL, totalPages=(TOTAL + len(rows) - 1) // len(rows),
+        sort="createdAt,DESC", hasNext=True,
+    )
+    return _serialize(field, page)
+
+def old_bids(rows, field):
+    content = [BidRes(id=b.id, itemId=b.item_id, bidderId=b.bidder_id, amount=b.amount, createdAt=b.created_at) for b in rows]
+    page = PageRes[BidRes](
+        content=content, page=0, size=len(rows), totalElements=TOTAL, totalPages=(TOTAL + len(rows) - 1) // len(rows),
+        sort="amount,DESC", hasNext=True,
+    )
+    return _serialize(field, page)
+
+def new_items(rows, field):
+    return fastjson.dumps(fastjson.page([_item_json(r) for r in rows], 0, len(rows), "createdAt,DESC", total=TOTAL))
+
+def new_bids(rows, field):
+    return fastjson.dumps(fastjson.page([_bid_json(b) for b in rows], 0, len(rows), "amount,DESC", total=TOTAL))
+
+def _time(fn, rows, field, repeat: int) -> float:
+    fn(rows, field)
+    t = time.perf_counter()
+    for _ in range(repeat):
+        fn(rows, field)
+    return (time.perf_counter() - t) / repeat
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--size", type=int, action="append", help="페이지 크기 (여러 번 지정 가능, 기본 20/100)")
+    ap.add_argument("--repeat", type=int, default=2000)
+    args = ap.parse_args()
+
+    print(f"encoder: {'orjson' if fastjson.orjson is not None else 'json (stdlib)'}")
+    cases = [
+        ("items", item_rows, old_items, new_items, PageRes[ItemRes] | CursorPageRes[ItemRes]),
+        ("bids", bid_rows, old_bids, new_bids, PageRes[BidRes] | CursorPageRes[BidRes]),
+    ]
+    # 이벤트 루프 왕복 비용은 기존 경로에서 빼기 위해 따로 측정
+    loop_cost = _time(lambda rows, field: _loop.run_until_complete(asyncio.sleep(0)), None, None, args.repeat)
+    for name, make_rows, old, new, model in cases:
+        field = create_model_field(name="Response", type_=model, mode="serialization")
+        for size in args.size or [20, 100]:
+            rows = make_rows(size)
+            assert old(rows, field) == new(rows, field), f"{name} size={size}: 출력이 다름"
+            t_old = _time(old, rows, field, args.repeat) - loop_cost
+            t_new = _time(new, rows, field, args.repeat)
+            print(f"{name:5s} size={size:3d}  pydantic={t_old * 1e6:8.1f}us  fast={t_new * 1e6:7.1f}us  x{t_old / t_new:.1f}")
+
+if __name__ == "__main__":
+    main()
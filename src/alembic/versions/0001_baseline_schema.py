@@ -0,0 +1,118 @@
+"""baseline schema
+
+비정규화 컬럼/검색 색인/토큰 폐기/매출 롤업 등을 추가하기 전의 스키마
+(버전 관리 없이 이미 테이블이 있는 DB는 `alembic stamp 0001` 후 upgrade -> 0002부터 차례로 추가)
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-17 21:25:20.748711
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('categories',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_categories_name'), 'categories', ['name'], unique=True)
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('password_hash', sa.String(length=255), nullable=False),
+    sa.Column('nickname', sa.String(length=30), nullable=False),
+    sa.Column('role', sa.Enum('USER', 'ADMIN', name='userrole'), nullable=False),
+    sa.Column('status', sa.Enum('ACTIVE', 'DEACTIVATED', name='userstatus'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_table('items',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('seller_id', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('start_price', sa.Integer(), nullable=False),
+    sa.Column('bid_unit', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('DRAFT', 'OPEN', 'CLOSED', 'CANCELLED', name='itemstatus'), nullable=False),
+    sa.Column('starts_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('ends_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ),
+    sa.ForeignKeyConstraint(['seller_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_items_category_id'), 'items', ['category_id'], unique=False)
+    op.create_index(op.f('ix_items_ends_at'), 'items', ['ends_at'], unique=False)
+    op.create_index(op.f('ix_items_seller_id'), 'items', ['seller_id'], unique=False)
+    op.create_index(op.f('ix_items_status'), 'items', ['status'], unique=False)
+    op.create_index(op.f('ix_items_title'), 'items', ['title'], unique=False)
+    op.create_table('bids',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('bidder_id', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['bidder_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_bids_amount'), 'bids', ['amount'], unique=False)
+    op.create_index(op.f('ix_bids_bidder_id'), 'bids', ['bidder_id'], unique=False)
+    op.create_index(op.f('ix_bids_item_id'), 'bids', ['item_id'], unique=False)
+    op.create_table('orders',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('buyer_id', sa.Integer(), nullable=False),
+    sa.Column('total_price', sa.Integer(), nullable=False),
+    sa.Column('address', sa.String(length=255), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'PAID', 'SHIPPED', 'COMPLETED', 'CANCELLED', name='orderstatus'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['buyer_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('item_id', name='uq_orders_item_id')
+    )
+    op.create_index(op.f('ix_orders_buyer_id'), 'orders', ['buyer_id'], unique=False)
+    op.create_index(op.f('ix_orders_status'), 'orders', ['status'], unique=False)
+    op.create_table('watches',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'item_id')
+    )
+
+
+def downgrade():
+    op.drop_table('watches')
+    op.drop_index(op.f('ix_orders_status'), table_name='orders')
+    op.drop_index(op.f('ix_orders_buyer_id'), table_name='orders')
+    op.drop_table('orders')
+    op.drop_index(op.f('ix_bids_item_id'), table_name='bids')
+    op.drop_index(op.f('ix_bids_bidder_id'), table_name='bids')
+    op.drop_index(op.f('ix_bids_amount'), table_name='bids')
+    op.drop_table('bids')
+    op.drop_index(op.f('ix_items_title'), table_name='items')
+    op.drop_index(op.f('ix_items_status'), table_name='items')
+    op.drop_index(op.f('ix_items_seller_id'), table_name='items')
+    op.drop_index(op.f('ix_items_ends_at'), table_name='items')
+    op.drop_index(op.f('ix_items_category_id'), table_name='items')
+    op.drop_table('items')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_categories_name'), table_name='categories')
+    op.drop_table('categories')
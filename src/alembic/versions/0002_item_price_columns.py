@@ -0,0 +1,46 @@
+"""item current price / top bidder / bid count
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 21:25:30.112406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite는 FK 추가 ALTER가 없으므로 batch (MySQL은 ALTER 그대로)
+    with op.batch_alter_table('items') as batch_op:
+        batch_op.add_column(sa.Column('current_price', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('top_bidder_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('bid_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.create_foreign_key('fk_items_top_bidder_id_users', 'users', ['top_bidder_id'], ['id'])
+
+    # 기존 입찰로 채우기 (입찰 없는 아이템: current_price = start_price)
+    # 최고가 입찰은 금액이 같으면 먼저 들어온 입찰 (입찰은 현재가 + 단위 이상만 받으므로 보통 유일)
+    op.execute(
+        """
+        UPDATE items SET
+            current_price = COALESCE((SELECT MAX(b.amount) FROM bids b WHERE b.item_id = items.id), start_price),
+            bid_count = (SELECT COUNT(*) FROM bids b WHERE b.item_id = items.id),
+            top_bidder_id = (
+                SELECT b.bidder_id FROM bids b WHERE b.item_id = items.id
+                ORDER BY b.amount DESC, b.id ASC LIMIT 1
+            )
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('items') as batch_op:
+        batch_op.drop_constraint('fk_items_top_bidder_id_users', type_='foreignkey')
+        batch_op.drop_column('bid_count')
+        batch_op.drop_column('top_bidder_id')
+        batch_op.drop_column('current_price')
@@ -0,0 +1,34 @@
+"""item search tokens
+
+기존 아이템 색인: upgrade 후 `PYTHONPATH=src python -m app.reindex`
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 21:25:32.480117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('item_tokens',
+    # MySQL 기본 collation은 "fe"/"fé"를 같은 값으로 봐서 PK가 겹침 -> binary collation
+    sa.Column('token', sa.String(length=4).with_variant(sa.String(length=4, collation='utf8mb4_bin'), 'mysql', 'mariadb'), nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('weight', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['item_id'], ['items.id'], ),
+    sa.PrimaryKeyConstraint('token', 'item_id')
+    )
+    op.create_index(op.f('ix_item_tokens_item_id'), 'item_tokens', ['item_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_item_tokens_item_id'), table_name='item_tokens')
+    op.drop_table('item_tokens')
@@ -0,0 +1,27 @@
+"""category updated_at
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 21:25:37.261840
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 기존 행은 upgrade 시각으로 채워짐 (카테고리 목록 ETag 기준값)
+    # SQLite는 행이 있는 테이블에 non-constant default 컬럼을 ADD할 수 없으므로 batch (MySQL은 ALTER 그대로)
+    with op.batch_alter_table('categories') as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('categories') as batch_op:
+        batch_op.drop_column('updated_at')
@@ -0,0 +1,22 @@
+"""item bid_count index
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 21:25:39.734095
+
+"""
+from alembic import op
+
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_items_bid_count'), 'items', ['bid_count'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_items_bid_count'), table_name='items')
@@ -0,0 +1,32 @@
+"""daily sales rollup
+
+기존 주문 집계: upgrade 후 `PYTHONPATH=src python -m app.backfill_sales --from <첫 주문 날짜>`
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 21:25:42.018763
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('daily_sales',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('sales', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('orders', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+    op.create_index(op.f('ix_orders_created_at'), 'orders', ['created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_orders_created_at'), table_name='orders')
+    op.drop_table('daily_sales')
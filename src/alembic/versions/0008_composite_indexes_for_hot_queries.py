@@ -0,0 +1,49 @@
+"""composite indexes for hot queries
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 21:25:44.567873
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # MySQL은 FK 컬럼에 인덱스가 항상 있어야 하므로 복합 인덱스를 먼저 만들고 단독 인덱스를 지움
+    op.create_index('ix_bids_item_id_amount', 'bids', ['item_id', sa.literal_column('amount DESC')], unique=False)
+    op.create_index('ix_bids_item_id_created_at', 'bids', ['item_id', 'created_at'], unique=False)
+    op.create_index('ix_bids_bidder_id_created_at', 'bids', ['bidder_id', 'created_at'], unique=False)
+    op.create_index('ix_items_status_created_at', 'items', ['status', 'created_at'], unique=False)
+    op.create_index('ix_items_category_id_status_created_at', 'items', ['category_id', 'status', 'created_at'], unique=False)
+    op.create_index('ix_orders_buyer_id_created_at', 'orders', ['buyer_id', 'created_at'], unique=False)
+    op.create_index('ix_watches_user_id_created_at', 'watches', ['user_id', 'created_at'], unique=False)
+
+    # 복합 인덱스의 앞 컬럼과 겹치는 단독 인덱스 (입찰 INSERT마다 갱신 비용만 듦)
+    op.drop_index('ix_bids_item_id', table_name='bids')
+    op.drop_index('ix_bids_bidder_id', table_name='bids')
+    op.drop_index('ix_items_status', table_name='items')
+    op.drop_index('ix_items_category_id', table_name='items')
+    op.drop_index('ix_orders_buyer_id', table_name='orders')
+
+
+def downgrade():
+    op.create_index('ix_orders_buyer_id', 'orders', ['buyer_id'], unique=False)
+    op.create_index('ix_items_category_id', 'items', ['category_id'], unique=False)
+    op.create_index('ix_items_status', 'items', ['status'], unique=False)
+    op.create_index('ix_bids_bidder_id', 'bids', ['bidder_id'], unique=False)
+    op.create_index('ix_bids_item_id', 'bids', ['item_id'], unique=False)
+
+    op.drop_index('ix_watches_user_id_created_at', table_name='watches')
+    op.drop_index('ix_orders_buyer_id_created_at', table_name='orders')
+    op.drop_index('ix_items_category_id_status_created_at', table_name='items')
+    op.drop_index('ix_items_status_created_at', table_name='items')
+    op.drop_index('ix_bids_bidder_id_created_at', table_name='bids')
+    op.drop_index('ix_bids_item_id_created_at', table_name='bids')
+    op.drop_index('ix_bids_item_id_amount', table_name='bids')
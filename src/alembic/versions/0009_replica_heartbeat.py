@@ -0,0 +1,28 @@
+"""replica heartbeat
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 23:10:12.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'replica_heartbeat',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('beat_ms', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+
+def downgrade():
+    op.drop_table('replica_heartbeat')
@@ -0,0 +1,28 @@
+"""id blocks
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17 23:40:05.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'id_blocks',
+        sa.Column('name', sa.String(length=32), nullable=False),
+        sa.Column('next_id', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade():
+    op.drop_table('id_blocks')
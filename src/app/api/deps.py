@@ -1,19 +1,19 @@
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db
+from app.db.replicas import note_request
 from app.models.user import User, UserStatus, UserRole
 from app.core.security import decode_token
 from app.core.errors import AppError
+from app.services.principal_cache import Principal, principal_cache
+from app.services.revocation import revocation_list
 
 bearer = HTTPBearer(auto_error=False)
 
-def get_current_user(
-    cred: HTTPAuthorizationCredentials | None = Depends(bearer),
-    db: Session = Depends(get_db),
-) -> User:
+def _access_user_id(cred: HTTPAuthorizationCredentials | None) -> int:
     if not cred:
         raise AppError(401, "UNAUTHORIZED", "인증 토큰이 필요합니다.")
 
@@ -27,8 +27,13 @@ def get_current_user(
     if payload.get("type") != "access":
         raise AppError(401, "UNAUTHORIZED", "Access token이 아닙니다.")
 
-    user_id = payload.get("sub")
-    user = db.scalar(select(User).where(User.id == int(user_id)))
+    # 로그아웃 등으로 폐기된 토큰 (메모리 Bloom filter + dict, DB 조회 없음)
+    if revocation_list.is_revoked(payload.get("jti")):
+        raise AppError(401, "UNAUTHORIZED", "폐기된 토큰입니다.")
+
+    return int(payload.get("sub"))
+
+def _check_user(user: Principal | None) -> Principal:
     if not user:
         raise AppError(404, "USER_NOT_FOUND", "사용자를 찾을 수 없습니다.")
 
@@ -36,7 +41,46 @@ def get_current_user(
         raise AppError(403, "FORBIDDEN", "비활성화된 계정입니다.")
     return user
 
-def require_admin(user: User = Depends(get_current_user)) -> User:
+def _cache(user: User | None, epoch: int) -> Principal | None:
+    if not user:
+        return None
+    p = Principal.from_user(user)
+    if principal_cache.enabled:
+        principal_cache.put(p, epoch)
+    return p
+
+# 반환값은 ORM User가 아니라 Principal(id, email, nickname, role, status)
+# 사용자 row를 수정해야 하는 라우트는 db.get(User, me.id)로 직접 읽을 것
+def get_current_user(
+    request: Request,
+    cred: HTTPAuthorizationCredentials | None = Depends(bearer),
+    db: Session = Depends(get_db),
+) -> Principal:
+    user_id = _access_user_id(cred)
+    # 레플리카 라우팅용 사용자 id 기록 (쓰기 요청이면 read-your-writes 시작)
+    note_request(request, user_id)
+    cached = principal_cache.get(user_id) if principal_cache.enabled else None
+    if cached:
+        return _check_user(cached)
+    epoch = principal_cache.epoch()
+    # 권한/상태는 레플리카 지연 없이 primary에서 (예전 상태가 principal 캐시에 들어가지 않도록)
+    stmt = select(User).where(User.id == user_id).execution_options(use_primary=True)
+    return _check_user(_cache(db.scalar(stmt), epoch))
+
+async def get_current_user_async(
+    request: Request,
+    cred: HTTPAuthorizationCredentials | None = Depends(bearer),
+    db=Depends(get_async_db),  # AsyncSession (sqlalchemy[asyncio]는 ASYNC_DB_ENABLED일 때만 필요)
+) -> Principal:
+    user_id = _access_user_id(cred)
+    note_request(request, user_id)
+    cached = principal_cache.get(user_id) if principal_cache.enabled else None
+    if cached:
+        return _check_user(cached)
+    epoch = principal_cache.epoch()
+    return _check_user(_cache(await db.scalar(select(User).where(User.id == user_id)), epoch))
+
+def require_admin(user: Principal = Depends(get_current_user)) -> Principal:
     if user.role != UserRole.ADMIN:
         raise AppError(403, "FORBIDDEN", "관리자 권한이 필요합니다.")
     return user
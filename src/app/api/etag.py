@@ -0,0 +1,22 @@
+import hashlib
+
+from fastapi import Request, Response
+
+# 조건부 GET (ETag / If-None-Match).
+# ETag는 응답 본문이 아니라 본문을 결정하는 값(updated_at, bid_count, 쿼리 파라미터 등)으로 만든다
+# -> 일치하면 본문을 만들거나 직렬화하지 않고 바로 304
+
+def make_etag(*parts) -> str:
+    raw = "|".join(str(p) for p in parts)
+    return '"' + hashlib.blake2b(raw.encode(), digest_size=12).hexdigest() + '"'
+
+def check_etag(request: Request, response: Response, etag: str) -> Response | None:
+    # 200 응답에도 ETag를 붙이고, If-None-Match가 일치하면 304 응답 반환 (아니면 None)
+    response.headers["ETag"] = etag
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    # If-None-Match는 weak 비교 (W/ 접두어 무시)
+    if header.strip() == "*" or any(t.strip().removeprefix("W/") == etag for t in header.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
@@ -0,0 +1,64 @@
+import json
+from datetime import datetime
+from enum import Enum
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:  # 없으면 표준 json (출력 같음, 느림)
+    orjson = None
+
+# 목록 응답 직렬화 fast path.
+# - 기본 경로: 행마다 DTO(ItemRes 등) 생성 -> PageRes로 감쌈 -> FastAPI가 response_model로 한 번 더 검증한 뒤 JSON
+# - fast path: SQL 행 -> dict -> JSON bytes (pydantic 모델 생성/검증 없음)
+#   라우트가 Response를 직접 반환하면 FastAPI는 response_model 검증/직렬화를 건너뛰고
+#   response_model은 OpenAPI 스키마에만 쓰임 -> 문서는 그대로
+# - 출력은 pydantic 직렬화와 같은 형태 (필드 순서, datetime ISO 8601 / UTC는 "Z", Enum은 값)
+#   행 -> dict 변환이 DTO 필드와 어긋나지 않는지는 tests/test_23에서 pydantic 출력과 비교
+# - 주의: Response를 직접 반환하므로 주입받은 response: Response에 넣은 헤더는 반영되지 않음 (headers=로 넘길 것)
+
+
+def _default(v):
+    if isinstance(v, datetime):
+        s = v.isoformat()
+        return s[:-6] + "Z" if s.endswith("+00:00") else s
+    if isinstance(v, Enum):
+        return v.value
+    raise TypeError(f"not JSON serializable: {type(v).__name__}")
+
+
+def dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_UTC_Z)
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def jsonable(obj):
+    # 응답 캐시 저장용 (datetime -> 문자열). 캐시 값을 다시 dumps해도 같은 JSON
+    return json.loads(dumps(obj))
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return content if isinstance(content, bytes) else dumps(content)
+
+
+def page(content: list, page: int, size: int, sort: str, total: int | None = None, has_next: bool | None = None) -> dict:
+    # PageRes와 같은 필드 (total=None이면 withTotal=false: totalElements/totalPages null)
+    if total is None:
+        total_pages = None
+    else:
+        total_pages = (total + size - 1) // size if total else 0
+        has_next = (page + 1) * size < total
+    return {
+        "content": content, "page": page, "size": size,
+        "totalElements": total, "totalPages": total_pages, "sort": sort, "hasNext": has_next,
+    }
+
+
+def cursor_page(content: list, size: int, sort: str, next_cursor: str | None) -> dict:
+    # CursorPageRes와 같은 필드
+    return {"content": content, "size": size, "sort": sort, "nextCursor": next_cursor, "hasNext": next_cursor is not None}
@@ -2,51 +2,71 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import select, func
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.api.deps import require_admin
+from app.api import fastjson
 from app.core.errors import AppError
 from app.models.user import User, UserStatus
 from app.models.item import Item, ItemStatus
-from app.schemas.common import PageRes
+from app.schemas.common import PageRes, CursorPageRes
+from app.db.pagination import keyset, cut_page
 from app.schemas.admin import AdminUserRes
+from app.services.auction_engine import auction_engine
+from app.services.bid_hub import bid_hub
+from app.services.leaderboard import leaderboard
+from app.services.principal_cache import principal_cache
+from app.services.response_cache import response_cache
 
 router = APIRouter(prefix="/admin")
 
-@router.get("/users", response_model=PageRes[AdminUserRes])
+# 사용자 목록은 AdminUserRes에 필요한 컬럼만 SELECT
+_USER_COLUMNS = (User.id, User.email, User.nickname, User.role, User.status, User.created_at)
+
+def _user_json(u) -> dict:
+    # _USER_COLUMNS 행 -> AdminUserRes와 같은 필드의 dict (목록 fast path, app/api/fastjson.py)
+    return {
+        "id": u.id, "email": u.email, "nickname": u.nickname,
+        "role": u.role.value, "status": u.status.value, "createdAt": u.created_at,
+    }
+
+@router.get("/users", response_model=PageRes[AdminUserRes] | CursorPageRes[AdminUserRes])
 def admin_list_users(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _=Depends(require_admin),
     page: int = 0,
     size: int = 20,
     sort: str = "createdAt,DESC",
     keyword: str | None = None,
+    cursor: str | None = None,
+    withTotal: bool = True,
 ):
     if size > 100:
         raise AppError(400, "INVALID_QUERY_PARAM", "size는 최대 100입니다.", {"size": size})
 
-    q = select(User)
+    q = select(*_USER_COLUMNS)
     if keyword:
         q = q.where((User.email.like(f"%{keyword}%")) | (User.nickname.like(f"%{keyword}%")))
 
-    total = db.scalar(select(func.count()).select_from(q.subquery()))
-
-    if sort == "createdAt,DESC":
-        q = q.order_by(User.created_at.desc())
-    elif sort == "createdAt,ASC":
-        q = q.order_by(User.created_at.asc())
-    else:
+    if sort not in ("createdAt,DESC", "createdAt,ASC"):
         raise AppError(400, "INVALID_QUERY_PARAM", "sort 값이 올바르지 않습니다.", {"sort": sort})
+    descending = sort == "createdAt,DESC"
+
+    if cursor is not None:
+        rows = db.execute(keyset(q, User.created_at, User.id, descending, sort, cursor, size)).all()
+        rows, next_cursor = cut_page(rows, size, sort, lambda u: (u.created_at, u.id))
+        return fastjson.FastJSONResponse(fastjson.cursor_page([_user_json(u) for u in rows], size, sort, next_cursor))
 
-    rows = db.scalars(q.offset(page * size).limit(size)).all()
-    content = [
-        AdminUserRes(
-            id=u.id, email=u.email, nickname=u.nickname,
-            role=u.role.value, status=u.status.value, createdAt=u.created_at
-        )
-        for u in rows
-    ]
-    total_pages = (total + size - 1) // size if total else 0
-    return PageRes[AdminUserRes](content=content, page=page, size=size, totalElements=total, totalPages=total_pages, sort=sort)
+    ordered = q.order_by(User.created_at.desc() if descending else User.created_at.asc()).offset(page * size)
+
+    if not withTotal:
+        rows = db.execute(ordered.limit(size + 1)).all()
+        body = fastjson.page([_user_json(u) for u in rows[:size]], page, size, sort, has_next=len(rows) > size)
+        return fastjson.FastJSONResponse(body)
+
+    total = db.scalar(select(func.count()).select_from(q.subquery()))
+
+    rows = db.execute(ordered.limit(size)).all()
+    return fastjson.FastJSONResponse(fastjson.page([_user_json(u) for u in rows], page, size, sort, total=total))
 
 @router.patch("/users/{user_id}/deactivate")
 def admin_deactivate_user(user_id: int, db: Session = Depends(get_db), _=Depends(require_admin)):
@@ -55,6 +75,8 @@ def admin_deactivate_user(user_id: int, db: Session = Depends(get_db), _=Depends
         raise AppError(404, "USER_NOT_FOUND", "사용자를 찾을 수 없습니다.")
     u.status = UserStatus.DEACTIVATED
     db.commit()
+    # 모든 워커의 인증 캐시에서 제거될 때까지 기다린 뒤 응답 (확인 못 하면 503 -> 관리자가 다시 시도)
+    principal_cache.invalidate_or_raise(user_id)
     return {"ok": True}
 
 @router.patch("/items/{item_id}/force-close")
@@ -64,6 +86,16 @@ def admin_force_close_item(item_id: int, db: Session = Depends(get_db), _=Depend
         raise AppError(404, "RESOURCE_NOT_FOUND", "아이템을 찾을 수 없습니다.")
     if item.status != ItemStatus.OPEN:
         raise AppError(409, "STATE_CONFLICT", "OPEN 상태만 강제 마감할 수 있습니다.", {"status": item.status.value})
+    if auction_engine.running:
+        auction_engine.close_or_raise(item_id)
     item.status = ItemStatus.CLOSED
     db.commit()
+    response_cache.invalidate("items", f"item:{item_id}")
+    bid_hub.publish_status(item_id, item.status.value)
     return {"ok": True, "status": item.status.value}
+
+@router.post("/stats/leaderboard/rebuild")
+def admin_rebuild_leaderboard(db: Session = Depends(get_db), _=Depends(require_admin)):
+    # items.bid_count를 bids에서 다시 계산하고 입찰 수 상위 목록을 새로 읽음 (다른 워커는 다음 resync 때 반영)
+    updated = leaderboard.rebuild(db)
+    return {"ok": True, "updatedItems": updated, "leaderboard": leaderboard.stats()}
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+
+from app.db.session import get_async_db
+from app.api.deps import get_current_user_async
+from app.services.principal_cache import Principal
+from app.core.errors import AppError
+from app.models.item import Item
+from app.schemas.user import UserMeRes
+from app.services.auction_engine import auction_engine
+
+# 조회가 가장 많은 라우트의 async 버전 (ASYNC_DB_ENABLED=true일 때 router.py에서 동기 라우트보다 먼저 등록)
+# DB 대기 중에 threadpool 슬롯(기본 40개)을 잡지 않고 이벤트 루프에서 기다린다.
+# 응답/에러는 동기 버전과 동일해야 하며, OpenAPI 문서는 동기 버전 것을 그대로 사용한다.
+# ETag / 응답 캐시 / 레플리카 라우팅이 붙은 라우트(GET /items/{id}, /categories)는 async 버전을 두지 않는다
+# (같은 경로를 가리면 그 기능이 꺼짐. 캐시 적중이면 DB를 기다리지 않으므로 async의 이점도 없음)
+# 최고가 조회는 레플리카 대신 항상 primary에서 읽음 (가장 최신 값이라 정확성 문제는 없음)
+
+router = APIRouter(prefix="", include_in_schema=False)
+
+@router.get("/items/{item_id}/bids/highest")
+async def highest_bid_async(item_id: int, db: AsyncSession = Depends(get_async_db)):
+    st = auction_engine.get(item_id) if auction_engine.running else None
+    if st:
+        return {"itemId": item_id, "highestBid": st.current_price}
+    price = await db.scalar(select(Item.current_price).where(Item.id == item_id))
+    if price is None:
+        raise AppError(404, "RESOURCE_NOT_FOUND", "아이템을 찾을 수 없습니다.")
+    return {"itemId": item_id, "highestBid": price}
+
+@router.get("/users/me", response_model=UserMeRes)
+async def me_async(user: Principal = Depends(get_current_user_async)):
+    return UserMeRes(
+        id=user.id,
+        email=user.email,
+        nickname=user.nickname,
+        role=user.role.value,
+        status=user.status.value,
+    )
@@ -1,12 +1,18 @@
+from datetime import datetime, timezone
+
 from fastapi import APIRouter, Depends, Request
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
 from app.db.session import get_db
 from app.models.user import User, UserStatus
-from app.schemas.auth import RegisterReq, LoginReq, TokenRes, RefreshReq
-from app.core.security import hash_password, verify_password, create_access_token, create_refresh_token, decode_token
+from app.schemas.auth import RegisterReq, LoginReq, TokenRes, RefreshReq, LogoutReq
+from app.api.deps import bearer
+from app.core.security import create_access_token, create_refresh_token, decode_token
 from app.core.errors import AppError
+from app.services.password_pool import password_pool
+from app.services.revocation import revocation_list
 
 router = APIRouter(prefix="/auth")
 
@@ -15,10 +21,12 @@ def register(req: RegisterReq, db: Session = Depends(get_db)):
     exists = db.scalar(select(User).where(User.email == req.email))
     if exists:
         raise AppError(409, "DUPLICATE_RESOURCE", "이미 사용 중인 이메일입니다.", {"email": "duplicate"})
+    # bcrypt 동안 DB 커넥션을 잡고 있지 않도록 읽기 트랜잭션 종료 (커넥션 풀 반환)
+    db.rollback()
 
     user = User(
         email=req.email,
-        password_hash=hash_password(req.password),
+        password_hash=password_pool.hash(req.password),
         nickname=req.nickname,
     )
     db.add(user)
@@ -31,19 +39,26 @@ def register(req: RegisterReq, db: Session = Depends(get_db)):
 
 @router.post("/login", response_model=TokenRes)
 def login(req: LoginReq, db: Session = Depends(get_db)):
-    user = db.scalar(select(User).where(User.email == req.email))
-    if not user or not verify_password(req.password, user.password_hash):
+    row = db.execute(
+        select(User.id, User.password_hash, User.role, User.status).where(User.email == req.email)
+    ).first()
+    # bcrypt 동안 DB 커넥션을 잡고 있지 않도록 읽기 트랜잭션 종료 (커넥션 풀 반환)
+    db.rollback()
+    if not row or not password_pool.verify(req.password, row.password_hash):
         raise AppError(401, "UNAUTHORIZED", "이메일 또는 비밀번호가 올바르지 않습니다.")
 
-    if user.status != UserStatus.ACTIVE:
+    if row.status != UserStatus.ACTIVE:
         raise AppError(403, "FORBIDDEN", "비활성화된 계정입니다.")
 
-    access = create_access_token(str(user.id), user.role.value)
-    refresh = create_refresh_token(str(user.id), user.role.value)
+    access = create_access_token(str(row.id), row.role.value)
+    refresh = create_refresh_token(str(row.id), row.role.value)
     return TokenRes(accessToken=access, refreshToken=refresh)
 
+def _expires_at(payload: dict) -> datetime:
+    return datetime.fromtimestamp(payload["exp"], timezone.utc)
+
 @router.post("/refresh", response_model=TokenRes)
-def refresh(req: RefreshReq):
+def refresh(req: RefreshReq, db: Session = Depends(get_db)):
     try:
         payload = decode_token(req.refreshToken)
     except Exception:
@@ -57,12 +72,35 @@ def refresh(req: RefreshReq):
     if not sub or not role:
         raise AppError(401, "UNAUTHORIZED", "토큰 payload가 올바르지 않습니다.")
 
+    # refresh token 회전: 사용한 refresh token은 바로 폐기 (한 번만 사용 가능)
+    # revoked_tokens PK(jti) INSERT가 성공한 요청만 통과하므로 같은 토큰으로 동시에 요청해도 하나만 재발급
+    # jti가 없는 토큰(폐기 목록 도입 전 발급)은 회전/폐기할 수 없으므로 받지 않음 -> 다시 로그인
+    jti = payload.get("jti")
+    if not jti:
+        raise AppError(401, "UNAUTHORIZED", "토큰이 만료되었습니다. 다시 로그인해 주세요.")
+    if not revocation_list.revoke(db, jti, _expires_at(payload)):
+        raise AppError(401, "UNAUTHORIZED", "이미 사용되었거나 폐기된 토큰입니다.")
+
     access = create_access_token(sub, role)
     refresh_token = create_refresh_token(sub, role)
     return TokenRes(accessToken=access, refreshToken=refresh_token)
 
 @router.post("/logout")
-def logout():
-    # 과제 범위에선 서버측 블랙리스트를 안 해도 됨(선택).
-    # Postman/Swagger에서 “클라 토큰 삭제”로 처리한다고 문서화하면 충분.
+def logout(
+    req: LogoutReq | None = None,
+    cred: HTTPAuthorizationCredentials | None = Depends(bearer),
+    db: Session = Depends(get_db),
+):
+    # Authorization 헤더의 access token과 body의 refresh token(선택)을 폐기
+    # 이미 만료/폐기됐거나 잘못된 토큰은 무시 (로그아웃은 항상 성공)
+    tokens = [cred.credentials if cred else None, req.refreshToken if req else None]
+    for token in tokens:
+        if not token:
+            continue
+        try:
+            payload = decode_token(token)
+        except Exception:
+            continue
+        if payload.get("jti"):
+            revocation_list.revoke(db, payload["jti"], _expires_at(payload))
     return {"ok": True}
@@ -1,78 +1,289 @@
-from fastapi import APIRouter, Depends
+import json
+
+from fastapi import APIRouter, Depends, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import select
 
-from app.db.session import get_db
+from app.core.config import settings
+from app.db.session import get_db, get_read_db
 from app.api.deps import get_current_user
+from app.api.etag import make_etag, check_etag
+from app.api import fastjson
 from app.core.errors import AppError
-from app.models.item import Item, ItemStatus
+from app.models.item import Item
 from app.models.bid import Bid
-from app.schemas.bid import BidCreateReq, BidRes
-from app.schemas.common import PageRes
+from app.schemas.bid import BidCreateReq, BidRes, BidBatchReq, BidBatchRes, BidBatchResultRes, BidBatchErrorRes
+from app.schemas.common import PageRes, CursorPageRes
+from app.db.pagination import keyset, cut_page
+from app.services.auction_engine import auction_engine
+from app.services.bid_hub import bid_hub
+from app.services.bid_writer import bid_writer
+from app.services.bidding import BidCommand, apply_bids
+from app.services.leaderboard import leaderboard
 
 router = APIRouter(prefix="")
 
+# 입찰 목록은 BidRes에 필요한 컬럼만 SELECT (엔티티/관계 로딩 없음)
+_BID_COLUMNS = (Bid.id, Bid.item_id, Bid.bidder_id, Bid.amount, Bid.created_at)
+
+def _bid_json(b) -> dict:
+    # _BID_COLUMNS 행 -> BidRes와 같은 필드의 dict (목록 fast path, app/api/fastjson.py)
+    return {"id": b.id, "itemId": b.item_id, "bidderId": b.bidder_id, "amount": b.amount, "createdAt": b.created_at}
+
+def _record_engine_counts(item_ids):
+    # 엔진이 처리한 입찰: 엔진 상태의 bid_count(아직 DB flush 전 포함)로 리더보드 갱신
+    for item_id in item_ids:
+        st = auction_engine.get(item_id)
+        if st:
+            leaderboard.record(item_id, st.bid_count)
+
 @router.post("/items/{item_id}/bids", response_model=BidRes)
 def place_bid(item_id: int, payload: BidCreateReq, db: Session = Depends(get_db), me=Depends(get_current_user)):
-    item = db.get(Item, item_id)
-    if not item:
-        raise AppError(404, "RESOURCE_NOT_FOUND", "아이템을 찾을 수 없습니다.")
+    # 엔진이 켜져 있고 OPEN 경매를 들고 있으면 DB 왕복 없이 메모리에서 처리
+    if auction_engine.running:
+        accepted = auction_engine.place(item_id, me.id, payload.amount)
+        if accepted:
+            result = BidRes(
+                id=accepted.id, itemId=accepted.item_id, bidderId=accepted.bidder_id,
+                amount=accepted.amount, createdAt=accepted.created_at,
+            )
+            bid_hub.publish_bid(result)
+            _record_engine_counts([item_id])
+            return result
 
-    if item.status != ItemStatus.OPEN:
-        raise AppError(409, "STATE_CONFLICT", "경매 진행 중인 아이템만 입찰할 수 있습니다.")
+    # group commit이 켜져 있으면 다른 입찰들과 한 트랜잭션으로 묶어서 처리
+    if bid_writer.running:
+        result = bid_writer.submit(item_id, me.id, payload.amount)
+        bid_hub.publish_bid(result)
+        return result
 
-    if item.seller_id == me.id:
-        raise AppError(403, "FORBIDDEN", "판매자는 자기 아이템에 입찰할 수 없습니다.")
+    counts: dict[int, int] = {}
+    result = apply_bids(db, [BidCommand(item_id, me.id, payload.amount)], counts)[0]
+    if isinstance(result, AppError):
+        db.rollback()
+        raise result
+    db.commit()
+    leaderboard.record_many(counts)
+    bid_hub.publish_bid(result)
+    return result
 
-    # 현재 최고가 조회
-    highest = db.scalar(select(func.max(Bid.amount)).where(Bid.item_id == item_id))
-    current = highest if highest is not None else item.start_price
+@router.post("/bids:batch", response_model=BidBatchRes)
+def place_bids_batch(payload: BidBatchReq, db: Session = Depends(get_db), me=Depends(get_current_user)):
+    # 여러 아이템에 대한 입찰을 한 요청/한 트랜잭션으로 처리 (규칙은 place_bid와 동일)
+    cmds = [BidCommand(b.itemId, me.id, b.amount) for b in payload.bids]
+    results: list = [None] * len(cmds)
 
-    # 최소 입찰가 = 현재가 + bid_unit
-    min_bid = current + item.bid_unit
-    if payload.amount < min_bid:
-        raise AppError(422, "UNPROCESSABLE_ENTITY", "입찰 금액이 너무 낮습니다.", {"minBid": min_bid})
+    # 인메모리 엔진이 들고 있는 아이템은 엔진에서 처리 (엔진은 롤백이 없어서 PARTIAL만 가능)
+    db_idx = list(range(len(cmds)))
+    if auction_engine.running:
+        held = [i for i, c in enumerate(cmds) if auction_engine.get(c.item_id)]
+        if held and payload.mode == "ALL_OR_NOTHING":
+            raise AppError(409, "STATE_CONFLICT", "인메모리 경매 엔진 사용 중에는 PARTIAL 모드만 지원합니다.")
+        for i in held:
+            c = cmds[i]
+            try:
+                accepted = auction_engine.place(c.item_id, c.bidder_id, c.amount)
+            except AppError as e:
+                results[i] = e
+                continue
+            if accepted:
+                results[i] = BidRes(
+                    id=accepted.id, itemId=accepted.item_id, bidderId=accepted.bidder_id,
+                    amount=accepted.amount, createdAt=accepted.created_at,
+                )
+        db_idx = [i for i in db_idx if results[i] is None]
 
-    # bid_unit 배수 검증(선택이지만 과제용으로 좋음)
-    if (payload.amount - item.start_price) % item.bid_unit != 0:
-        raise AppError(422, "UNPROCESSABLE_ENTITY", "입찰 단위가 올바르지 않습니다.", {"bidUnit": item.bid_unit})
+    counts: dict[int, int] = {}
+    if db_idx:
+        for i, r in zip(db_idx, apply_bids(db, [cmds[i] for i in db_idx], counts)):
+            results[i] = r
 
-    bid = Bid(item_id=item_id, bidder_id=me.id, amount=payload.amount)
-    db.add(bid)
+    failed = [i for i, r in enumerate(results) if isinstance(r, AppError)]
+    if failed and payload.mode == "ALL_OR_NOTHING":
+        db.rollback()
+        raise AppError(
+            422, "UNPROCESSABLE_ENTITY", "유효하지 않은 입찰이 있어 전체 입찰이 취소되었습니다.",
+            {"errors": [
+                {"index": i, "itemId": cmds[i].item_id, "code": results[i].code, "message": results[i].message, **results[i].details}
+                for i in failed
+            ]},
+        )
     db.commit()
-    db.refresh(bid)
+    leaderboard.record_many(counts)
+
+    # 아이템별 마지막(=최고) 입찰만 실시간 구독자에게 전달
+    latest = {r.itemId: r for r in results if isinstance(r, BidRes)}
+    for r in latest.values():
+        bid_hub.publish_bid(r)
+    if auction_engine.running:
+        _record_engine_counts([item_id for item_id in latest if item_id not in counts])
 
-    return BidRes(id=bid.id, itemId=bid.item_id, bidderId=bid.bidder_id, amount=bid.amount, createdAt=bid.created_at)
+    content = []
+    for i, (c, r) in enumerate(zip(cmds, results)):
+        if isinstance(r, AppError):
+            content.append(BidBatchResultRes(
+                index=i, itemId=c.item_id, amount=c.amount, ok=False,
+                error=BidBatchErrorRes(code=r.code, message=r.message, details=r.details),
+            ))
+        else:
+            content.append(BidBatchResultRes(index=i, itemId=c.item_id, amount=c.amount, ok=True, bid=r))
+    return BidBatchRes(mode=payload.mode, accepted=len(cmds) - len(failed), rejected=len(failed), results=content)
 
-@router.get("/items/{item_id}/bids", response_model=PageRes[BidRes])
-def list_bids(item_id: int, db: Session = Depends(get_db), page: int = 0, size: int = 20, sort: str = "amount,DESC"):
+@router.get("/items/{item_id}/bids", response_model=PageRes[BidRes] | CursorPageRes[BidRes])
+def list_bids(
+    item_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),
+    page: int = 0,
+    size: int = 20,
+    sort: str = "amount,DESC",
+    cursor: str | None = None,
+    withTotal: bool = True,
+):
     if size > 100:
         raise AppError(400, "INVALID_QUERY_PARAM", "size는 최대 100입니다.", {"size": size})
 
-    item = db.get(Item, item_id)
-    if not item:
+    # 아이템 행 전체 대신 bid_count만 조회 (입찰은 추가만 되므로 bid_count가 같으면 같은 쿼리의 결과도 같음)
+    bid_count = db.scalar(select(Item.bid_count).where(Item.id == item_id))
+    if bid_count is None:
         raise AppError(404, "RESOURCE_NOT_FOUND", "아이템을 찾을 수 없습니다.")
 
-    q = select(Bid).where(Bid.item_id == item_id)
-    total = db.scalar(select(func.count()).select_from(q.subquery()))
-
-    if sort == "amount,DESC":
-        q = q.order_by(Bid.amount.desc())
-    elif sort == "createdAt,DESC":
-        q = q.order_by(Bid.created_at.desc())
-    else:
+    q = select(*_BID_COLUMNS).where(Bid.item_id == item_id)
+    sort_cols = {"amount,DESC": Bid.amount, "createdAt,DESC": Bid.created_at}
+    if sort not in sort_cols:
         raise AppError(400, "INVALID_QUERY_PARAM", "sort 값이 올바르지 않습니다.", {"sort": sort})
+    col = sort_cols[sort]
 
-    bids = db.scalars(q.offset(page * size).limit(size)).all()
-    content = [BidRes(id=b.id, itemId=b.item_id, bidderId=b.bidder_id, amount=b.amount, createdAt=b.created_at) for b in bids]
-    total_pages = (total + size - 1) // size if total else 0
+    etag = make_etag("bids", item_id, bid_count, page, size, sort, cursor, withTotal)
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    # 본문은 Response로 직접 반환 -> ETag도 직접 붙임
+    headers = {"ETag": etag}
 
-    return PageRes[BidRes](content=content, page=page, size=size, totalElements=total, totalPages=total_pages, sort=sort)
+    if cursor is not None:
+        bids = db.execute(keyset(q, col, Bid.id, True, sort, cursor, size)).all()
+        bids, next_cursor = cut_page(bids, size, sort, lambda b: (getattr(b, col.key), b.id))
+        body = fastjson.cursor_page([_bid_json(b) for b in bids], size, sort, next_cursor)
+        return fastjson.FastJSONResponse(body, headers=headers)
+
+    q = q.order_by(col.desc()).offset(page * size)
+
+    if not withTotal:
+        bids = db.execute(q.limit(size + 1)).all()
+        body = fastjson.page([_bid_json(b) for b in bids[:size]], page, size, sort, has_next=len(bids) > size)
+        return fastjson.FastJSONResponse(body, headers=headers)
+
+    # 총 개수 = items.bid_count (입찰 INSERT와 같은 트랜잭션에서 갱신되는 비정규화 컬럼이라 COUNT 없이 정확)
+    bids = db.execute(q.limit(size)).all()
+    body = fastjson.page([_bid_json(b) for b in bids], page, size, sort, total=bid_count)
+    return fastjson.FastJSONResponse(body, headers=headers)
 
 @router.get("/items/{item_id}/bids/highest")
-def highest_bid(item_id: int, db: Session = Depends(get_db)):
+def highest_bid(item_id: int, db: Session = Depends(get_read_db)):
+    st = auction_engine.get(item_id) if auction_engine.running else None
+    if st:
+        return {"itemId": item_id, "highestBid": st.current_price}
     item = db.get(Item, item_id)
     if not item:
         raise AppError(404, "RESOURCE_NOT_FOUND", "아이템을 찾을 수 없습니다.")
-    highest = db.scalar(select(func.max(Bid.amount)).where(Bid.item_id == item_id))
-    return {"itemId": item_id, "highestBid": highest if highest is not None else item.start_price}
+    return {"itemId": item_id, "highestBid": item.current_price}
+
+_TERMINAL_STATUSES = ("CLOSED", "CANCELLED")
+
+def _stream_snapshot(db: Session, item_id: int):
+    # 구독 시작 시 현재 상태 1회 전송 (연결 직후 폴링 없이 화면 구성)
+    try:
+        item = db.get(Item, item_id)
+        if not item:
+            return None
+        st = auction_engine.get(item_id) if auction_engine.running else None
+        return {
+            "type": "snapshot", "itemId": item_id, "status": item.status.value,
+            "highestBid": st.current_price if st else item.current_price,
+        }
+    finally:
+        # 스트림이 열려 있는 동안 커넥션을 잡고 있지 않도록 바로 반납
+        db.close()
+
+def _sse(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+@router.get("/items/{item_id}/bids/stream")
+async def stream_bids(item_id: int, request: Request, mode: str = "all", db: Session = Depends(get_read_db)):
+    # Server-Sent Events: 새 최고가(bid) / 상태 변경(status) push
+    # mode=latest 이면 느린 클라이언트에게 최신 가격만 전달
+    if mode not in ("all", "latest"):
+        raise AppError(400, "INVALID_QUERY_PARAM", "mode 값이 올바르지 않습니다.", {"mode": mode})
+
+    # 스냅샷과 구독 사이에 들어온 이벤트를 놓치지 않도록 먼저 구독
+    sub = bid_hub.subscribe(item_id, latest_only=(mode == "latest"))
+    if not sub:
+        raise AppError(503, "SERVICE_UNAVAILABLE", "실시간 구독자 수가 한도를 초과했습니다.")
+    snapshot = await run_in_threadpool(_stream_snapshot, db, item_id)
+    if not snapshot:
+        bid_hub.unsubscribe(sub)
+        raise AppError(404, "RESOURCE_NOT_FOUND", "아이템을 찾을 수 없습니다.")
+
+    async def events():
+        try:
+            yield _sse(snapshot)
+            if snapshot["status"] in _TERMINAL_STATUSES:
+                return
+            while True:
+                batch = await sub.get(settings.stream_heartbeat_sec)
+                if await request.is_disconnected():
+                    return
+                if not batch:
+                    yield ": ping\n\n"
+                    continue
+                for e in batch:
+                    yield _sse(e)
+                if any(e["type"] == "status" and e["status"] in _TERMINAL_STATUSES for e in batch):
+                    return
+        finally:
+            bid_hub.unsubscribe(sub)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.websocket("/items/{item_id}/bids/ws")
+async def stream_bids_ws(ws: WebSocket, item_id: int, mode: str = "all", db: Session = Depends(get_db)):
+    # SSE와 같은 이벤트를 WebSocket JSON 메시지로 전달
+    if mode not in ("all", "latest"):
+        await ws.close(code=1008)
+        return
+    sub = bid_hub.subscribe(item_id, latest_only=(mode == "latest"))
+    if not sub:
+        await ws.close(code=1013)
+        return
+    try:
+        snapshot = await run_in_threadpool(_stream_snapshot, db, item_id)
+        if not snapshot:
+            await ws.close(code=4404)
+            return
+        await ws.accept()
+        await ws.send_json(snapshot)
+        if snapshot["status"] in _TERMINAL_STATUSES:
+            await ws.close()
+            return
+        while True:
+            batch = await sub.get(settings.stream_heartbeat_sec)
+            if not batch:
+                await ws.send_json({"type": "ping"})
+                continue
+            for e in batch:
+                await ws.send_json(e)
+            if any(e["type"] == "status" and e["status"] in _TERMINAL_STATUSES for e in batch):
+                await ws.close()
+                return
+    except WebSocketDisconnect:
+        pass
+    finally:
+        bid_hub.unsubscribe(sub)
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.api.deps import require_admin
+from app.api.etag import make_etag, check_etag
 from app.core.errors import AppError
 from app.models.category import Category
 from app.schemas.category import CategoryCreateReq, CategoryUpdateReq, CategoryRes
+from app.services.response_cache import response_cache
 
 router = APIRouter(prefix="/categories")
 
@@ -19,12 +21,21 @@ def create_category(payload: CategoryCreateReq, db: Session = Depends(get_db), _
     db.add(c)
     db.commit()
     db.refresh(c)
+    response_cache.invalidate("categories")
     return CategoryRes(id=c.id, name=c.name)
 
-@router.get("", response_model=list[CategoryRes])
-def list_categories(db: Session = Depends(get_db)):
+def _load_categories(db: Session):
     cats = db.scalars(select(Category).order_by(Category.name.asc())).all()
-    return [CategoryRes(id=c.id, name=c.name) for c in cats]
+    # 테이블 버전: 행 추가/삭제/이름 변경이 모두 반영되도록 (id, name, updated_at) 전체로 ETag 생성
+    return {
+        "etag": make_etag("categories", *[(c.id, c.name, c.updated_at) for c in cats]),
+        "body": [CategoryRes(id=c.id, name=c.name) for c in cats],
+    }
+
+@router.get("", response_model=list[CategoryRes])
+def list_categories(request: Request, response: Response, db: Session = Depends(get_read_db)):
+    cached = response_cache.get_or_load(db, "categories", _load_categories, ttl=60, stale_ttl=600, tags=("categories",))
+    return check_etag(request, response, cached["etag"]) or cached["body"]
 
 @router.patch("/{category_id}", response_model=CategoryRes)
 def update_category(category_id: int, payload: CategoryUpdateReq, db: Session = Depends(get_db), _=Depends(require_admin)):
@@ -37,6 +48,7 @@ def update_category(category_id: int, payload: CategoryUpdateReq, db: Session =
     c.name = payload.name
     db.commit()
     db.refresh(c)
+    response_cache.invalidate("categories")
     return CategoryRes(id=c.id, name=c.name)
 
 @router.delete("/{category_id}")
@@ -46,4 +58,5 @@ def delete_category(category_id: int, db: Session = Depends(get_db), _=Depends(r
         raise AppError(404, "RESOURCE_NOT_FOUND", "카테고리를 찾을 수 없습니다.")
     db.delete(c)
     db.commit()
+    response_cache.invalidate("categories")
     return {"ok": True}
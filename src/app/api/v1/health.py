@@ -1,5 +1,12 @@
 from fastapi import APIRouter
 from app.core.config import settings
+from app.db.pool import pool_monitor
+from app.db.replicas import replica_router
+from app.services.expiry import expiry_scheduler
+from app.services.leaderboard import leaderboard
+from app.services.principal_cache import principal_cache
+from app.services.password_pool import password_pool
+from app.services.response_cache import response_cache
 
 router = APIRouter()
 
@@ -9,5 +16,17 @@ def health():
         "status": "ok",
         "version": settings.app_version,
         "buildTime": settings.build_time,
-        "name": settings.app_name
+        "name": settings.app_name,
+        # 경매 마감 스케줄러 상태 (lagSeconds: 마감 시각이 지났는데 아직 안 닫힌 가장 오래된 아이템의 지연)
+        "expiry": expiry_scheduler.stats(),
+        "principalCache": principal_cache.stats(),
+        # bcrypt 프로세스 풀 (queued: 프로세스를 기다리는 작업 수, rejected: 503 반환 수)
+        "passwordPool": password_pool.stats(),
+        # 조회 응답 캐시 (staleHits: 예전 값을 주고 백그라운드 갱신한 횟수)
+        "responseCache": response_cache.stats(),
+        "leaderboard": leaderboard.stats(),
+        # 읽기 레플리카 (lagMs: heartbeat 기준 지연, lagFallbacks: 정상 레플리카가 없어 primary로 읽은 요청 수)
+        "replicas": replica_router.stats(),
+        # 커넥션 풀 (checkedOut: 사용 중 연결, rejected: checkout 대기 초과로 503 반환 수)
+        "dbPool": pool_monitor.stats(),
     }
@@ -1,20 +1,31 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import select, func, desc, asc
 from datetime import datetime, timezone, timedelta
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.api.deps import get_current_user
+from app.api.etag import make_etag, check_etag
+from app.api import fastjson
 from app.core.errors import AppError
 from app.models.item import Item, ItemStatus
-from app.models.bid import Bid
 from app.schemas.item import ItemCreateReq, ItemUpdateReq, ItemRes
-from app.schemas.common import PageRes
+from app.schemas.common import PageRes, CursorPageRes
+from app.db.pagination import keyset, cut_page
+from app.services.auction_engine import auction_engine
+from app.services.bid_hub import bid_hub
+from app.services.expiry import expiry_scheduler
+from app.services.count_cache import count_cache
+from app.services.search import query_tokens, match, index_item, unindex_item
+from app.services.response_cache import response_cache
 
 router = APIRouter(prefix="/items")
 
-def _apply_sort(query, sort: str):
-    # sort="createdAt,DESC" 형태
+# 응답 캐시 대상: 검색어/가격 필터 없는 offset 목록의 앞쪽 페이지 (그 외 조합은 매번 DB)
+_CACHED_PAGES = 3
+
+def _sort_key(sort: str):
+    # sort="createdAt,DESC" 형태 -> (정렬 컬럼, DESC 여부)
     field, direction = (sort.split(",") + ["DESC"])[:2]
     direction = direction.upper()
 
@@ -27,8 +38,33 @@ def _apply_sort(query, sort: str):
     col = mapping.get(field)
     if not col:
         raise AppError(400, "INVALID_QUERY_PARAM", "sort 값이 올바르지 않습니다.", {"sort": sort})
+    return col, direction == "DESC"
+
+def _apply_sort(query, sort: str):
+    col, descending = _sort_key(sort)
+    return query.order_by(desc(col) if descending else asc(col))
 
-    return query.order_by(desc(col) if direction == "DESC" else asc(col))
+# 목록 조회는 ItemRes에 필요한 컬럼만 SELECT (엔티티/관계 로딩 없음 -> 목록 1건당 SQL 1개)
+# 정렬 키(_sort_key)도 모두 이 안에 있어야 커서 값을 행에서 읽을 수 있음
+_ITEM_COLUMNS = (
+    Item.id, Item.seller_id, Item.category_id, Item.title, Item.start_price, Item.bid_unit,
+    Item.status, Item.ends_at, Item.created_at,
+)
+
+def _item_res(i: Item) -> ItemRes:
+    return ItemRes(
+        id=i.id, sellerId=i.seller_id, categoryId=i.category_id, title=i.title,
+        startPrice=i.start_price, bidUnit=i.bid_unit, status=i.status.value,
+        endsAt=i.ends_at, createdAt=i.created_at
+    )
+
+def _item_json(r) -> dict:
+    # _ITEM_COLUMNS 행 -> ItemRes와 같은 필드의 dict (목록 fast path, app/api/fastjson.py)
+    return {
+        "id": r.id, "sellerId": r.seller_id, "categoryId": r.category_id, "title": r.title,
+        "startPrice": r.start_price, "bidUnit": r.bid_unit, "status": r.status.value,
+        "endsAt": r.ends_at, "createdAt": r.created_at,
+    }
 
 @router.post("", response_model=ItemRes)
 def create_item(payload: ItemCreateReq, db: Session = Depends(get_db), me=Depends(get_current_user)):
@@ -39,23 +75,30 @@ def create_item(payload: ItemCreateReq, db: Session = Depends(get_db), me=Depend
         description=payload.description,
         start_price=payload.startPrice,
         bid_unit=payload.bidUnit,
+        current_price=payload.startPrice,
         status=ItemStatus.DRAFT,
     )
     db.add(item)
+    db.flush()
+    index_item(db, item)
     db.commit()
     db.refresh(item)
+    count_cache.invalidate(("items", None), ("items", item.category_id))
+    response_cache.invalidate("items")
     return ItemRes(
         id=item.id, sellerId=item.seller_id, categoryId=item.category_id, title=item.title,
         startPrice=item.start_price, bidUnit=item.bid_unit, status=item.status.value,
         endsAt=item.ends_at, createdAt=item.created_at
     )
 
-@router.get("", response_model=PageRes[ItemRes])
+@router.get("", response_model=PageRes[ItemRes] | CursorPageRes[ItemRes])
 def list_items(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     page: int = 0,
     size: int = 20,
     sort: str = "createdAt,DESC",
+    cursor: str | None = None,
+    withTotal: bool = True,
     keyword: str | None = None,
     categoryId: int | None = None,
     status: str | None = None,
@@ -65,10 +108,33 @@ def list_items(
     if size > 100:
         raise AppError(400, "INVALID_QUERY_PARAM", "size는 최대 100입니다.", {"size": size})
 
-    q = select(Item)
+    def load(s: Session):
+        return _list_items(s, page, size, sort, cursor, withTotal, keyword, categoryId, status, minPrice, maxPrice)
+
+    # 본문은 dict -> JSON bytes로 바로 직렬화 (response_model은 문서용)
+    if cursor is None and page < _CACHED_PAGES and not keyword and minPrice is None and maxPrice is None:
+        key = response_cache.key(
+            "items", page=page, size=size, sort=sort, withTotal=withTotal, categoryId=categoryId, status=status
+        )
+        body = response_cache.get_or_load(
+            db, key, lambda s: fastjson.jsonable(load(s)), ttl=5, stale_ttl=30, tags=("items",)
+        )
+        return fastjson.FastJSONResponse(body)
+    return fastjson.FastJSONResponse(load(db))
+
+def _list_items(db: Session, page, size, sort, cursor, withTotal, keyword, categoryId, status, minPrice, maxPrice):
+    q = select(*_ITEM_COLUMNS)
 
+    # 검색어: 제목/설명 bigram 역색인 (점수는 sort=relevance로 정렬 가능)
+    hits = None
     if keyword:
-        q = q.where(Item.title.like(f"%{keyword}%"))
+        tokens = query_tokens(keyword)
+        if tokens:
+            hits = match(tokens)
+            q = q.join(hits, hits.c.item_id == Item.id)
+        else:
+            # 1글자 검색어는 bigram이 없으므로 제목 LIKE
+            q = q.where(Item.title.like(f"%{keyword}%"))
     if categoryId:
         q = q.where(Item.category_id == categoryId)
     if status:
@@ -81,37 +147,51 @@ def list_items(
     if maxPrice is not None:
         q = q.where(Item.start_price <= maxPrice)
 
-    count_q = select(func.count()).select_from(q.subquery())
-    total = db.scalar(count_q)
+    # cursor 파라미터가 있으면 (첫 페이지는 빈 값) 커서 모드: count 없이 keyset으로 size+1개만 읽음
+    if cursor is not None:
+        col, descending = _sort_key(sort)
+        items = db.execute(keyset(q, col, Item.id, descending, sort, cursor, size)).all()
+        items, next_cursor = cut_page(items, size, sort, lambda i: (getattr(i, col.key), i.id))
+        return fastjson.cursor_page([_item_json(i) for i in items], size, sort, next_cursor)
 
-    q = _apply_sort(q, sort).offset(page * size).limit(size)
-    items = db.scalars(q).all()
+    filtered = q
+    if sort.split(",")[0] == "relevance":
+        if hits is None:
+            raise AppError(400, "INVALID_QUERY_PARAM", "relevance 정렬은 2글자 이상 검색어가 필요합니다.", {"sort": sort})
+        q = q.order_by(hits.c.score.desc(), Item.id.desc()).offset(page * size)
+    else:
+        q = _apply_sort(q, sort).offset(page * size)
 
-    content = [
-        ItemRes(
-            id=i.id, sellerId=i.seller_id, categoryId=i.category_id, title=i.title,
-            startPrice=i.start_price, bidUnit=i.bid_unit, status=i.status.value,
-            endsAt=i.ends_at, createdAt=i.created_at
-        )
-        for i in items
-    ]
-    total_pages = (total + size - 1) // size if total else 0
+    # withTotal=false: COUNT 생략, size+1개 읽어서 다음 페이지 유무만 판단
+    if not withTotal:
+        items = db.execute(q.limit(size + 1)).all()
+        return fastjson.page([_item_json(i) for i in items[:size]], page, size, sort, has_next=len(items) > size)
 
-    return PageRes[ItemRes](
-        content=content, page=page, size=size,
-        totalElements=total, totalPages=total_pages, sort=sort
-    )
+    # 필터 없음 / 카테고리만: 캐시된 COUNT (그 외 조합은 매번 COUNT)
+    if not (keyword or status or minPrice is not None or maxPrice is not None):
+        count_q = select(func.count(Item.id))
+        if categoryId:
+            count_q = count_q.where(Item.category_id == categoryId)
+        total = count_cache.get(db, ("items", categoryId or None), count_q)
+    else:
+        total = db.scalar(select(func.count()).select_from(filtered.subquery()))
+
+    items = db.execute(q.limit(size)).all()
+    return fastjson.page([_item_json(i) for i in items], page, size, sort, total=total)
 
 @router.get("/{item_id}", response_model=ItemRes)
-def get_item(item_id: int, db: Session = Depends(get_db)):
-    item = db.get(Item, item_id)
-    if not item:
-        raise AppError(404, "RESOURCE_NOT_FOUND", "아이템을 찾을 수 없습니다.")
-    return ItemRes(
-        id=item.id, sellerId=item.seller_id, categoryId=item.category_id, title=item.title,
-        startPrice=item.start_price, bidUnit=item.bid_unit, status=item.status.value,
-        endsAt=item.ends_at, createdAt=item.created_at
-    )
+def get_item(item_id: int, request: Request, response: Response, db: Session = Depends(get_read_db)):
+    def load(s: Session):
+        item = s.get(Item, item_id)
+        if not item:
+            raise AppError(404, "RESOURCE_NOT_FOUND", "아이템을 찾을 수 없습니다.")
+        # updated_at은 초 단위일 수 있어서 같은 초 안의 수정도 구분되도록 바뀔 수 있는 ItemRes 컬럼을 같이 넣음
+        etag = make_etag("item", item.id, item.updated_at, item.status.value, item.category_id, item.title, item.bid_unit)
+        return {"etag": etag, "body": _item_res(item)}
+
+    # ETag는 본문과 같이 캐시되므로 캐시 적중 시 304는 DB 조회 없이 반환
+    cached = response_cache.get_or_load(db, f"item:{item_id}", load, ttl=30, stale_ttl=300, tags=(f"item:{item_id}",))
+    return check_etag(request, response, cached["etag"]) or cached["body"]
 
 @router.patch("/{item_id}", response_model=ItemRes)
 def update_item(item_id: int, payload: ItemUpdateReq, db: Session = Depends(get_db), me=Depends(get_current_user)):
@@ -124,6 +204,7 @@ def update_item(item_id: int, payload: ItemUpdateReq, db: Session = Depends(get_
         raise AppError(409, "STATE_CONFLICT", "경매가 시작된 아이템은 수정할 수 없습니다.")
 
     if payload.categoryId is not None:
+        count_cache.invalidate(("items", item.category_id), ("items", payload.categoryId))
         item.category_id = payload.categoryId
     if payload.title is not None:
         item.title = payload.title
@@ -131,9 +212,12 @@ def update_item(item_id: int, payload: ItemUpdateReq, db: Session = Depends(get_
         item.description = payload.description
     if payload.bidUnit is not None:
         item.bid_unit = payload.bidUnit
+    if payload.title is not None or payload.description is not None:
+        index_item(db, item)
 
     db.commit()
     db.refresh(item)
+    response_cache.invalidate("items", f"item:{item_id}")
     return ItemRes(
         id=item.id, sellerId=item.seller_id, categoryId=item.category_id, title=item.title,
         startPrice=item.start_price, bidUnit=item.bid_unit, status=item.status.value,
@@ -149,8 +233,11 @@ def delete_item(item_id: int, db: Session = Depends(get_db), me=Depends(get_curr
         raise AppError(403, "FORBIDDEN", "본인 아이템만 삭제할 수 있습니다.")
     if item.status != ItemStatus.DRAFT:
         raise AppError(409, "STATE_CONFLICT", "경매가 시작된 아이템은 삭제할 수 없습니다.")
+    unindex_item(db, item_id)
     db.delete(item)
     db.commit()
+    count_cache.invalidate(("items", None), ("items", item.category_id))
+    response_cache.invalidate("items", f"item:{item_id}")
     return {"ok": True}
 
 @router.post("/{item_id}/publish")
@@ -168,6 +255,12 @@ def publish_item(item_id: int, db: Session = Depends(get_db), me=Depends(get_cur
     item.starts_at = now
     item.ends_at = now + timedelta(days=3)  # 예: 3일 경매
     db.commit()
+    response_cache.invalidate("items", f"item:{item_id}")
+    if auction_engine.running:
+        auction_engine.open(item)
+    bid_hub.publish_status(item_id, item.status.value)
+    if expiry_scheduler.running:
+        expiry_scheduler.schedule(item.id, item.ends_at)
     return {"ok": True, "status": item.status.value, "endsAt": item.ends_at}
 
 @router.post("/{item_id}/close")
@@ -180,21 +273,23 @@ def close_item(item_id: int, db: Session = Depends(get_db), me=Depends(get_curre
     if item.status != ItemStatus.OPEN:
         raise AppError(409, "STATE_CONFLICT", "OPEN 상태만 마감할 수 있습니다.")
 
+    # 엔진에서 먼저 내려서 입찰을 막고, 밀린 입찰을 DB에 반영
+    if auction_engine.running:
+        auction_engine.close_or_raise(item_id)
     item.status = ItemStatus.CLOSED
     db.commit()
+    response_cache.invalidate("items", f"item:{item_id}")
+    bid_hub.publish_status(item_id, item.status.value)
     return {"ok": True, "status": item.status.value}
 
 @router.get("/{item_id}/winner")
-def winner(item_id: int, db: Session = Depends(get_db)):
+def winner(item_id: int, db: Session = Depends(get_read_db)):
     item = db.get(Item, item_id)
     if not item:
         raise AppError(404, "RESOURCE_NOT_FOUND", "아이템을 찾을 수 없습니다.")
     if item.status != ItemStatus.CLOSED:
         raise AppError(409, "STATE_CONFLICT", "CLOSED 상태에서만 낙찰자를 조회할 수 있습니다.")
 
-    top = db.scalar(
-        select(Bid).where(Bid.item_id == item_id).order_by(Bid.amount.desc()).limit(1)
-    )
-    if not top:
-        return {"itemId": item_id, "winnerUserId": None, "price": item.start_price}
-    return {"itemId": item_id, "winnerUserId": top.bidder_id, "price": top.amount}
+    # 낙찰자/낙찰가 = 비정규화 컬럼 (입찰이 없으면 top_bidder_id is None)
+    # 인메모리 엔진도 마감 시점에 밀린 입찰을 모두 반영하므로 CLOSED 아이템의 컬럼이 최종값
+    return {"itemId": item_id, "winnerUserId": item.top_bidder_id, "price": item.current_price}
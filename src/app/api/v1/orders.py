@@ -2,19 +2,38 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import select, func
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.api.deps import get_current_user
 from app.core.errors import AppError
+from app.api import fastjson
 from app.models.item import Item, ItemStatus
-from app.models.bid import Bid
 from app.models.order import Order, OrderStatus
 from app.schemas.order import OrderCreateReq, OrderRes
-from app.schemas.common import PageRes
+from app.schemas.common import PageRes, CursorPageRes
+from app.db.pagination import keyset, cut_page
+from app.services.sales_rollup import record_status_change
 
 router = APIRouter(prefix="")
 
-def _winner_bid(db: Session, item_id: int):
-    return db.scalar(select(Bid).where(Bid.item_id == item_id).order_by(Bid.amount.desc()).limit(1))
+# 주문 목록은 OrderRes에 필요한 컬럼만 SELECT (엔티티/관계 로딩 없음)
+_ORDER_COLUMNS = (
+    Order.id, Order.item_id, Order.buyer_id, Order.status, Order.total_price, Order.address, Order.created_at,
+)
+
+def _order_res(o: Order) -> OrderRes:
+    return OrderRes(
+        id=o.id, itemId=o.item_id, buyerId=o.buyer_id,
+        status=o.status.value, totalPrice=o.total_price,
+        address=o.address, createdAt=o.created_at
+    )
+
+def _order_json(o) -> dict:
+    # _ORDER_COLUMNS 행 -> OrderRes와 같은 필드의 dict (목록 fast path, app/api/fastjson.py)
+    return {
+        "id": o.id, "itemId": o.item_id, "buyerId": o.buyer_id,
+        "status": o.status.value, "totalPrice": o.total_price,
+        "address": o.address, "createdAt": o.created_at,
+    }
 
 @router.post("/items/{item_id}/orders", response_model=OrderRes)
 def create_order(item_id: int, payload: OrderCreateReq, db: Session = Depends(get_db), me=Depends(get_current_user)):
@@ -24,21 +43,21 @@ def create_order(item_id: int, payload: OrderCreateReq, db: Session = Depends(ge
     if item.status != ItemStatus.CLOSED:
         raise AppError(409, "STATE_CONFLICT", "마감된 아이템만 주문을 생성할 수 있습니다.")
 
-    top = _winner_bid(db, item_id)
-    if not top:
+    # 낙찰자 = items.top_bidder_id (입찰 시 함께 갱신되는 비정규화 컬럼)
+    if item.top_bidder_id is None:
         raise AppError(422, "UNPROCESSABLE_ENTITY", "입찰이 없어 낙찰자가 없습니다.")
-    if top.bidder_id != me.id:
+    if item.top_bidder_id != me.id:
         raise AppError(403, "FORBIDDEN", "낙찰자만 주문을 생성할 수 있습니다.")
 
     # 중복 주문 방지 (uq_orders_item_id)
-    exists = db.scalar(select(Order).where(Order.item_id == item_id))
+    exists = db.scalar(select(Order.id).where(Order.item_id == item_id))
     if exists:
         raise AppError(409, "STATE_CONFLICT", "이미 주문이 생성된 아이템입니다.")
 
     order = Order(
         item_id=item_id,
         buyer_id=me.id,
-        total_price=top.amount,
+        total_price=item.current_price,
         address=payload.address,
         status=OrderStatus.PENDING,
     )
@@ -46,62 +65,56 @@ def create_order(item_id: int, payload: OrderCreateReq, db: Session = Depends(ge
     db.commit()
     db.refresh(order)
 
-    return OrderRes(
-        id=order.id, itemId=order.item_id, buyerId=order.buyer_id,
-        status=order.status.value, totalPrice=order.total_price,
-        address=order.address, createdAt=order.created_at
-    )
+    return _order_res(order)
 
-@router.get("/orders", response_model=PageRes[OrderRes])
+@router.get("/orders", response_model=PageRes[OrderRes] | CursorPageRes[OrderRes])
 def list_my_orders(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     me=Depends(get_current_user),
     page: int = 0,
     size: int = 20,
     sort: str = "createdAt,DESC",
     status: str | None = None,
+    cursor: str | None = None,
+    withTotal: bool = True,
 ):
     if size > 100:
         raise AppError(400, "INVALID_QUERY_PARAM", "size는 최대 100입니다.", {"size": size})
 
-    q = select(Order).where(Order.buyer_id == me.id)
+    q = select(*_ORDER_COLUMNS).where(Order.buyer_id == me.id)
     if status:
         try:
             q = q.where(Order.status == OrderStatus(status))
         except Exception:
             raise AppError(400, "INVALID_QUERY_PARAM", "status 값이 올바르지 않습니다.", {"status": status})
 
-    total = db.scalar(select(func.count()).select_from(q.subquery()))
-
-    if sort == "createdAt,DESC":
-        q = q.order_by(Order.created_at.desc())
-    elif sort == "createdAt,ASC":
-        q = q.order_by(Order.created_at.asc())
-    else:
+    if sort not in ("createdAt,DESC", "createdAt,ASC"):
         raise AppError(400, "INVALID_QUERY_PARAM", "sort 값이 올바르지 않습니다.", {"sort": sort})
+    descending = sort == "createdAt,DESC"
 
-    rows = db.scalars(q.offset(page * size).limit(size)).all()
-    content = [
-        OrderRes(
-            id=o.id, itemId=o.item_id, buyerId=o.buyer_id,
-            status=o.status.value, totalPrice=o.total_price,
-            address=o.address, createdAt=o.created_at
-        )
-        for o in rows
-    ]
-    total_pages = (total + size - 1) // size if total else 0
-    return PageRes[OrderRes](content=content, page=page, size=size, totalElements=total, totalPages=total_pages, sort=sort)
+    if cursor is not None:
+        rows = db.execute(keyset(q, Order.created_at, Order.id, descending, sort, cursor, size)).all()
+        rows, next_cursor = cut_page(rows, size, sort, lambda o: (o.created_at, o.id))
+        return fastjson.FastJSONResponse(fastjson.cursor_page([_order_json(o) for o in rows], size, sort, next_cursor))
+
+    ordered = q.order_by(Order.created_at.desc() if descending else Order.created_at.asc()).offset(page * size)
+
+    if not withTotal:
+        rows = db.execute(ordered.limit(size + 1)).all()
+        body = fastjson.page([_order_json(o) for o in rows[:size]], page, size, sort, has_next=len(rows) > size)
+        return fastjson.FastJSONResponse(body)
+
+    total = db.scalar(select(func.count()).select_from(q.subquery()))
+
+    rows = db.execute(ordered.limit(size)).all()
+    return fastjson.FastJSONResponse(fastjson.page([_order_json(o) for o in rows], page, size, sort, total=total))
 
 @router.get("/orders/{order_id}", response_model=OrderRes)
-def get_order(order_id: int, db: Session = Depends(get_db), me=Depends(get_current_user)):
+def get_order(order_id: int, db: Session = Depends(get_read_db), me=Depends(get_current_user)):
     o = db.get(Order, order_id)
     if not o or o.buyer_id != me.id:
         raise AppError(404, "RESOURCE_NOT_FOUND", "주문을 찾을 수 없습니다.")
-    return OrderRes(
-        id=o.id, itemId=o.item_id, buyerId=o.buyer_id,
-        status=o.status.value, totalPrice=o.total_price,
-        address=o.address, createdAt=o.created_at
-    )
+    return _order_res(o)
 
 @router.post("/orders/{order_id}/cancel")
 def cancel_order(order_id: int, db: Session = Depends(get_db), me=Depends(get_current_user)):
@@ -110,6 +123,9 @@ def cancel_order(order_id: int, db: Session = Depends(get_db), me=Depends(get_cu
         raise AppError(404, "RESOURCE_NOT_FOUND", "주문을 찾을 수 없습니다.")
     if o.status not in (OrderStatus.PENDING, OrderStatus.PAID):
         raise AppError(409, "STATE_CONFLICT", "취소할 수 없는 상태입니다.", {"status": o.status.value})
+    old = o.status
     o.status = OrderStatus.CANCELLED
+    # PAID였으면 일별 매출 롤업에서 차감 (같은 트랜잭션)
+    record_status_change(db, o, old, o.status)
     db.commit()
     return {"ok": True, "status": o.status.value}
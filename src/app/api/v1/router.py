@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from app.core.config import settings
 from .health import router as health
 from .auth import router as auth
 from .items import router as items
@@ -11,6 +12,11 @@ from .stats import router as stats
 from .users import router as users
 
 router = APIRouter(prefix="/api/v1")
+# async 라우트는 같은 경로의 동기 라우트보다 먼저 매칭되도록 가장 앞에 등록
+if settings.async_db_enabled:
+    from .aio import router as aio
+
+    router.include_router(aio)
 router.include_router(users, tags=["users"])
 router.include_router(health, tags=["health"])
 router.include_router(auth, tags=["auth"])
@@ -1,47 +1,36 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, desc, cast, Date
+from sqlalchemy import select
 from datetime import datetime, timezone, timedelta
 
-from app.db.session import get_db
+from app.core.config import settings
+from app.db.session import get_read_db
 from app.api.deps import require_admin
-from app.models.bid import Bid
-from app.models.order import Order, OrderStatus
+from app.models.daily_sales import DailySales
+from app.services.leaderboard import leaderboard
 
 router = APIRouter(prefix="/stats")
 
 @router.get("/items/top-bid-count")
-def top_bid_count(db: Session = Depends(get_db), limit: int = 10):
-    limit = min(max(limit, 1), 50)
-    rows = db.execute(
-        select(Bid.item_id, func.count(Bid.id).label("bidCount"))
-        .group_by(Bid.item_id)
-        .order_by(desc("bidCount"))
-        .limit(limit)
-    ).all()
-    return {"content": [{"itemId": r[0], "bidCount": r[1]} for r in rows]}
+def top_bid_count(limit: int = 10):
+    # 메모리에 들고 있는 개수(LEADERBOARD_SIZE)까지
+    limit = min(max(limit, 1), settings.leaderboard_size)
+    # 메모리 top-K에서 바로 응답 (bids GROUP BY 없음)
+    return {"content": [{"itemId": item_id, "bidCount": n} for item_id, n in leaderboard.top(limit)]}
 
 @router.get("/sales/daily")
-def daily_sales(db: Session = Depends(get_db), _=Depends(require_admin), days: int = 7):
-    days = min(max(days, 1), 30)
+def daily_sales(db: Session = Depends(get_read_db), _=Depends(require_admin), days: int = 7):
+    days = min(max(days, 1), 365)
     since = datetime.now(timezone.utc) - timedelta(days=days)
 
-    # CANCELLED 제외, PENDING도 매출로 볼지 애매하니 PAID/SHIPPED/COMPLETED만 집계 추천
-    valid = (OrderStatus.PAID, OrderStatus.SHIPPED, OrderStatus.COMPLETED)
-
+    # 일별 롤업(daily_sales)에서 PK 범위로 읽음 (PAID/SHIPPED/COMPLETED만 집계, CANCELLED 제외)
     rows = db.execute(
-        select(
-            cast(Order.created_at, Date).label("day"),
-            func.sum(Order.total_price).label("sales"),
-            func.count(Order.id).label("orders"),
-        )
-        .where(Order.created_at >= since)
-        .where(Order.status.in_(valid))
-        .group_by("day")
-        .order_by(desc("day"))
+        select(DailySales.day, DailySales.sales, DailySales.orders)
+        .where(DailySales.day >= since.date(), DailySales.orders > 0)
+        .order_by(DailySales.day.desc())
     ).all()
 
     return {
         "since": since.isoformat().replace("+00:00", "Z"),
-        "content": [{"day": str(r[0]), "sales": int(r[1] or 0), "orders": int(r[2])} for r in rows]
+        "content": [{"day": str(r[0]), "sales": int(r[1]), "orders": int(r[2])} for r in rows]
     }
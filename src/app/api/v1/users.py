@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, update, func
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.api.deps import get_current_user
+from app.api import fastjson
 from app.core.errors import AppError
-from app.core.security import verify_password, hash_password
 
 from app.models.user import User
 from app.models.bid import Bid
@@ -13,12 +13,15 @@ from app.models.item import Item
 
 from app.schemas.user import UserMeRes, UserUpdateReq, PasswordChangeReq
 from app.schemas.user_bid import MyBidRes
-from app.schemas.common import PageRes
+from app.schemas.common import PageRes, CursorPageRes
+from app.db.pagination import keyset, cut_page
+from app.services.principal_cache import Principal, principal_cache
+from app.services.password_pool import password_pool
 
 router = APIRouter(prefix="/users")
 
 @router.get("/me", response_model=UserMeRes)
-def me(user: User = Depends(get_current_user)):
+def me(user: Principal = Depends(get_current_user)):
     return UserMeRes(
         id=user.id,
         email=user.email,
@@ -28,10 +31,12 @@ def me(user: User = Depends(get_current_user)):
     )
 
 @router.patch("/me", response_model=UserMeRes)
-def update_me(payload: UserUpdateReq, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def update_me(payload: UserUpdateReq, db: Session = Depends(get_db), me: Principal = Depends(get_current_user)):
+    user = db.get(User, me.id)
     user.nickname = payload.nickname
     db.commit()
     db.refresh(user)
+    principal_cache.invalidate_or_raise(user.id)
     return UserMeRes(
         id=user.id,
         email=user.email,
@@ -41,22 +46,31 @@ def update_me(payload: UserUpdateReq, db: Session = Depends(get_db), user: User
     )
 
 @router.patch("/me/password")
-def change_password(payload: PasswordChangeReq, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    if not verify_password(payload.currentPassword, user.password_hash):
+def change_password(payload: PasswordChangeReq, db: Session = Depends(get_db), me: Principal = Depends(get_current_user)):
+    current_hash = db.scalar(select(User.password_hash).where(User.id == me.id))
+    # bcrypt 동안 DB 커넥션을 잡고 있지 않도록 읽기 트랜잭션 종료 (커넥션 풀 반환)
+    db.rollback()
+    if not password_pool.verify(payload.currentPassword, current_hash):
         raise AppError(401, "UNAUTHORIZED", "현재 비밀번호가 올바르지 않습니다.")
     if payload.currentPassword == payload.newPassword:
         raise AppError(422, "UNPROCESSABLE_ENTITY", "새 비밀번호는 기존과 달라야 합니다.")
-    user.password_hash = hash_password(payload.newPassword)
+    new_hash = password_pool.hash(payload.newPassword)
+    db.execute(update(User).where(User.id == me.id).values(password_hash=new_hash))
     db.commit()
+    # principal에는 비밀번호 정보가 없으므로 반영 확인 실패는 응답에 영향 없음
+    # (503을 주면 이미 바뀐 비밀번호로 다시 시도해야 해서 혼란만 생김)
+    principal_cache.invalidate(me.id)
     return {"ok": True}
 
-@router.get("/me/bids", response_model=PageRes[MyBidRes])
+@router.get("/me/bids", response_model=PageRes[MyBidRes] | CursorPageRes[MyBidRes])
 def my_bids(
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+    user: Principal = Depends(get_current_user),
     page: int = 0,
     size: int = 20,
     sort: str = "createdAt,DESC",
+    cursor: str | None = None,
+    withTotal: bool = True,
 ):
     if size > 100:
         raise AppError(400, "INVALID_QUERY_PARAM", "size는 최대 100입니다.", {"size": size})
@@ -74,45 +88,50 @@ def my_bids(
         .where(Bid.bidder_id == user.id)
     )
 
-    # 총 개수
-    total = db.execute(select(q.subquery().count())).scalar()
-
-    # 정렬
-    if sort == "createdAt,DESC":
-        q = q.order_by(Bid.created_at.desc())
-    elif sort == "createdAt,ASC":
-        q = q.order_by(Bid.created_at.asc())
-    elif sort == "amount,DESC":
-        q = q.order_by(Bid.amount.desc())
-    else:
+    # 정렬 (컬럼, DESC 여부)
+    sort_keys = {
+        "createdAt,DESC": (Bid.created_at, True),
+        "createdAt,ASC": (Bid.created_at, False),
+        "amount,DESC": (Bid.amount, True),
+    }
+    if sort not in sort_keys:
         raise AppError(400, "INVALID_QUERY_PARAM", "sort 값이 올바르지 않습니다.", {"sort": sort})
+    col, descending = sort_keys[sort]
 
-    rows = db.execute(q.offset(page * size).limit(size)).all()
+    # 행 -> MyBidRes와 같은 필드의 dict (목록 fast path, app/api/fastjson.py)
+    def to_res(r):
+        return {
+            "bidId": r.bid_id,
+            "itemId": r.item_id,
+            "amount": r.amount,
+            "createdAt": r.created_at,
+            "itemTitle": r.item_title,
+            "itemStatus": r.item_status.value if hasattr(r.item_status, "value") else str(r.item_status),
+        }
 
-    content = [
-        MyBidRes(
-            bidId=r.bid_id,
-            itemId=r.item_id,
-            amount=r.amount,
-            createdAt=r.created_at,
-            itemTitle=r.item_title,
-            itemStatus=r.item_status.value if hasattr(r.item_status, "value") else str(r.item_status),
-        )
-        for r in rows
-    ]
-
-    total_pages = (total + size - 1) // size if total else 0
-    return PageRes[MyBidRes](
-        content=content,
-        page=page,
-        size=size,
-        totalElements=total or 0,
-        totalPages=total_pages,
-        sort=sort,
-    )
+    # 커서 모드: 총 개수 없이 (정렬 키, bid id) keyset
+    if cursor is not None:
+        rows = db.execute(keyset(q, col, Bid.id, descending, sort, cursor, size)).all()
+        rows, next_cursor = cut_page(rows, size, sort, lambda r: (getattr(r, col.key), r.bid_id))
+        return fastjson.FastJSONResponse(fastjson.cursor_page([to_res(r) for r in rows], size, sort, next_cursor))
+
+    ordered = q.order_by(col.desc() if descending else col.asc()).offset(page * size)
+
+    # withTotal=false: 총 개수 없이 size+1개로 다음 페이지 유무만
+    if not withTotal:
+        rows = db.execute(ordered.limit(size + 1)).all()
+        body = fastjson.page([to_res(r) for r in rows[:size]], page, size, sort, has_next=len(rows) > size)
+        return fastjson.FastJSONResponse(body)
+
+    # 총 개수
+    total = db.scalar(select(func.count()).select_from(q.subquery())) or 0
+
+    rows = db.execute(ordered.limit(size)).all()
+
+    return fastjson.FastJSONResponse(fastjson.page([to_res(r) for r in rows], page, size, sort, total=total))
 
 @router.get("/{user_id}", response_model=UserMeRes)
-def get_user(user_id: int, db: Session = Depends(get_db), _=Depends(get_current_user)):
+def get_user(user_id: int, db: Session = Depends(get_read_db), _=Depends(get_current_user)):
     u = db.get(User, user_id)
     if not u:
         raise AppError(404, "USER_NOT_FOUND", "사용자를 찾을 수 없습니다.")
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.api.deps import get_current_user
 from app.core.errors import AppError
 from app.models.item import Item
@@ -34,6 +34,6 @@ def unwatch_item(item_id: int, db: Session = Depends(get_db), me=Depends(get_cur
     return {"ok": True}
 
 @router.get("/users/me/watches", response_model=list[WatchItemRes])
-def my_watches(db: Session = Depends(get_db), me=Depends(get_current_user)):
+def my_watches(db: Session = Depends(get_read_db), me=Depends(get_current_user)):
     rows = db.scalars(select(Watch).where(Watch.user_id == me.id).order_by(Watch.created_at.desc())).all()
     return [WatchItemRes(itemId=r.item_id, watchedAt=r.created_at) for r in rows]
@@ -0,0 +1,31 @@
+import argparse
+from datetime import date, datetime, timedelta, timezone
+
+from app.db.session import SessionLocal
+from app.services.sales_rollup import backfill
+
+# 일별 매출 롤업(daily_sales)을 orders에서 다시 계산 (범위 [--from, --to), 청크마다 commit)
+# 사용: PYTHONPATH=src python -m app.backfill_sales --from 2025-01-01 --to 2026-01-01 --chunk-days 7
+#       (기본: 최근 365일)
+
+def main():
+    today = datetime.now(timezone.utc).date()
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--from", dest="start", type=date.fromisoformat, default=today - timedelta(days=365))
+    ap.add_argument("--to", dest="end", type=date.fromisoformat, default=today + timedelta(days=1))
+    ap.add_argument("--chunk-days", type=int, default=7)
+    args = ap.parse_args()
+
+    db = SessionLocal()
+    try:
+        n = backfill(
+            db, args.start, args.end, chunk_days=args.chunk_days,
+            progress=lambda lo, hi, rows: print(f"{lo} ~ {hi}: {rows} days"),
+        )
+        print("Backfill done.")
+        print("days:", n)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import defaultdict
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 워커 간 캐시 무효화 메시지 버스.
+# - BUS_URL이 비어 있으면 LocalBus: 같은 프로세스 안에서만 전달 (워커 1개 / 테스트)
+# - redis://... 이면 RedisBus: Redis pub/sub으로 모든 워커에 전달 (redis 패키지 필요)
+# 핸들러는 handler(message: dict | None) 형태.
+# message=None은 "그 사이 메시지를 놓쳤을 수 있음"(Redis 재연결 등) -> 받는 쪽은 캐시를 통째로 비워야 함
+# publish는 로컬 핸들러를 먼저 동기 호출한 뒤 다른 워커로 보냄 (이 워커에는 응답 전에 반영됨)
+# publish(..., wait=True)는 구독 중인 모든 워커가 핸들러 처리를 끝냈다고 ack할 때까지 기다림 (권한 회수 등)
+
+
+class LocalBus:
+    def __init__(self):
+        self._handlers = defaultdict(list)
+
+    def subscribe(self, channel: str, handler):
+        self._handlers[channel].append(handler)
+
+    def publish(self, channel: str, message: dict, wait: bool = False) -> bool:
+        self._dispatch(channel, message)
+        return True
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def _dispatch(self, channel: str, message: dict | None):
+        for handler in list(self._handlers.get(channel, ())):
+            try:
+                handler(message)
+            except Exception:
+                logger.exception("bus handler failed: %s", channel)
+
+    def _reset_all(self):
+        for channel in list(self._handlers):
+            self._dispatch(channel, None)
+
+
+class RedisBus(LocalBus):
+    def __init__(self, url: str):
+        super().__init__()
+        import redis  # 선택 의존성 (BUS_URL=redis://... 일 때만 필요)
+
+        self._redis = redis.Redis.from_url(url)
+        self._prefix = f"{settings.app_name}:bus:"
+        self._ack_timeout = 2.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def publish(self, channel: str, message: dict, wait: bool = False) -> bool:
+        # 반환값: 모든 워커 반영 확인 여부 (wait=False면 전송 성공 여부)
+        self._dispatch(channel, message)
+        ack_key = f"{self._prefix}ack:{uuid.uuid4().hex}" if wait else None
+        try:
+            receivers = self._redis.publish(self._prefix + channel, json.dumps({"m": message, "ack": ack_key}))
+            if not ack_key:
+                return True
+            # 구독자 수(자기 자신 포함)만큼 ack를 기다림
+            deadline = time.monotonic() + self._ack_timeout
+            for _ in range(receivers):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._redis.blpop([ack_key], timeout=max(remaining, 0.01)):
+                    logger.warning("bus ack timeout: %s", channel)
+                    return False
+            return True
+        except Exception:
+            # 다른 워커엔 전달 실패 -> 각 캐시의 TTL 안에 반영됨
+            logger.exception("bus publish failed: %s", channel)
+            return False
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="bus-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def _run(self):
+        while not self._stop.is_set():
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.psubscribe(self._prefix + "*")
+                # 구독 전/끊긴 동안 놓친 메시지가 있을 수 있으므로 매 연결마다 리셋
+                self._reset_all()
+                while not self._stop.is_set():
+                    msg = pubsub.get_message(timeout=1.0)
+                    if not msg:
+                        continue
+                    channel = msg["channel"].decode()[len(self._prefix):]
+                    data = json.loads(msg["data"])
+                    self._dispatch(channel, data["m"])
+                    if data.get("ack"):
+                        self._redis.rpush(data["ack"], 1)
+                        self._redis.expire(data["ack"], 10)
+            except Exception:
+                logger.exception("bus connection lost")
+                self._reset_all()
+                self._stop.wait(1.0)
+            finally:
+                pubsub.close()
+
+
+def make_bus(url: str):
+    if url.startswith(("redis://", "rediss://")):
+        return RedisBus(url)
+    return LocalBus()
+
+
+bus = make_bus(settings.bus_url)
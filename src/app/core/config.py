@@ -6,6 +6,24 @@ class Settings(BaseSettings):
     build_time: str = ""
 
     database_url: str
+    # 비워두면 database_url에서 async 드라이버 URL을 유도 (mysql -> aiomysql, sqlite -> aiosqlite)
+    async_database_url: str = ""
+    async_db_enabled: bool = False
+    # 읽기 레플리카 (쉼표로 구분, 비우면 조회도 primary). 지연이 REPLICA_MAX_LAG_MS를 넘는 레플리카는 빼고 전부 빠지면 primary
+    database_replica_urls: str = ""
+    replica_max_lag_ms: int = 2000
+    replica_check_interval_ms: int = 1000
+    # 쓰기 요청 후 이 시간 동안 그 사용자의 조회는 primary (read-your-writes)
+    read_your_writes_ms: int = 5000
+    # 커넥션 풀 (app/db/pool.py). 메모리 SQLite에는 적용 안 됨
+    # checkout을 DB_POOL_TIMEOUT_MS 안에 못 받으면 503 + Retry-After
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_recycle_sec: int = 1800
+    db_pool_timeout_ms: int = 1000
+    # checkout마다 확인(왕복 1회) 대신 DB_POOL_LIVENESS_SEC마다 확인 (0이면 끔)
+    db_pool_pre_ping: bool = False
+    db_pool_liveness_sec: int = 10
     jwt_secret: str
     jwt_access_expires_min: int = 30
     jwt_refresh_expires_days: int = 14
@@ -13,6 +31,64 @@ class Settings(BaseSettings):
     cors_origins: str = "http://localhost:3000"
     rate_limit: str = "60/minute"
 
+    # 인메모리 경매 엔진 (단일 워커 전용)
+    auction_engine_enabled: bool = False
+    auction_wal_dir: str = "./var/wal"
+    auction_flush_interval_ms: int = 50
+    auction_wal_fsync: bool = True
+    # 연속 실패 횟수가 이만큼이면 아이템별로 나눠 반영하고 제약 조건 오류 입찰은 dead-letter 파일로 격리
+    auction_flush_max_attempts: int = 5
+    # 입찰 id를 DB 카운터(id_blocks)에서 한 번에 예약하는 개수 (엔진/DB 경로 공통, app/db/ids.py)
+    bid_id_block_size: int = 1000
+
+    # 입찰 group commit (window 안에 모인 입찰을 한 트랜잭션으로)
+    bid_group_commit_enabled: bool = False
+    bid_batch_window_ms: int = 5
+    bid_batch_max_size: int = 100
+
+    # 실시간 입찰 스트림 (SSE / WebSocket)
+    stream_queue_size: int = 64
+    stream_max_subscribers: int = 10000
+    stream_heartbeat_sec: int = 15
+
+    # 경매 마감 스케줄러 (ends_at 지난 OPEN 아이템 자동 CLOSED). 아이템 상태를 직접 바꾸므로 명시적으로 켤 때만
+    expiry_scheduler_enabled: bool = False
+    expiry_batch_size: int = 500
+    expiry_resync_sec: int = 30
+
+    # 아이템 검색: 검색어 bigram을 이 개수까지만 조인 (넘으면 검색어 전체에서 고르게 골라 씀)
+    search_max_tokens: int = 8
+
+    # 목록 totalElements COUNT 캐시 (0이면 매 요청 COUNT)
+    count_cache_ttl_sec: int = 30
+
+    # 인증 사용자 캐시 (TTL 0이면 매 요청 users 조회)
+    principal_cache_size: int = 10000
+    principal_cache_ttl_sec: int = 60
+    # 워커 간 캐시 무효화 버스 (비우면 프로세스 내부만, redis://... 이면 Redis pub/sub)
+    bus_url: str = ""
+
+    # bcrypt 전용 프로세스 풀 (0이면 요청 스레드에서 바로 계산), 대기+처리 중 상한 초과 시 503
+    password_pool_workers: int = 0
+    password_pool_max_pending: int = 16
+
+    # 토큰 폐기 목록 Bloom filter (기본 1M bit = 128KB, 폐기 토큰 10만 개에서 오탐 약 1%)
+    revocation_bloom_bits: int = 1048576
+    revocation_bloom_hashes: int = 7
+
+    # 조회 API 응답 캐시 (SWR + single-flight). URL 비우면 워커별 메모리, redis://... 이면 Redis 공유
+    response_cache_enabled: bool = True
+    response_cache_url: str = ""
+    response_cache_max_entries: int = 10000
+
+    # 입찰 수 상위 아이템 (메모리 top-K, 다른 워커 입찰은 resync 주기마다 DB에서 합침)
+    leaderboard_size: int = 50
+    leaderboard_resync_sec: int = 30
+
+    # 요청/DB 계측 + GET /metrics (Prometheus). SLOW_REQUEST_MS > 0 이면 그보다 느린 요청을 DB 통계와 함께 WARNING 로그
+    metrics_enabled: bool = True
+    slow_request_ms: int = 0
+
     class Config:
         env_file = ".env"
 
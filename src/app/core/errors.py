@@ -3,15 +3,18 @@ from fastapi.responses import JSONResponse
 from datetime import datetime, timezone
 
 class AppError(Exception):
-    def __init__(self, status: int, code: str, message: str, details: dict | None = None):
+    def __init__(self, status: int, code: str, message: str, details: dict | None = None, headers: dict | None = None):
         self.status = status
         self.code = code
         self.message = message
         self.details = details or {}
+        # 응답 헤더 (예: 503/429의 Retry-After)
+        self.headers = headers
 
-def error_response(req: Request, status: int, code: str, message: str, details: dict | None = None):
+def error_response(req: Request, status: int, code: str, message: str, details: dict | None = None, headers: dict | None = None):
     return JSONResponse(
         status_code=status,
+        headers=headers,
         content={
             "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
             "path": req.url.path,
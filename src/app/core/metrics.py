@@ -0,0 +1,252 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 요청/DB 계측 + Prometheus text format (GET /metrics).
+# - 외부 의존성 없이 히스토그램/게이지를 직접 집계 (관측 1회 = bisect + lock 안에서 정수 덧셈 몇 번)
+# - 라우트 라벨은 경로 템플릿 ("/api/v1/items/{item_id}") -> 라벨 수가 라우트 수로 제한됨
+# - 요청별 DB 통계(쿼리 수 / 쿼리 시간 / 풀 대기)는 ContextVar로 누적
+#   (동기 라우트는 threadpool로 context가 복사되어도 같은 RequestStats 객체를 가리킴)
+# - 요청 밖(백그라운드 스레드)의 쿼리도 전역 쿼리 히스토그램에는 집계
+# - 프로세스(워커)별 값. 워커가 여러 개면 워커마다 따로 수집해야 함
+# - 스트리밍 응답(SSE)의 처리 시간은 연결이 끊길 때까지의 시간
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+COUNT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labelnames: tuple, buckets: tuple):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._series: dict[tuple, list] = {}  # labels -> [버킷별 개수..., +Inf 개수, 합계]
+        self._lock = threading.Lock()
+
+    def observe(self, labels: tuple, value: float):
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            s = self._series.get(labels)
+            if s is None:
+                s = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            s[i] += 1
+            s[-1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = [(k, list(v)) for k, v in self._series.items()]
+        for labels, s in sorted(series):
+            base = _labels(self.labelnames, labels)
+            cumulative = 0
+            for le, n in zip(self.buckets + ("+Inf",), s[:-1]):
+                cumulative += n
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames + ('le',), labels + (le,))} {cumulative}")
+            lines.append(f"{self.name}_sum{base} {s[-1]}")
+            lines.append(f"{self.name}_count{base} {cumulative}")
+        return lines
+
+
+class Gauge:
+    # 값은 scrape 시점에 라벨별 fn()으로 읽음
+    def __init__(self, name: str, help: str, labelnames: tuple):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._fns: dict[tuple, object] = {}
+
+    def track(self, labels: tuple, fn):
+        self._fns[labels] = fn
+
+    def render(self) -> list[str]:
+        lines = []
+        for labels, fn in sorted(self._fns.items()):
+            try:
+                value = fn()
+            except Exception:
+                continue
+            if value is not None:
+                lines.append(f"{self.name}{_labels(self.labelnames, labels)} {value}")
+        if not lines:
+            return []
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"] + lines
+
+
+def _labels(names: tuple, values: tuple) -> str:
+    if not names:
+        return ""
+    esc = lambda v: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{n}="{esc(v)}"' for n, v in zip(names, values)) + "}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for m in self._metrics:
+            lines.extend(m.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (라우트 템플릿/상태 코드별)",
+    ("method", "route", "status"), LATENCY_BUCKETS,
+))
+http_db_queries = registry.register(Histogram(
+    "http_request_db_queries", "요청 하나가 실행한 SQL 문 수", ("method", "route"), COUNT_BUCKETS,
+))
+http_db_seconds = registry.register(Histogram(
+    "http_request_db_seconds", "요청 하나의 SQL 실행 시간 합계", ("method", "route"), LATENCY_BUCKETS,
+))
+db_query_seconds = registry.register(Histogram(
+    "db_query_duration_seconds", "SQL 문 실행 시간 (문 종류별, 백그라운드 작업 포함)", ("operation",), QUERY_BUCKETS,
+))
+db_checkout_seconds = registry.register(Histogram(
+    "db_pool_checkout_seconds", "커넥션 풀에서 커넥션을 받기까지 걸린 시간 (새 연결 생성 포함)", ("engine",), QUERY_BUCKETS + (2.5, 5.0, 10.0, 30.0),
+))
+
+db_checked_out = registry.register(Gauge("db_pool_checked_out", "사용 중인 커넥션 수", ("engine",)))
+
+
+class RequestStats:
+    __slots__ = ("queries", "db_seconds", "checkout_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.checkout_seconds = 0.0
+
+
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> RequestStats | None:
+    return _current.get()
+
+
+# ---------- SQLAlchemy ----------
+
+_OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+
+def _operation(statement: str) -> str:
+    head = statement.lstrip()[:6].upper()
+    return head if head in _OPERATIONS else "OTHER"
+
+
+def instrument_engine(engine, name: str = "primary"):
+    # 동기 엔진 (async 엔진은 .sync_engine을 넘김)
+    # 시작 시각은 실행 컨텍스트(문 하나당 하나)에 저장. 실패하면 after가 안 불리므로 따로 정리할 것 없음
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_t0 = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        t0 = getattr(context, "_metrics_t0", None)
+        if t0 is None:
+            return
+        elapsed = time.perf_counter() - t0
+        db_query_seconds.observe((_operation(statement),), elapsed)
+        stats = _current.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += elapsed
+
+    # 풀 대기: 풀에 "checkout 시작" 이벤트가 없으므로 pool._do_get을 감쌈
+    # (engine.dispose()로 풀이 새로 만들어지면 다시 감싸야 함 -> 종료 시에만 dispose하므로 처리하지 않음)
+    pool = engine.pool
+    do_get = pool._do_get
+
+    def timed_do_get():
+        t = time.perf_counter()
+        try:
+            return do_get()
+        finally:
+            elapsed = time.perf_counter() - t
+            db_checkout_seconds.observe((name,), elapsed)
+            stats = _current.get()
+            if stats is not None:
+                stats.checkout_seconds += elapsed
+
+    pool._do_get = timed_do_get
+
+    db_checked_out.track((name,), lambda: pool.checkedout() if hasattr(pool, "checkedout") else None)
+
+
+# ---------- ASGI middleware ----------
+
+def _route_template(scope) -> str:
+    # 매칭된 라우트의 경로 템플릿 ("/api/v1/items/{item_id}").
+    # include_router로 중첩된 라우트는 route.path에 상위 prefix가 빠져 있을 수 있으므로,
+    # 실제 경로에서 route 부분(파라미터를 채운 값)을 떼어낸 앞부분을 prefix로 붙임
+    route = scope.get("route")
+    fmt = getattr(route, "path_format", None)
+    if fmt is None:
+        # 매칭된 라우트가 없으면 (404 등) 하나의 라벨로 묶음 -> 임의 경로로 라벨이 늘어나지 않게
+        return "<unmatched>"
+    path = scope.get("path", "")
+    try:
+        rendered = fmt.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return fmt
+    if rendered and path.endswith(rendered):
+        return path[: len(path) - len(rendered)] + fmt
+    return fmt
+
+
+class MetricsMiddleware:
+    # BaseHTTPMiddleware 대신 순수 ASGI (응답 본문을 감싸지 않으므로 스트리밍/SSE에도 추가 비용 없음)
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        status = 500
+        t = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - t
+            _current.reset(token)
+            path = _route_template(scope)
+            method = scope["method"]
+            http_duration.observe((method, path, str(status)), elapsed)
+            http_db_queries.observe((method, path), stats.queries)
+            http_db_seconds.observe((method, path), stats.db_seconds)
+            if settings.slow_request_ms and elapsed * 1000 >= settings.slow_request_ms:
+                logger.warning(
+                    "slow request %s %s status=%s %.1fms db_queries=%d db=%.1fms pool_wait=%.1fms",
+                    method, path, status, elapsed * 1000, stats.queries,
+                    stats.db_seconds * 1000, stats.checkout_seconds * 1000,
+                )
@@ -1,3 +1,5 @@
+import uuid
+
 import jwt
 from datetime import datetime, timedelta, timezone
 from passlib.context import CryptContext
@@ -14,14 +16,15 @@ def verify_password(pw: str, hashed: str) -> bool:
 def _now():
     return datetime.now(timezone.utc)
 
+# jti: 토큰 고유 id (서버측 폐기 목록에서 사용)
 def create_access_token(sub: str, role: str):
     exp = _now() + timedelta(minutes=settings.jwt_access_expires_min)
-    payload = {"sub": sub, "role": role, "type": "access", "exp": exp}
+    payload = {"sub": sub, "role": role, "type": "access", "exp": exp, "jti": uuid.uuid4().hex}
     return jwt.encode(payload, settings.jwt_secret, algorithm="HS256")
 
 def create_refresh_token(sub: str, role: str):
     exp = _now() + timedelta(days=settings.jwt_refresh_expires_days)
-    payload = {"sub": sub, "role": role, "type": "refresh", "exp": exp}
+    payload = {"sub": sub, "role": role, "type": "refresh", "exp": exp, "jti": uuid.uuid4().hex}
     return jwt.encode(payload, settings.jwt_secret, algorithm="HS256")
 
 def decode_token(token: str):
@@ -0,0 +1,54 @@
+import threading
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.models.id_block import IdBlock
+
+# id를 DB 카운터 행(id_blocks)에서 블록 단위로 예약해서 발급.
+# - 인메모리 경매 엔진은 DB에 쓰기 전에 입찰 id를 응답해야 해서 autoincrement를 쓸 수 없음
+#   -> 같은 테이블에 INSERT하는 다른 경로(DB 입찰 경로, group commit)도 같은 카운터에서 받아야 겹치지 않음
+# - 예약은 자기 커넥션의 짧은 트랜잭션 (카운터 행 잠금을 요청 트랜잭션 끝까지 잡지 않도록)
+#   호출 측 트랜잭션이 쓰기를 하기 전에 호출해야 함 (SQLite는 쓰기 잠금이 DB 하나)
+# - 카운터 밖에서 들어간 행(시드 등)이 있으면 MAX(id) 뒤에서 시작
+# 재시작하면 쓰지 않은 블록의 나머지는 버려짐 (id에 빈 번호가 생길 뿐)
+
+
+class IdAllocator:
+    def __init__(self, table, block_size: int = 1000):
+        self._table = table
+        self._block_size = block_size
+        self._lock = threading.Lock()
+        self._blocks: dict[object, list[int]] = {}  # bind -> [다음 id, 블록 끝(미포함)]
+
+    def take(self, bind, n: int = 1) -> list[int]:
+        ids: list[int] = []
+        with self._lock:
+            block = self._blocks.setdefault(bind, [0, 0])
+            while len(ids) < n:
+                if block[0] >= block[1]:
+                    size = max(self._block_size, n - len(ids))
+                    block[0] = self._reserve(bind, size)
+                    block[1] = block[0] + size
+                k = min(n - len(ids), block[1] - block[0])
+                ids.extend(range(block[0], block[0] + k))
+                block[0] += k
+        return ids
+
+    def _reserve(self, bind, size: int) -> int:
+        counter = IdBlock.__table__
+        name = self._table.name
+        for attempt in range(2):
+            try:
+                with bind.begin() as conn:
+                    current = conn.scalar(select(counter.c.next_id).where(counter.c.name == name).with_for_update())
+                    start = max(current or 0, (conn.scalar(select(func.max(self._table.c.id))) or 0) + 1)
+                    if current is None:
+                        conn.execute(insert(counter).values(name=name, next_id=start + size))
+                    else:
+                        conn.execute(update(counter).where(counter.c.name == name).values(next_id=start + size))
+                return start
+            except IntegrityError:
+                # 첫 행을 다른 프로세스가 동시에 만듦 -> 다시 읽어서 UPDATE
+                if attempt:
+                    raise
@@ -0,0 +1,66 @@
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_, asc, desc
+
+from app.core.errors import AppError
+
+# 커서(keyset) 페이지네이션.
+# - 커서 = 이전 페이지 마지막 행의 (sort, 정렬 키 값, id)를 base64로 감싼 불투명 문자열
+# - 다음 페이지는 "(key, id)가 커서보다 뒤" 범위 조건 + LIMIT size+1 로 가져온다
+#   OFFSET처럼 앞 페이지 행을 읽고 버리지 않으므로 (key, id) 순서로 읽을 수 있으면 몇 번째 페이지든 비용이 같다
+# - 같은 key 값이 여러 행이면 id로 순서를 고정 (중복/누락 없음)
+# - NULL은 MySQL/SQLite 기본 정렬처럼 가장 작은 값으로 취급 (ASC면 맨 앞, DESC면 맨 뒤)
+
+
+def encode_cursor(sort: str, value, row_id: int) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, col):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cur_sort, value, row_id = json.loads(raw)
+        if value is not None and col.type.python_type is datetime:
+            value = datetime.fromisoformat(value)
+        row_id = int(row_id)
+    except Exception:
+        raise AppError(400, "INVALID_QUERY_PARAM", "cursor 값이 올바르지 않습니다.", {"cursor": cursor})
+    # 다른 정렬로 만든 커서를 섞어 쓰면 결과가 어긋나므로 거절
+    if cur_sort != sort:
+        raise AppError(400, "INVALID_QUERY_PARAM", "cursor와 sort가 일치하지 않습니다.", {"sort": sort})
+    return value, row_id
+
+
+def _after(col, id_col, descending: bool, value, row_id: int):
+    if value is None:
+        if descending:
+            return and_(col.is_(None), id_col < row_id)
+        return or_(and_(col.is_(None), id_col > row_id), col.is_not(None))
+    if descending:
+        cond = or_(col < value, and_(col == value, id_col < row_id))
+        return or_(cond, col.is_(None)) if col.nullable else cond
+    return or_(col > value, and_(col == value, id_col > row_id))
+
+
+def keyset(q, col, id_col, descending: bool, sort: str, cursor: str, size: int):
+    # cursor="" 이면 첫 페이지
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort, col)
+        q = q.where(_after(col, id_col, descending, value, row_id))
+    order = (desc(col), desc(id_col)) if descending else (asc(col), asc(id_col))
+    return q.order_by(*order).limit(size + 1)
+
+
+def cut_page(rows, size: int, sort: str, key):
+    # keyset()으로 size+1개 가져온 결과 -> (이번 페이지 행, nextCursor)
+    # key(row) = (정렬 키 값, id)
+    rows = list(rows)
+    if len(rows) <= size:
+        return rows, None
+    rows = rows[:size]
+    return rows, encode_cursor(sort, *key(rows[-1]))
@@ -0,0 +1,133 @@
+import logging
+import threading
+import time
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 커넥션 풀 설정 / 상태 / 주기적 liveness 확인.
+# - 크기/overflow/recycle/checkout 대기 한도는 Settings(DB_POOL_*)에서
+# - checkout 대기가 DB_POOL_TIMEOUT_MS를 넘으면 SQLAlchemy TimeoutError -> main.py에서 바로 503 + Retry-After
+#   (풀이 바닥났을 때 요청 스레드가 클라이언트 타임아웃까지 조용히 막혀 있지 않도록)
+# - pool_pre_ping(checkout마다 왕복 1회) 대신 DB_POOL_LIVENESS_SEC마다 커넥션 하나로 SELECT 1
+#   끊김이면 SQLAlchemy가 그 시각 이전 커넥션을 모두 무효화 -> 이후 checkout은 새 연결
+#   (DB 재시작 직후 다음 확인 전까지는 요청이 끊긴 커넥션을 받을 수 있음. 그 요청만 실패하고 풀은 같은 방식으로 무효화됨)
+#   DB_POOL_PRE_PING=true면 예전처럼 checkout마다 확인
+
+__all__ = ["PoolTimeoutError", "engine_options", "pool_monitor"]
+
+
+def engine_options(url: str) -> dict:
+    # create_engine / create_async_engine 공통 풀 옵션
+    opts = {"pool_pre_ping": settings.db_pool_pre_ping}
+    u = make_url(url)
+    if u.get_backend_name() == "sqlite" and u.database in (None, "", ":memory:"):
+        # 메모리 SQLite는 연결 하나를 공유하는 풀(SingletonThreadPool/StaticPool)이라 크기 옵션 없음
+        return opts
+    opts.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle_sec,
+        pool_timeout=settings.db_pool_timeout_ms / 1000,
+    )
+    return opts
+
+
+def _pool_stats(pool) -> dict:
+    if not hasattr(pool, "checkedout"):
+        return {"type": type(pool).__name__}
+    return {
+        "type": type(pool).__name__,
+        "size": pool.size(),
+        "checkedOut": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # 음수면 아직 size만큼 연결을 만들지 않은 것 (size + overflow = 지금까지 연 연결 수)
+        "overflow": pool.overflow(),
+        "maxOverflow": pool._max_overflow,
+    }
+
+
+class PoolMonitor:
+    def __init__(self, liveness_sec: int = 30):
+        self._liveness_sec = liveness_sec
+        self._engines: dict[str, object] = {}
+        self._liveness: set[str] = set()
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.running = False
+        self.rejected = 0  # checkout 대기 초과로 503을 돌려준 요청 수
+        self.liveness_failures = 0
+        self.last_liveness_error: str | None = None
+
+    def watch(self, name: str, engine, liveness: bool = True):
+        self._engines[name] = engine
+        if liveness:
+            self._liveness.add(name)
+
+    def note_rejected(self):
+        # 예외 핸들러는 여러 threadpool 스레드에서 동시에 호출됨 (+= 는 원자적이지 않음)
+        with self._lock:
+            self.rejected += 1
+
+    def start(self):
+        if self.running or self._liveness_sec <= 0 or not self._liveness:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="db-pool-liveness", daemon=True)
+        self._thread.start()
+        self.running = True
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        self._stop.set()
+        self._thread.join()
+
+    def check(self):
+        for name in list(self._liveness):
+            engine = self._engines[name]
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+            except PoolTimeoutError:
+                # 풀이 모두 사용 중 = 커넥션은 살아 있음
+                continue
+            except Exception as e:
+                # 끊김 오류는 SQLAlchemy가 풀 전체를 무효화함
+                with self._lock:
+                    self.liveness_failures += 1
+                    self.last_liveness_error = f"{name}: {type(e).__name__}"
+                logger.warning("db liveness check failed: %s", name, exc_info=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            rejected, failures, last_error = self.rejected, self.liveness_failures, self.last_liveness_error
+        return {
+            "engines": {name: _pool_stats(engine.pool) for name, engine in self._engines.items()},
+            "timeoutMs": settings.db_pool_timeout_ms,
+            "rejected": rejected,
+            "livenessSec": self._liveness_sec,
+            "livenessFailures": failures,
+            "lastLivenessError": last_error,
+        }
+
+    def _run(self):
+        while not self._stop.wait(self._liveness_sec):
+            t = time.perf_counter()
+            try:
+                self.check()
+            except Exception:
+                logger.exception("db liveness iteration failed")
+            elapsed = time.perf_counter() - t
+            if elapsed > 1:
+                logger.warning("db liveness check took %.1fs", elapsed)
+
+
+pool_monitor = PoolMonitor(liveness_sec=settings.db_pool_liveness_sec)
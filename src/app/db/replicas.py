@@ -0,0 +1,220 @@
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.core.bus import bus
+from app.core.config import settings
+from app.core.security import decode_token
+from app.models.replica_heartbeat import ReplicaHeartbeat
+
+logger = logging.getLogger(__name__)
+
+# 읽기 레플리카 라우팅 (DATABASE_REPLICA_URLS).
+# - 조회 라우트는 get_read_db로 세션을 받음 -> 세션 info에 요청이 붙고, 그 세션의 SELECT만 레플리카로
+#   (flush/INSERT/UPDATE/DELETE, 요청 밖 세션, execution_options(use_primary=True)인 조회는 항상 primary)
+# - 레플리카는 요청 단위로 하나 골라 고정 (COUNT와 목록이 서로 다른 시점의 데이터가 되지 않도록), 정상 레플리카끼리 round-robin
+# - 지연: primary의 replica_heartbeat에 CHECK_INTERVAL마다 현재 시각을 쓰고 각 레플리카에서 읽은 값과 비교
+#   측정 단위가 체크 주기라서 REPLICA_MAX_LAG_MS는 주기보다 크게. 지연 초과/측정 실패 레플리카는 빼고, 모두 빠지면 primary
+# - read-your-writes: 인증된 쓰기 요청(GET/HEAD/OPTIONS 외)이 들어오면 그 사용자의 조회를 READ_YOUR_WRITES_MS 동안 primary로
+#   (버스로 다른 워커에도 전달. 창은 요청 시작부터이므로 가장 긴 쓰기보다 길게)
+#   비로그인 조회 라우트도 Authorization 헤더가 있으면 최근 쓴 사용자인지 확인 (최근 쓴 사용자가 있을 때만 토큰 디코드)
+
+CHANNEL = "replica-ryw"
+_SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class Replica:
+    def __init__(self, name: str, engine):
+        self.name = name
+        self.engine = engine
+        self.lag_ms: int | None = None  # None: 아직 측정 안 됨 / 실패
+
+    def stats(self, max_lag_ms: int) -> dict:
+        return {"name": self.name, "lagMs": self.lag_ms, "healthy": self.lag_ms is not None and self.lag_ms <= max_lag_ms}
+
+
+class ReplicaRouter:
+    def __init__(self, max_lag_ms: int = 2000, check_interval_ms: int = 1000, read_your_writes_ms: int = 5000):
+        self.max_lag_ms = max_lag_ms
+        self.check_interval_ms = check_interval_ms
+        self.read_your_writes_ms = read_your_writes_ms
+        self.replicas: list[Replica] = []
+        self._primary = None
+        self._rr = itertools.count()
+        self._writers: dict[int, float] = {}  # user_id -> primary로 읽을 기한 (monotonic)
+        self._stop = threading.Event()
+        self._thread = None
+        self.running = False
+        self.replica_reads = 0
+        self.ryw_reads = 0
+        self.lag_fallbacks = 0
+
+    def configure(self, primary, urls: list[str], engine_options=None):
+        # primary: heartbeat를 쓸 엔진. urls: 레플리카 DB URL 목록. engine_options: URL -> create_engine 옵션
+        self._primary = primary
+        self.replicas = [
+            Replica(
+                make_url(u).render_as_string(hide_password=True),
+                create_engine(u, **(engine_options(u) if engine_options else {})),
+            )
+            for u in urls
+        ]
+
+    def start(self):
+        if self.running or not self.replicas:
+            return
+        self.check()  # 첫 측정 전에는 모든 레플리카가 unhealthy -> 시작 직후부터 쓰도록 한 번 측정
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="replica-heartbeat", daemon=True)
+        self._thread.start()
+        self.running = True
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        self._stop.set()
+        self._thread.join()
+
+    def dispose(self):
+        for r in self.replicas:
+            r.engine.dispose()
+
+    # ---------- 라우팅 ----------
+
+    def pick(self, request):
+        # 이 요청의 조회에 쓸 레플리카 엔진 (None이면 primary)
+        if not self.replicas:
+            return None
+        if self._writers and self._recent_writer(request):
+            self.ryw_reads += 1
+            return None
+        healthy = [r for r in self.replicas if r.lag_ms is not None and r.lag_ms <= self.max_lag_ms]
+        if not healthy:
+            self.lag_fallbacks += 1
+            return None
+        self.replica_reads += 1
+        return healthy[next(self._rr) % len(healthy)].engine
+
+    def note_write(self, user_id: int):
+        bus.publish(CHANNEL, {"userId": user_id, "ms": self.read_your_writes_ms})
+
+    def _on_message(self, message: dict | None):
+        # None(메시지 유실 가능)은 무시: 놓친 쓰기는 최대 지연 기준으로만 보호됨
+        if message:
+            self._writers[message["userId"]] = time.monotonic() + message["ms"] / 1000
+
+    def _recent_writer(self, request) -> bool:
+        user_id = getattr(request.state, "user_id", None)
+        if user_id is None:
+            user_id = _token_user_id(request)
+        if user_id is None:
+            return False
+        until = self._writers.get(user_id)
+        if until is None:
+            return False
+        if until < time.monotonic():
+            self._writers.pop(user_id, None)
+            return False
+        return True
+
+    # ---------- heartbeat ----------
+
+    def check(self):
+        now_ms = int(time.time() * 1000)
+        try:
+            with self._primary.begin() as conn:
+                done = conn.execute(update(ReplicaHeartbeat).where(ReplicaHeartbeat.id == 1).values(beat_ms=now_ms))
+                if done.rowcount == 0:
+                    conn.execute(insert(ReplicaHeartbeat).values(id=1, beat_ms=now_ms))
+        except Exception:
+            logger.exception("replica heartbeat write failed")
+        for r in self.replicas:
+            try:
+                with r.engine.connect() as conn:
+                    beat = conn.scalar(select(ReplicaHeartbeat.beat_ms).where(ReplicaHeartbeat.id == 1))
+                r.lag_ms = None if beat is None else max(0, now_ms - beat)
+            except Exception:
+                logger.warning("replica check failed: %s", r.name, exc_info=True)
+                r.lag_ms = None
+        # 기한 지난 read-your-writes 항목 정리
+        now = time.monotonic()
+        for user_id, until in list(self._writers.items()):
+            if until < now:
+                self._writers.pop(user_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "replicas": [r.stats(self.max_lag_ms) for r in self.replicas],
+            "maxLagMs": self.max_lag_ms,
+            "replicaReads": self.replica_reads,
+            "readYourWritesReads": self.ryw_reads,
+            "lagFallbacks": self.lag_fallbacks,
+        }
+
+    def _run(self):
+        while not self._stop.wait(self.check_interval_ms / 1000):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("replica check iteration failed")
+
+
+def _token_user_id(request) -> int | None:
+    auth = request.headers.get("authorization", "")
+    if auth[:7].lower() != "bearer ":
+        return None
+    try:
+        payload = decode_token(auth[7:])
+        return int(payload["sub"]) if payload.get("type") == "access" else None
+    except Exception:
+        return None
+
+
+class RoutingSession(Session):
+    # get_read_db가 info["read_request"]를 채운 세션의 SELECT만 레플리카로 보냄
+    def get_bind(self, mapper=None, clause=None, **kw):
+        request = self.info.get("read_request")
+        if (
+            request is not None and not self._flushing and isinstance(clause, Select)
+            and not clause.get_execution_options().get("use_primary")
+        ):
+            engine = self.info.get("read_engine")
+            if engine is None:
+                engine = self.info["read_engine"] = replica_router.pick(request) or False
+            if engine:
+                return engine
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@contextmanager
+def primary_reads(db: Session):
+    # 블록 안의 조회는 primary로 (응답 캐시 채우기: 무효화 직후 레플리카의 예전 값이 캐시에 들어가지 않도록)
+    request = db.info.pop("read_request", None)
+    try:
+        yield db
+    finally:
+        if request is not None:
+            db.info["read_request"] = request
+
+
+def note_request(request, user_id: int):
+    # 인증 의존성에서 호출: 조회 라우팅에 쓸 사용자 id + 쓰기 요청이면 read-your-writes 시작
+    request.state.user_id = user_id
+    if replica_router.replicas and request.method not in _SAFE_METHODS:
+        replica_router.note_write(user_id)
+
+
+replica_router = ReplicaRouter(
+    max_lag_ms=settings.replica_max_lag_ms,
+    check_interval_ms=settings.replica_check_interval_ms,
+    read_your_writes_ms=settings.read_your_writes_ms,
+)
+bus.subscribe(CHANNEL, replica_router._on_message)
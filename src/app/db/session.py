@@ -1,9 +1,27 @@
+from fastapi import Depends, Request
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.db.pool import engine_options, pool_monitor
+from app.db.replicas import RoutingSession, replica_router
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+# 풀 크기/checkout 대기 한도/liveness는 app/db/pool.py
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
+if settings.metrics_enabled:
+    instrument_engine(engine)
+pool_monitor.watch("primary", engine)
+SessionLocal = sessionmaker(bind=engine, class_=RoutingSession, autocommit=False, autoflush=False)
+
+# 읽기 레플리카 (app/db/replicas.py). heartbeat/지연 측정은 main.py lifespan에서 시작
+_replica_urls = [u.strip() for u in settings.database_replica_urls.split(",") if u.strip()]
+if _replica_urls:
+    replica_router.configure(engine, _replica_urls, engine_options)
+    for i, r in enumerate(replica_router.replicas):
+        if settings.metrics_enabled:
+            instrument_engine(r.engine, name=f"replica{i}")
+        pool_monitor.watch(f"replica{i}", r.engine)
 
 def get_db():
     db = SessionLocal()
@@ -11,3 +29,49 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# 조회 전용 라우트의 세션: get_db와 같은 세션에 요청을 붙여서 SELECT를 레플리카로 보냄
+# (레플리카가 없으면 get_db 세션 그대로. async라 threadpool을 거치지 않음)
+async def get_read_db(request: Request, db: Session = Depends(get_db)) -> Session:
+    if replica_router.replicas:
+        db.info["read_request"] = request
+    return db
+
+# ---------- async (ASYNC_DB_ENABLED) ----------
+# 동기 드라이버 URL을 같은 DB의 async 드라이버 URL로 변환 (ASYNC_DATABASE_URL로 직접 지정 가능)
+_ASYNC_DRIVERS = {"mysql": "mysql+aiomysql", "sqlite": "sqlite+aiosqlite"}
+
+def async_database_url() -> str:
+    if settings.async_database_url:
+        return settings.async_database_url
+    url = make_url(settings.database_url)
+    backend = url.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise RuntimeError(f"async 드라이버를 알 수 없는 DB입니다: {backend}")
+    return url.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+# async 드라이버(aiomysql / aiosqlite)는 켤 때만 필요하므로 처음 쓸 때 엔진을 만든다
+_async_engine = None
+_AsyncSessionLocal = None
+
+def get_async_sessionmaker():
+    global _async_engine, _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        url = async_database_url()
+        _async_engine = create_async_engine(url, **engine_options(url))
+        if settings.metrics_enabled:
+            instrument_engine(_async_engine.sync_engine, name="async")
+        # async 풀은 통계만 (liveness 확인은 동기 엔진만)
+        pool_monitor.watch("async", _async_engine.sync_engine, liveness=False)
+        _AsyncSessionLocal = async_sessionmaker(bind=_async_engine, autoflush=False, expire_on_commit=False)
+    return _AsyncSessionLocal
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+async def dispose_async_engine():
+    if _async_engine is not None:
+        await _async_engine.dispose()
@@ -1,3 +1,6 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import Limiter
@@ -8,10 +11,53 @@ from starlette.responses import PlainTextResponse
 from app.core.config import settings
 from app.core.errors import AppError, error_response
 from app.api.v1.router import router as v1
+from app.db.pool import PoolTimeoutError, pool_monitor
+from app.db.session import dispose_async_engine
+from app.db.replicas import replica_router
+from app.core.bus import bus
+from app.core.metrics import MetricsMiddleware, registry
+from app.services.auction_engine import auction_engine
+from app.services.bid_writer import bid_writer
+from app.services.expiry import expiry_scheduler
+from app.services.leaderboard import leaderboard
+from app.services.password_pool import password_pool
+from app.services.revocation import revocation_list
+
+logger = logging.getLogger(__name__)
 
 limiter = Limiter(key_func=get_remote_address, default_limits=[settings.rate_limit])
 
-app = FastAPI(title=settings.app_name, version=settings.app_version)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    bus.start()
+    try:
+        revocation_list.load()
+    except Exception:
+        # DB가 아직 준비 안 됨 등. 이후 폐기분은 버스로 받고, 기존 폐기분은 다음 버스 리셋 때 로드
+        logger.exception("revocation list load failed")
+    password_pool.start()
+    if settings.auction_engine_enabled:
+        auction_engine.start()
+    if settings.bid_group_commit_enabled:
+        bid_writer.start()
+    if settings.expiry_scheduler_enabled:
+        expiry_scheduler.start()
+    leaderboard.start()
+    replica_router.start()
+    pool_monitor.start()
+    yield
+    pool_monitor.stop()
+    replica_router.stop()
+    leaderboard.stop()
+    expiry_scheduler.stop()
+    bid_writer.stop()
+    auction_engine.stop()
+    await dispose_async_engine()
+    replica_router.dispose()
+    password_pool.stop()
+    bus.stop()
+
+app = FastAPI(title=settings.app_name, version=settings.app_version, lifespan=lifespan)
 app.state.limiter = limiter
 
 app.add_middleware(
@@ -22,12 +68,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+    # Prometheus scrape (API 버전 밖, 문서 제외). 외부 노출은 프록시에서 막을 것
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.exception_handler(AppError)
 def app_error_handler(req: Request, exc: AppError):
-    return error_response(req, exc.status, exc.code, exc.message, exc.details)
+    return error_response(req, exc.status, exc.code, exc.message, exc.details, exc.headers)
 
 @app.exception_handler(RateLimitExceeded)
 def rate_limit_handler(req: Request, exc: RateLimitExceeded):
     return error_response(req, 429, "TOO_MANY_REQUESTS", "요청 한도를 초과했습니다.", {})
 
+# 커넥션 풀에서 DB_POOL_TIMEOUT_MS 안에 연결을 못 받음 -> 클라이언트 타임아웃까지 막혀 있지 않고 바로 503
+@app.exception_handler(PoolTimeoutError)
+def pool_timeout_handler(req: Request, exc: PoolTimeoutError):
+    pool_monitor.note_rejected()
+    return error_response(
+        req, 503, "SERVICE_UNAVAILABLE", "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.", {},
+        {"Retry-After": "1"},
+    )
+
 app.include_router(v1)
@@ -4,3 +4,8 @@ from .item import Item
 from .bid import Bid
 from .watch import Watch
 from .order import Order
+from .item_token import ItemToken
+from .revoked_token import RevokedToken
+from .daily_sales import DailySales
+from .replica_heartbeat import ReplicaHeartbeat
+from .id_block import IdBlock
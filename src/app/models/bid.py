@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, DateTime, ForeignKey, func
+from sqlalchemy import Integer, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
@@ -7,12 +7,19 @@ class Bid(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
-    item_id: Mapped[int] = mapped_column(ForeignKey("items.id"), index=True, nullable=False)
-    bidder_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+    # item_id / bidder_id 단독 인덱스 대신 아래 복합 인덱스 (앞 컬럼으로 FK 인덱스 역할도 함)
+    item_id: Mapped[int] = mapped_column(ForeignKey("items.id"), nullable=False)
+    bidder_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
 
     amount: Mapped[int] = mapped_column(Integer, index=True, nullable=False)
 
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
-    item = relationship("Item", lazy="selectin")
-    bidder = relationship("User", lazy="selectin")
+    # 필요한 조회에서만 options(...)로 로드 (item.py 참고)
+    item = relationship("Item", lazy="raise_on_sql")
+    bidder = relationship("User", lazy="raise_on_sql")
+
+# 아이템별 입찰 목록 (금액순 / 최신순), 내 입찰 목록
+Index("ix_bids_item_id_amount", Bid.item_id, Bid.amount.desc())
+Index("ix_bids_item_id_created_at", Bid.item_id, Bid.created_at)
+Index("ix_bids_bidder_id_created_at", Bid.bidder_id, Bid.created_at)
@@ -0,0 +1,12 @@
+from sqlalchemy import Date, Integer, BigInteger
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+# 일별 매출 롤업 (주문 created_at 날짜(UTC) 기준, PAID/SHIPPED/COMPLETED 주문만)
+# 주문 상태가 집계 대상으로 바뀌거나 빠질 때 같은 트랜잭션에서 증감, 범위 재계산은 app.backfill_sales
+class DailySales(Base):
+    __tablename__ = "daily_sales"
+
+    day: Mapped[Date] = mapped_column(Date, primary_key=True)
+    sales: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    orders: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
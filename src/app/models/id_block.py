@@ -0,0 +1,10 @@
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+# 테이블별 id 발급 카운터 (app/db/ids.py). next_id = 아직 어느 프로세스에도 예약되지 않은 첫 id
+class IdBlock(Base):
+    __tablename__ = "id_blocks"
+
+    name: Mapped[str] = mapped_column(String(32), primary_key=True)
+    next_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
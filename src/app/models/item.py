@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import String, Text, Enum, Integer, DateTime, ForeignKey, func
+from sqlalchemy import String, Text, Enum, Integer, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
@@ -15,7 +15,7 @@ class Item(Base):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
     seller_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
-    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), index=True, nullable=False)
+    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), nullable=False)
 
     title: Mapped[str] = mapped_column(String(100), index=True, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
@@ -23,7 +23,15 @@ class Item(Base):
     start_price: Mapped[int] = mapped_column(Integer, nullable=False)
     bid_unit: Mapped[int] = mapped_column(Integer, nullable=False, default=100)
 
-    status: Mapped[ItemStatus] = mapped_column(Enum(ItemStatus), index=True, default=ItemStatus.DRAFT, nullable=False)
+    # 현재 최고가/최고 입찰자/입찰 수 (bids 집계 없이 O(1)로 입찰 처리하기 위한 비정규화 컬럼)
+    # 입찰이 없으면 current_price == start_price, top_bidder_id == None
+    current_price: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=lambda ctx: ctx.get_current_parameters()["start_price"], server_default="0",
+    )
+    top_bidder_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=True)
+    bid_count: Mapped[int] = mapped_column(Integer, index=True, nullable=False, default=0, server_default="0")
+
+    status: Mapped[ItemStatus] = mapped_column(Enum(ItemStatus), default=ItemStatus.DRAFT, nullable=False)
 
     starts_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=True)
     ends_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), index=True, nullable=True)
@@ -31,6 +39,11 @@ class Item(Base):
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
-    # 관계(편의용) - N+1 피하려면 조회에서 join/selectinload 사용
-    seller = relationship("User", lazy="selectin")
-    category = relationship("Category", lazy="selectin")
+    # 관계(편의용) - 암묵적 로딩 없음: 필요한 조회에서만 options(selectinload/joinedload)로 명시
+    # (로드하지 않은 관계에 접근하면 SQL을 실행하지 않고 예외 -> 숨은 N+1/추가 SELECT가 테스트에서 드러남)
+    seller = relationship("User", foreign_keys=[seller_id], lazy="raise_on_sql")
+    category = relationship("Category", lazy="raise_on_sql")
+
+# 목록 (상태 필터 / 카테고리 + 상태 필터, 최신순). category_id / status 단독 조건도 앞 컬럼으로 사용
+Index("ix_items_status_created_at", Item.status, Item.created_at)
+Index("ix_items_category_id_status_created_at", Item.category_id, Item.status, Item.created_at)
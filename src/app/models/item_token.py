@@ -0,0 +1,16 @@
+from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+# 아이템 검색용 역색인 (bigram 토큰 -> 아이템)
+# weight = 제목 등장 횟수 * 3 + 설명 등장 횟수 (검색 점수)
+# token은 binary collation: MySQL 기본 collation은 대소문자/악센트를 무시해서 "fe"와 "fé"를 같은 PK로 봄
+# (토큰은 search.tokenize에서 이미 소문자/NFKC 정규화됨)
+TOKEN_TYPE = String(4).with_variant(String(4, collation="utf8mb4_bin"), "mysql", "mariadb")
+
+class ItemToken(Base):
+    __tablename__ = "item_tokens"
+
+    token: Mapped[str] = mapped_column(TOKEN_TYPE, primary_key=True)
+    item_id: Mapped[int] = mapped_column(ForeignKey("items.id"), primary_key=True, index=True)
+    weight: Mapped[int] = mapped_column(Integer, nullable=False)
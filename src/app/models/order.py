@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import Enum, Integer, String, DateTime, ForeignKey, func, UniqueConstraint
+from sqlalchemy import Enum, Integer, String, DateTime, ForeignKey, Index, func, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
@@ -14,18 +14,21 @@ class Order(Base):
     __tablename__ = "orders"
     __table_args__ = (
         UniqueConstraint("item_id", name="uq_orders_item_id"),  # 아이템당 주문 1개
+        Index("ix_orders_buyer_id_created_at", "buyer_id", "created_at"),  # 내 주문 목록
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     item_id: Mapped[int] = mapped_column(ForeignKey("items.id"), nullable=False)
-    buyer_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+    buyer_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
 
     total_price: Mapped[int] = mapped_column(Integer, nullable=False)
     address: Mapped[str] = mapped_column(String(255), nullable=True)
 
     status: Mapped[OrderStatus] = mapped_column(Enum(OrderStatus), index=True, default=OrderStatus.PENDING, nullable=False)
 
-    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # 매출 롤업 backfill 범위 스캔용 index
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), index=True, server_default=func.now(), nullable=False)
 
-    item = relationship("Item", lazy="selectin")
-    buyer = relationship("User", lazy="selectin")
+    # 필요한 조회에서만 options(...)로 로드 (item.py 참고)
+    item = relationship("Item", lazy="raise_on_sql")
+    buyer = relationship("User", lazy="raise_on_sql")
@@ -0,0 +1,11 @@
+from sqlalchemy import BigInteger, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+# 레플리카 지연 측정용 (pt-heartbeat 방식). primary에 주기적으로 현재 시각(ms)을 쓰고
+# 레플리카에서 읽은 값과의 차이를 복제 지연으로 본다 (app/db/replicas.py). 행은 id=1 하나
+class ReplicaHeartbeat(Base):
+    __tablename__ = "replica_heartbeat"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    beat_ms: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -0,0 +1,10 @@
+from sqlalchemy import String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+# 폐기된 토큰(jti). 토큰 만료 시각이 지나면 의미 없으므로 주기적으로 삭제 (services/revocation.py _purge_db)
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    jti: Mapped[str] = mapped_column(String(32), primary_key=True)
+    expires_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), index=True, nullable=False)
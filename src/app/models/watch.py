@@ -1,9 +1,12 @@
-from sqlalchemy import DateTime, ForeignKey, func
+from sqlalchemy import DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
 class Watch(Base):
     __tablename__ = "watches"
+    __table_args__ = (
+        Index("ix_watches_user_id_created_at", "user_id", "created_at"),  # 내 찜 목록 (최신순)
+    )
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
     item_id: Mapped[int] = mapped_column(ForeignKey("items.id"), primary_key=True)
@@ -0,0 +1,18 @@
+from app.db.session import SessionLocal
+from app.services.leaderboard import leaderboard
+
+# items.bid_count를 bids 테이블에서 다시 계산 (입찰 수 상위 목록의 원본 카운터)
+# 사용: PYTHONPATH=src python -m app.rebuild_counters
+# 실행 중인 서버는 LEADERBOARD_RESYNC_SEC 안에 반영 (바로 반영: POST /admin/stats/leaderboard/rebuild)
+
+def main():
+    db = SessionLocal()
+    try:
+        n = leaderboard.rebuild(db)
+        print("Rebuild done.")
+        print("items updated:", n)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+from app.db.session import SessionLocal
+from app.services.search import reindex_all
+
+# 아이템 검색 역색인(item_tokens) 전체 재구축
+# 사용: PYTHONPATH=src python -m app.reindex
+
+def main():
+    db = SessionLocal()
+    try:
+        n = reindex_all(db)
+        print("Reindex done.")
+        print("items:", n)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -16,3 +16,7 @@ class TokenRes(BaseModel):
 
 class RefreshReq(BaseModel):
     refreshToken: str
+
+class LogoutReq(BaseModel):
+    # 함께 폐기할 refresh token (선택)
+    refreshToken: str | None = None
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 from datetime import datetime
 
 class BidCreateReq(BaseModel):
@@ -10,3 +11,31 @@ class BidRes(BaseModel):
     bidderId: int
     amount: int
     createdAt: datetime
+
+class BidBatchItemReq(BaseModel):
+    itemId: int
+    amount: int = Field(ge=0)
+
+class BidBatchReq(BaseModel):
+    bids: List[BidBatchItemReq] = Field(min_length=1, max_length=500)
+    # ALL_OR_NOTHING: 하나라도 실패하면 전체 롤백 / PARTIAL: 유효한 입찰만 반영
+    mode: Literal["ALL_OR_NOTHING", "PARTIAL"] = "ALL_OR_NOTHING"
+
+class BidBatchErrorRes(BaseModel):
+    code: str
+    message: str
+    details: dict = {}
+
+class BidBatchResultRes(BaseModel):
+    index: int
+    itemId: int
+    amount: int
+    ok: bool
+    bid: Optional[BidRes] = None
+    error: Optional[BidBatchErrorRes] = None
+
+class BidBatchRes(BaseModel):
+    mode: str
+    accepted: int
+    rejected: int
+    results: List[BidBatchResultRes]
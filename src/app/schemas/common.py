@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Generic, TypeVar, List
+from typing import Generic, TypeVar, List, Optional
 
 T = TypeVar("T")
 
@@ -7,6 +7,18 @@ class PageRes(BaseModel, Generic[T]):
     content: List[T]
     page: int
     size: int
-    totalElements: int
-    totalPages: int
+    # withTotal=false면 COUNT를 생략하므로 null
+    totalElements: Optional[int] = None
+    totalPages: Optional[int] = None
     sort: str
+    hasNext: Optional[bool] = None
+
+# 커서 페이지네이션 응답 (?cursor= 로 요청했을 때)
+# - 전체 개수를 세지 않으므로 totalElements/totalPages 없음
+# - nextCursor를 그대로 다음 요청의 cursor로 넘기면 됨 (마지막 페이지면 null)
+class CursorPageRes(BaseModel, Generic[T]):
+    content: List[T]
+    size: int
+    sort: str
+    nextCursor: Optional[str] = None
+    hasNext: bool
@@ -1,7 +1,7 @@
 import random
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
@@ -12,6 +12,8 @@ from app.models.item import Item, ItemStatus
 from app.models.bid import Bid
 from app.models.watch import Watch
 from app.models.order import Order, OrderStatus
+from app.services.search import reindex_all
+from app.services.sales_rollup import backfill
 
 UTC = timezone.utc
 
@@ -143,6 +145,7 @@ def seed_items(db: Session, users: list[User], cats: list[Category], n: int = 12
             description=rand_desc(),
             start_price=start_price,
             bid_unit=bid_unit,
+            current_price=start_price,
             status=status,
             starts_at=starts_at,
             ends_at=ends_at,
@@ -179,6 +182,9 @@ def seed_bids(db: Session, users: list[User], items: list[Item], n: int = 300) -
         db.add(b)
 
         current_price[it.id] = amount
+        it.current_price = amount
+        it.top_bidder_id = bidder.id
+        it.bid_count += 1
         bids_created += 1
 
     db.commit()
@@ -192,16 +198,17 @@ def seed_watches(db: Session, users: list[User], items: list[Item], n: int = 150
     user_ids = [u.id for u in users if u.role == UserRole.USER]
     item_ids = [it.id for it in items]
 
+    # 복합 PK 중복 방지 (기존 찜은 한 번만 읽어 set으로)
+    seen = set(db.execute(select(Watch.user_id, Watch.item_id)).tuples())
     created = 0
     tries = 0
     while created < n and tries < n * 10:
         tries += 1
-        uid = random.choice(user_ids)
-        iid = random.choice(item_ids)
-        # 복합 PK 중복 방지
-        if db.get(Watch, {"user_id": uid, "item_id": iid}):
+        key = (random.choice(user_ids), random.choice(item_ids))
+        if key in seen:
             continue
-        db.add(Watch(user_id=uid, item_id=iid))
+        seen.add(key)
+        db.add(Watch(user_id=key[0], item_id=key[1]))
         created += 1
 
     db.commit()
@@ -222,16 +229,15 @@ def seed_orders(db: Session, items: list[Item], n: int = 30):
         if db.scalar(select(Order).where(Order.item_id == it.id)):
             continue
 
-        # 낙찰자 = 최고입찰자
-        top = db.scalar(select(Bid).where(Bid.item_id == it.id).order_by(Bid.amount.desc()).limit(1))
-        if not top:
+        # 낙찰자 = 최고입찰자 (items.top_bidder_id)
+        if it.top_bidder_id is None:
             continue
 
         st = random.choice([OrderStatus.PAID, OrderStatus.SHIPPED, OrderStatus.COMPLETED])
         db.add(Order(
             item_id=it.id,
-            buyer_id=top.bidder_id,
-            total_price=top.amount,
+            buyer_id=it.top_bidder_id,
+            total_price=it.current_price,
             address="서울시 어딘가 123-45",
             status=st,
         ))
@@ -246,18 +252,18 @@ def main():
         cats = seed_categories(db)
         users = seed_users(db, n=30)
         items = seed_items(db, users, cats, n=120)
-        bids = seed_bids(db, users, items, n=300)
+        reindex_all(db)
+        seed_bids(db, users, items, n=300)
         seed_watches(db, users, items, n=150)
         seed_orders(db, items, n=30)
+        today = datetime.now(UTC).date()
+        backfill(db, today - timedelta(days=365), today + timedelta(days=1), chunk_days=30)
 
-        # 대략 카운트 출력
+        # 카운트 출력 (행을 읽지 않고 COUNT만)
         print("Seed done.")
-        print("users:", len(db.scalars(select(User)).all()))
-        print("categories:", len(db.scalars(select(Category)).all()))
-        print("items:", len(db.scalars(select(Item)).all()))
-        print("bids:", len(db.scalars(select(Bid)).all()))
-        print("watches:", len(db.scalars(select(Watch)).all()))
-        print("orders:", len(db.scalars(select(Order)).all()))
+        for name, model in (("users", User), ("categories", Category), ("items", Item),
+                            ("bids", Bid), ("watches", Watch), ("orders", Order)):
+            print(f"{name}:", db.scalar(select(func.count()).select_from(model)))
     finally:
         db.close()
 
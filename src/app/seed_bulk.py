@@ -0,0 +1,303 @@
+import argparse
+import multiprocessing
+import random
+import time
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.security import hash_password
+from app.models.user import User, UserRole, UserStatus
+from app.models.item import Item, ItemStatus
+from app.models.bid import Bid
+from app.models.watch import Watch
+from app.models.order import Order, OrderStatus
+from app.models.item_token import ItemToken
+from app.seed import ITEM_TITLES, rand_desc, seed_categories
+from app.services.sales_rollup import backfill
+from app.services.search import token_rows
+
+# 대량 seed (벤치마크 / 용량 산정용). 빈 DB(또는 카테고리/관리자만 있는 DB)에 실행
+#   PYTHONPATH=src python -m app.seed_bulk --users 1000000 --items 2000000 --bids 20000000 \
+#       --watches 5000000 --orders 300000 --seed 42 --workers 4
+#
+# - 같은 --seed / --now / 개수면 같은 데이터 (청크 k의 난수는 (seed, k)로만 정해지므로 --workers 수와 무관)
+# - users / items는 id를 직접 지정 (기존 max(id) 다음부터) -> 입찰/찜/주문이 DB 왕복 없이 id를 참조하고 청크를 프로세스로 나눠도 겹치지 않음
+# - 아이템 청크 하나 = 아이템 + 그 아이템들의 입찰 / 찜 / 주문 / 검색 토큰.
+#   입찰은 아이템별 현재가를 메모리에서 올려가며 만들고 (amount = 현재가 + bid_unit * 1~5),
+#   마지막 값으로 items.current_price / top_bidder_id / bid_count를 채워 INSERT
+# - 모든 INSERT는 insert(table) + 파라미터 리스트 (executemany), --batch 행씩
+# - 입찰/찜은 아이템 인기도(파레토 분포)에 비례해 몰림 (상위 소수 아이템에 입찰 집중)
+
+UTC = timezone.utc
+AUCTION_DAYS = (3, 7, 14, 30)  # 경매 기간 후보 (일)
+BULK_PASSWORD = "P@ssw0rd!"
+
+ORDER_STATUS_WEIGHTS = [
+    (OrderStatus.PENDING, 10), (OrderStatus.PAID, 30), (OrderStatus.SHIPPED, 20),
+    (OrderStatus.COMPLETED, 35), (OrderStatus.CANCELLED, 5),
+]
+
+@dataclass
+class Plan:
+    seed: int
+    now: datetime
+    days: int
+    prefix: str
+    users: int
+    items: int
+    bids: int
+    watches: int
+    orders: int
+    chunk: int
+    batch: int
+    index: bool
+    user_id0: int = 0
+    item_id0: int = 0
+
+    def quota(self, total: int, lo: int, hi: int) -> int:
+        # 청크 [lo, hi)에 배정할 개수 (청크별 합이 정확히 total)
+        return total * hi // self.items - total * lo // self.items
+
+def _batched(rows, n: int):
+    buf = []
+    for r in rows:
+        buf.append(r)
+        if len(buf) >= n:
+            yield buf
+            buf = []
+    if buf:
+        yield buf
+
+def _insert(conn, table, rows, batch: int) -> int:
+    n = 0
+    for chunk in _batched(rows, batch):
+        conn.execute(insert(table), chunk)
+        n += len(chunk)
+    return n
+
+# ---------- users ----------
+
+def user_rows(plan: Plan, lo: int, hi: int, password_hash: str):
+    created = plan.now - timedelta(days=plan.days)
+    step = timedelta(days=plan.days) / max(plan.users, 1)
+    for n in range(lo, hi):
+        yield {
+            "id": plan.user_id0 + n,
+            "email": f"{plan.prefix}{n}@example.com",
+            "password_hash": password_hash,  # 모두 같은 비밀번호 (bcrypt는 한 번만)
+            "nickname": f"{plan.prefix}{n}"[:30],
+            "role": UserRole.USER,
+            "status": UserStatus.ACTIVE,
+            "created_at": created + step * n,
+            "updated_at": created + step * n,
+        }
+
+# ---------- items + bids / watches / orders ----------
+
+def item_chunk(plan: Plan, k: int, category_ids: list[int], user_ids) -> dict[str, list]:
+    # 청크 k (아이템 [k*chunk, (k+1)*chunk))의 모든 행
+    rng = random.Random(f"{plan.seed}:items:{k}")
+    lo, hi = k * plan.chunk, min((k + 1) * plan.chunk, plan.items)
+    start = plan.now - timedelta(days=plan.days)
+    step = timedelta(days=plan.days) / plan.items
+    pick_user = lambda: user_ids[rng.randrange(len(user_ids))]
+
+    items, tokens = [], []
+    for n in range(lo, hi):
+        item_id = plan.item_id0 + n
+        created_at = start + step * n + step * rng.random()  # id 순서 = 등록 순서
+        title = f"{rng.choice(ITEM_TITLES)} {rng.randint(1, 999)}"
+        desc = rand_desc()
+        start_price = rng.randrange(0, 200_000, 1000)
+        ends_at = created_at + timedelta(days=rng.choice(AUCTION_DAYS))
+        if rng.random() < 0.1:
+            status = ItemStatus.DRAFT
+        elif ends_at <= plan.now:
+            status = ItemStatus.CANCELLED if rng.random() < 0.03 else ItemStatus.CLOSED
+        else:
+            status = ItemStatus.OPEN
+        draft = status == ItemStatus.DRAFT
+        items.append({
+            "id": item_id, "seller_id": pick_user(), "category_id": rng.choice(category_ids),
+            "title": title, "description": desc, "start_price": start_price,
+            "bid_unit": rng.choice((100, 500, 1000, 5000)), "current_price": start_price,
+            "top_bidder_id": None, "bid_count": 0, "status": status,
+            "starts_at": None if draft else created_at, "ends_at": None if draft else ends_at,
+            "created_at": created_at, "updated_at": created_at,
+        })
+        if plan.index:
+            tokens.extend(token_rows(item_id, title, desc))
+
+    # 인기도: 입찰/찜 대상 선택 가중치
+    live = [it for it in items if it["status"] != ItemStatus.DRAFT]
+    weights = [rng.paretovariate(1.5) for _ in live]
+
+    # 아이템별 입찰 수 -> 현재가를 올려가며 생성 (created_at은 경매 기간 안에서 오름차순)
+    per_item: dict[int, int] = {}
+    if live:
+        for it in rng.choices(live, weights, k=plan.quota(plan.bids, lo, hi)):
+            per_item[it["id"]] = per_item.get(it["id"], 0) + 1
+    bids = []
+    for it in live:
+        n_bids = per_item.get(it["id"], 0)
+        if not n_bids:
+            continue
+        end = min(it["ends_at"], plan.now)
+        span = (end - it["starts_at"]).total_seconds()
+        offsets = sorted(rng.random() * span for _ in range(n_bids))
+        price = it["current_price"]
+        for off in offsets:
+            bidder = pick_user()
+            while bidder == it["seller_id"] and len(user_ids) > 1:
+                bidder = pick_user()
+            price += it["bid_unit"] * rng.randint(1, 5)
+            bids.append({
+                "item_id": it["id"], "bidder_id": bidder, "amount": price,
+                "created_at": it["starts_at"] + timedelta(seconds=off),
+            })
+        it["current_price"] = price
+        it["top_bidder_id"] = bidder
+        it["bid_count"] = n_bids
+
+    # 찜: (user_id, item_id) PK 중복은 아이템별 set으로 제외
+    watches = []
+    watched: dict[int, set] = {}
+    if live:
+        for it in rng.choices(live, weights, k=plan.quota(plan.watches, lo, hi)):
+            seen = watched.setdefault(it["id"], set())
+            uid = pick_user()
+            if uid in seen:
+                continue
+            seen.add(uid)
+            watches.append({"user_id": uid, "item_id": it["id"], "created_at": it["starts_at"] + timedelta(hours=rng.random() * 24)})
+
+    # 주문: 낙찰자가 있는 CLOSED 아이템 중에서 (아이템당 1건)
+    orders = []
+    closed = [it for it in items if it["status"] == ItemStatus.CLOSED and it["top_bidder_id"] is not None]
+    statuses, status_weights = zip(*ORDER_STATUS_WEIGHTS)
+    for it in rng.sample(closed, min(len(closed), plan.quota(plan.orders, lo, hi))):
+        orders.append({
+            "item_id": it["id"], "buyer_id": it["top_bidder_id"], "total_price": it["current_price"],
+            "address": "서울시 어딘가 123-45", "status": rng.choices(statuses, status_weights)[0],
+            "created_at": min(it["ends_at"] + timedelta(minutes=rng.randint(1, 24 * 60)), plan.now),
+        })
+
+    return {"items": items, "bids": bids, "watches": watches, "orders": orders, "tokens": tokens}
+
+# ---------- 실행 (단일 프로세스 / 프로세스 풀 공용) ----------
+
+_engine = None
+_ctx: dict = {}
+
+def _init_worker(database_url: str, ctx: dict):
+    global _engine, _ctx
+    _engine = create_engine(database_url)
+    _ctx = ctx
+
+def _users_task(k: int) -> tuple[str, int]:
+    plan: Plan = _ctx["plan"]
+    lo, hi = k * plan.chunk, min((k + 1) * plan.chunk, plan.users)
+    with _engine.begin() as conn:
+        n = _insert(conn, User.__table__, user_rows(plan, lo, hi, _ctx["password_hash"]), plan.batch)
+    return "users", n
+
+def _items_task(k: int) -> tuple[str, dict]:
+    plan: Plan = _ctx["plan"]
+    rows = item_chunk(plan, k, _ctx["category_ids"], _ctx["user_ids"])
+    # FK 순서: items -> bids / watches / orders / item_tokens
+    with _engine.begin() as conn:
+        counts = {
+            "items": _insert(conn, Item.__table__, rows["items"], plan.batch),
+            "bids": _insert(conn, Bid.__table__, rows["bids"], plan.batch),
+            "watches": _insert(conn, Watch.__table__, rows["watches"], plan.batch),
+            "orders": _insert(conn, Order.__table__, rows["orders"], plan.batch),
+            "tokens": _insert(conn, ItemToken.__table__, rows["tokens"], plan.batch),
+        }
+    return "items", counts
+
+def _run(task, n_chunks: int, workers: int, ctx: dict, progress):
+    if workers <= 1:
+        _init_worker(settings.database_url, ctx)
+        for k in range(n_chunks):
+            progress(k, task(k))
+        return
+    # spawn: 부모의 커넥션/스레드를 물려받지 않도록
+    with multiprocessing.get_context("spawn").Pool(workers, _init_worker, (settings.database_url, ctx)) as pool:
+        for k, result in enumerate(pool.imap_unordered(task, range(n_chunks))):
+            progress(k, result)
+
+def run(plan: Plan, workers: int = 1, log=print) -> dict:
+    engine = create_engine(settings.database_url)
+    with Session(bind=engine) as db:
+        category_ids = [c.id for c in seed_categories(db)]
+        plan.user_id0 = (db.scalar(select(func.max(User.id))) or 0) + 1
+        plan.item_id0 = (db.scalar(select(func.max(Item.id))) or 0) + 1
+
+    totals = {"users": 0, "items": 0, "bids": 0, "watches": 0, "orders": 0, "tokens": 0}
+    started = time.perf_counter()
+
+    def progress(k, result):
+        kind, counts = result
+        if isinstance(counts, int):
+            counts = {kind: counts}
+        for key, v in counts.items():
+            totals[key] += v
+        done = " ".join(f"{key}={v}" for key, v in totals.items() if v)
+        log(f"[{time.perf_counter() - started:7.1f}s] {kind} chunk {k + 1}: {done}")
+
+    if plan.users:
+        ctx = {"plan": plan, "password_hash": hash_password(BULK_PASSWORD)}
+        _run(_users_task, -(-plan.users // plan.chunk), workers, ctx, progress)
+
+    if plan.items:
+        with engine.connect() as conn:
+            user_ids = array("q", conn.scalars(select(User.id).where(User.role == UserRole.USER).order_by(User.id)))
+        if not user_ids:
+            raise SystemExit("판매자/입찰자로 쓸 USER 계정이 없습니다 (--users > 0)")
+        ctx = {"plan": plan, "category_ids": category_ids, "user_ids": user_ids}
+        _run(_items_task, -(-plan.items // plan.chunk), workers, ctx, progress)
+
+    # 파생 데이터: 일별 매출 롤업
+    if totals["orders"]:
+        with Session(bind=engine) as db:
+            backfill(db, (plan.now - timedelta(days=plan.days)).date(), plan.now.date() + timedelta(days=1), chunk_days=30)
+    engine.dispose()
+    return totals
+
+def main():
+    today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--users", type=int, default=100_000)
+    ap.add_argument("--items", type=int, default=200_000)
+    ap.add_argument("--bids", type=int, default=2_000_000)
+    ap.add_argument("--watches", type=int, default=500_000)
+    ap.add_argument("--orders", type=int, default=30_000)
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--now", type=datetime.fromisoformat, default=today, help="기준 시각 (기본: 오늘 0시 UTC)")
+    ap.add_argument("--days", type=int, default=180, help="등록 시각 분포 기간")
+    ap.add_argument("--prefix", default="bulk", help="계정 이메일/닉네임 접두어")
+    ap.add_argument("--chunk", type=int, default=5000, help="청크(트랜잭션/작업 단위) 당 users / items 수")
+    ap.add_argument("--batch", type=int, default=5000, help="executemany 한 번의 행 수")
+    ap.add_argument("--workers", type=int, default=1, help="프로세스 수 (SQLite는 1 권장)")
+    ap.add_argument("--no-index", action="store_true", help="검색 토큰(item_tokens) 생략")
+    args = ap.parse_args()
+
+    now = args.now if args.now.tzinfo else args.now.replace(tzinfo=UTC)
+    plan = Plan(
+        seed=args.seed, now=now, days=args.days, prefix=args.prefix,
+        users=args.users, items=args.items, bids=args.bids, watches=args.watches, orders=args.orders,
+        chunk=args.chunk, batch=args.batch, index=not args.no_index,
+    )
+    started = time.perf_counter()
+    totals = run(plan, workers=args.workers)
+    print(f"Bulk seed done in {time.perf_counter() - started:.1f}s.")
+    for key, v in totals.items():
+        print(f"{key}:", v)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+import glob
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import select, insert, update, bindparam
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app.core.config import settings
+from app.core.errors import AppError
+from app.db.session import SessionLocal
+from app.models.item import Item, ItemStatus
+from app.models.bid import Bid
+from app.services.bidding import auction_ended, bid_ids
+
+logger = logging.getLogger(__name__)
+
+# 진행 중(OPEN) 경매의 상태를 메모리에 들고 입찰을 바로 검증/수락하는 엔진.
+# - 수락된 입찰은 WAL(append-only 파일)에 먼저 기록(fsync)한 뒤 응답
+# - flusher 스레드가 WAL에 쌓인 입찰을 bids 테이블 + items 비정규화 컬럼에 배치로 반영
+# - 재시작 시 DB의 OPEN 아이템을 읽고, 아직 DB에 없는 WAL 레코드를 재생해서 상태 복구
+# - 반영이 max_flush_attempts번 연속 실패하면 아이템별로 나눠 반영하고, 제약 조건 오류로 계속 실패하는 아이템의
+#   입찰은 dead-letter 파일(bids-*.dead)로 격리 + 엔진에서 내림 (이후 입찰은 DB 경로)
+#   연결 오류 등은 격리하지 않고 계속 재시도 (DB 장애 중 입찰을 버리지 않도록)
+# 입찰 id는 DB 카운터에서 예약한 블록에서 발급 (DB 경로 입찰과 같은 카운터, app/db/ids.py)
+# 경매 상태를 메모리에 들고 있으므로 단일 writer 프로세스(워커 1개)에서만 켜야 한다.
+
+
+class AuctionState:
+    __slots__ = (
+        "item_id", "seller_id", "start_price", "bid_unit",
+        "current_price", "top_bidder_id", "bid_count", "ends_at",
+    )
+
+    def __init__(self, item_id, seller_id, start_price, bid_unit, current_price, top_bidder_id, bid_count, ends_at):
+        self.item_id = item_id
+        self.seller_id = seller_id
+        self.start_price = start_price
+        self.bid_unit = bid_unit
+        self.current_price = current_price
+        self.top_bidder_id = top_bidder_id
+        self.bid_count = bid_count
+        self.ends_at = ends_at
+
+
+class AcceptedBid:
+    __slots__ = ("id", "item_id", "bidder_id", "amount", "created_at")
+
+    def __init__(self, id, item_id, bidder_id, amount, created_at):
+        self.id = id
+        self.item_id = item_id
+        self.bidder_id = bidder_id
+        self.amount = amount
+        self.created_at = created_at
+
+    def to_wal(self) -> str:
+        return f"{self.id}\t{self.item_id}\t{self.bidder_id}\t{self.amount}\t{self.created_at.timestamp()}\n"
+
+    @classmethod
+    def from_wal(cls, line: str):
+        bid_id, item_id, bidder_id, amount, ts = line.rstrip("\n").split("\t")
+        created_at = datetime.fromtimestamp(float(ts), timezone.utc)
+        return cls(int(bid_id), int(item_id), int(bidder_id), int(amount), created_at)
+
+
+class AuctionEngine:
+    def __init__(
+        self, session_factory, wal_dir: str, flush_interval_ms: int = 50, flush_chunk: int = 1000, fsync: bool = True,
+        max_flush_attempts: int = 5,
+    ):
+        self._session_factory = session_factory
+        self._wal_dir = wal_dir
+        self._flush_interval = flush_interval_ms / 1000
+        self._flush_chunk = flush_chunk
+        self._fsync = fsync
+        self._max_flush_attempts = max_flush_attempts
+        self._failures = 0                     # 연속 flush 실패 횟수
+        self.dead_lettered = 0                 # 격리한 입찰 수
+        self._dead_items: set[int] = set()     # 입찰을 격리해서 엔진에서 내린 아이템
+
+        self._lock = threading.Lock()          # 상태/pending/WAL 보호
+        self._flush_lock = threading.Lock()    # flush는 한 번에 하나만
+        self._auctions: dict[int, AuctionState] = {}
+        self._pending: list[AcceptedBid] = []
+        self._sealed: list[str] = []           # DB 반영 대기 중인 WAL 세그먼트
+        self._wal = None
+        self._wal_seq = 0
+        self._bind = None
+
+        self._stop = threading.Event()
+        self._thread = None
+        self.running = False
+
+    # ---------- lifecycle ----------
+
+    def start(self):
+        if self.running:
+            return
+        os.makedirs(self._wal_dir, exist_ok=True)
+
+        db = self._session_factory()
+        try:
+            rows = db.execute(
+                select(
+                    Item.id, Item.seller_id, Item.start_price, Item.bid_unit,
+                    Item.current_price, Item.top_bidder_id, Item.bid_count, Item.ends_at,
+                ).where(Item.status == ItemStatus.OPEN)
+            ).all()
+            self._auctions = {r[0]: AuctionState(*r) for r in rows}
+            self._bind = db.get_bind()
+
+            # WAL 재생: DB에 아직 없는 입찰만 상태에 반영하고 pending에 다시 올린다
+            segments = sorted(glob.glob(os.path.join(self._wal_dir, "bids-*.wal")), key=self._segment_seq)
+            records = []
+            for path in segments:
+                with open(path, encoding="utf-8") as f:
+                    records.extend(AcceptedBid.from_wal(line) for line in f if line.strip())
+            # dead-letter로 격리한 입찰은 재생하지 않음
+            persisted = set()
+            for path in glob.glob(os.path.join(self._wal_dir, "bids-*.dead")):
+                with open(path, encoding="utf-8") as f:
+                    persisted.update(AcceptedBid.from_wal(line).id for line in f if line.strip())
+            ids = [r.id for r in records]
+            for i in range(0, len(ids), self._flush_chunk):
+                persisted.update(db.scalars(select(Bid.id).where(Bid.id.in_(ids[i:i + self._flush_chunk]))))
+        finally:
+            db.close()
+
+        for r in records:
+            if r.id in persisted:
+                continue
+            st = self._auctions.get(r.item_id)
+            if st:
+                st.current_price = r.amount
+                st.top_bidder_id = r.bidder_id
+                st.bid_count += 1
+            self._pending.append(r)
+
+        # 재생할 게 없으면 남은 세그먼트는 이미 DB에 반영된 것
+        if not self._pending:
+            for path in segments:
+                os.remove(path)
+            segments = []
+        self._sealed = segments
+        self._wal_seq = max((self._segment_seq(p) for p in segments), default=0)
+        self._open_segment()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="auction-engine-flusher", daemon=True)
+        self._thread.start()
+        self.running = True
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        self._stop.set()
+        self._thread.join()
+        self.flush()
+        with self._lock:
+            self._wal.close()
+            if not self._pending and os.path.getsize(self._wal.name) == 0:
+                os.remove(self._wal.name)
+            self._wal = None
+
+    # ---------- 경매 상태 ----------
+
+    def get(self, item_id: int) -> AuctionState | None:
+        return self._auctions.get(item_id)
+
+    def open(self, item):
+        # publish 직후(커밋 이후) 호출
+        with self._lock:
+            self._auctions[item.id] = AuctionState(
+                item.id, item.seller_id, item.start_price, item.bid_unit,
+                item.current_price, item.top_bidder_id, item.bid_count, item.ends_at,
+            )
+
+    def close(self, item_id: int) -> AuctionState | None:
+        # 마감 직전 호출: 더 이상 입찰을 받지 않고, 밀린 입찰을 DB에 반영한 뒤 최종 상태 반환
+        with self._lock:
+            st = self._auctions.pop(item_id, None)
+        try:
+            self.flush()
+        except Exception:
+            # 반영 실패 -> 호출 측은 마감하지 않음(DB에서 계속 OPEN). 엔진에 되돌려 입찰을 계속 받음
+            # (이 아이템의 입찰이 격리됐으면 메모리 상태가 DB와 다르므로 되돌리지 않음)
+            if st is not None and item_id not in self._dead_items:
+                with self._lock:
+                    self._auctions.setdefault(item_id, st)
+            raise
+        return st
+
+    def close_or_raise(self, item_id: int) -> AuctionState | None:
+        # close / force-close 라우트용: 밀린 입찰을 반영하지 못하면 마감하지 않고 503 (아이템은 OPEN 그대로, 다시 시도 가능)
+        try:
+            return self.close(item_id)
+        except Exception:
+            logger.exception("auction engine flush failed while closing item %s", item_id)
+            raise AppError(
+                503, "SERVICE_UNAVAILABLE", "밀린 입찰을 반영하지 못해 마감하지 못했습니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": "1"},
+            )
+
+    def place(self, item_id: int, bidder_id: int, amount: int) -> AcceptedBid | None:
+        # 엔진이 들고 있지 않은 아이템이면 None (호출 측에서 DB 경로로 처리)
+        with self._lock:
+            st = self._auctions.get(item_id)
+            if st is None:
+                return None
+            if st.seller_id == bidder_id:
+                raise AppError(403, "FORBIDDEN", "판매자는 자기 아이템에 입찰할 수 없습니다.")
+            # DB 경로(apply_bids)와 같은 규칙: 마감 시각이 지났으면 expiry 스케줄러가 닫기 전이라도 거절
+            now = datetime.now(timezone.utc)
+            if auction_ended(st.ends_at, now):
+                raise AppError(409, "STATE_CONFLICT", "경매가 종료된 아이템입니다.", {"endsAt": st.ends_at.isoformat()})
+            min_bid = st.current_price + st.bid_unit
+            if amount < min_bid:
+                raise AppError(422, "UNPROCESSABLE_ENTITY", "입찰 금액이 너무 낮습니다.", {"minBid": min_bid})
+            if (amount - st.start_price) % st.bid_unit != 0:
+                raise AppError(422, "UNPROCESSABLE_ENTITY", "입찰 단위가 올바르지 않습니다.", {"bidUnit": st.bid_unit})
+
+            # 블록을 다 쓰면 여기서 DB 왕복 1번 (BID_ID_BLOCK_SIZE건마다)
+            bid = AcceptedBid(bid_ids.take(self._bind)[0], item_id, bidder_id, amount, now)
+            # WAL에 먼저 기록 -> 내구성 확보 후 메모리 상태 반영
+            self._wal.write(bid.to_wal())
+            self._wal.flush()
+            if self._fsync:
+                os.fsync(self._wal.fileno())
+
+            st.current_price = amount
+            st.top_bidder_id = bidder_id
+            st.bid_count += 1
+            self._pending.append(bid)
+            return bid
+
+    # ---------- 영속화 ----------
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch, self._pending = self._pending, []
+                self._seal_segment()
+                segments = list(self._sealed)
+
+            try:
+                self._write(batch)
+            except Exception:
+                self._failures += 1
+                if self._failures < self._max_flush_attempts:
+                    # 실패한 배치는 다음 flush에서 재시도 (WAL 세그먼트도 그대로 유지)
+                    with self._lock:
+                        self._pending[:0] = batch
+                    raise
+                logger.exception("auction engine flush failed %d times, retrying per item", self._failures)
+                self._write_per_item(batch)
+            self._failures = 0
+
+            with self._lock:
+                for path in segments:
+                    os.remove(path)
+                    self._sealed.remove(path)
+            return len(batch)
+
+    def _write(self, batch: list[AcceptedBid]):
+        # 아이템별 마지막 입찰 = 최종 현재가/최고 입찰자, 건수만큼 bid_count 증가
+        per_item = {}
+        for b in batch:
+            _, _, n = per_item.get(b.item_id, (0, 0, 0))
+            per_item[b.item_id] = (b.amount, b.bidder_id, n + 1)
+
+        db = self._session_factory()
+        try:
+            rows = [
+                {"id": b.id, "item_id": b.item_id, "bidder_id": b.bidder_id, "amount": b.amount, "created_at": b.created_at}
+                for b in batch
+            ]
+            for i in range(0, len(rows), self._flush_chunk):
+                db.execute(insert(Bid), rows[i:i + self._flush_chunk])
+            db.execute(
+                update(Item.__table__)
+                .where(Item.__table__.c.id == bindparam("_id"))
+                .values(
+                    current_price=bindparam("_price"),
+                    top_bidder_id=bindparam("_top"),
+                    bid_count=Item.__table__.c.bid_count + bindparam("_n"),
+                ),
+                [{"_id": k, "_price": p, "_top": t, "_n": n} for k, (p, t, n) in per_item.items()],
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _write_per_item(self, batch: list[AcceptedBid]):
+        # 연속 실패한 배치: 아이템별 트랜잭션으로 반영해서 실패 원인 아이템만 골라냄
+        per_item: dict[int, list[AcceptedBid]] = {}
+        for b in batch:
+            per_item.setdefault(b.item_id, []).append(b)
+        retry = []
+        for item_id, bids in per_item.items():
+            try:
+                self._write(bids)
+            except (IntegrityError, DataError):
+                # 다시 시도해도 같은 결과인 오류 (FK/제약 조건 등)
+                logger.exception("auction engine: moving %d bids of item %s to dead-letter", len(bids), item_id)
+                self._dead_letter(item_id, bids)
+            except Exception:
+                retry.extend(bids)
+        if retry:
+            # 연결 오류 등: 남은 입찰은 다시 pending으로 (세그먼트 유지, 다음 성공한 flush에서 정리)
+            with self._lock:
+                self._pending[:0] = retry
+            raise RuntimeError(f"auction engine flush failed for {len(retry)} bids")
+
+    def _dead_letter(self, item_id: int, bids: list[AcceptedBid]):
+        path = os.path.join(self._wal_dir, f"bids-{self._wal_seq:08d}.dead")
+        with open(path, "a", encoding="utf-8") as f:
+            f.writelines(b.to_wal() for b in bids)
+            f.flush()
+            if self._fsync:
+                os.fsync(f.fileno())
+        with self._lock:
+            # 메모리 상태에는 격리한 입찰이 반영되어 있으므로 엔진에서 내리고 이후 입찰은 DB 상태 기준으로
+            self._auctions.pop(item_id, None)
+            self._dead_items.add(item_id)
+        self.dead_lettered += len(bids)
+
+    def _run(self):
+        while not self._stop.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("auction engine flush failed (attempt %d)", self._failures)
+                # 실패가 이어지면 간격을 늘림 (최대 5초)
+                time.sleep(min(self._flush_interval * 2 ** self._failures, 5))
+
+    # ---------- WAL 세그먼트 ----------
+
+    @staticmethod
+    def _segment_seq(path: str) -> int:
+        return int(os.path.basename(path)[len("bids-"):-len(".wal")])
+
+    def _open_segment(self):
+        self._wal_seq += 1
+        path = os.path.join(self._wal_dir, f"bids-{self._wal_seq:08d}.wal")
+        self._wal = open(path, "a", encoding="utf-8")
+
+    def _seal_segment(self):
+        # 현재 세그먼트를 닫고(=flush 대상) 새 세그먼트로 교체, lock 안에서 호출
+        self._wal.close()
+        self._sealed.append(self._wal.name)
+        self._open_segment()
+
+
+auction_engine = AuctionEngine(
+    SessionLocal,
+    settings.auction_wal_dir,
+    flush_interval_ms=settings.auction_flush_interval_ms,
+    fsync=settings.auction_wal_fsync,
+    max_flush_attempts=settings.auction_flush_max_attempts,
+)
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+from collections import deque
+
+from app.core.config import settings
+
+# 아이템별 실시간 이벤트(새 최고가, 상태 변경)를 구독자에게 뿌리는 프로세스 내 pub/sub.
+# - 구독자는 자기 이벤트 루프에서만 큐를 만지고, 발행은 어느 스레드에서든 call_soon_threadsafe로 전달
+# - "all" 모드: 큐가 가득 차면(느린 소비자) 밀린 이벤트를 버리고 lagged 이벤트로 알린 뒤 최신 이벤트부터 다시
+# - "latest" 모드: 같은 type 이벤트는 최신 것 하나만 유지 (최신 가격만 필요한 클라이언트용)
+
+
+class Subscriber:
+    __slots__ = ("item_id", "loop", "latest_only", "maxlen", "events", "dropped", "wakeup")
+
+    def __init__(self, item_id: int, loop, latest_only: bool, maxlen: int):
+        self.item_id = item_id
+        self.loop = loop
+        self.latest_only = latest_only
+        self.maxlen = maxlen
+        self.events = deque()
+        self.dropped = 0
+        self.wakeup = asyncio.Event()
+
+    def push(self, event: dict):
+        # 구독자 루프 스레드에서만 호출됨
+        if self.latest_only:
+            for i, e in enumerate(self.events):
+                if e["type"] == event["type"]:
+                    del self.events[i]
+                    break
+        elif len(self.events) >= self.maxlen:
+            self.dropped += len(self.events)
+            self.events.clear()
+        self.events.append(event)
+        self.wakeup.set()
+
+    async def get(self, timeout: float) -> list[dict]:
+        # 이벤트가 없으면 timeout까지 대기, timeout이면 빈 리스트 (heartbeat 용)
+        if not self.events:
+            self.wakeup.clear()
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        out = []
+        if self.dropped:
+            out.append({"type": "lagged", "itemId": self.item_id, "dropped": self.dropped})
+            self.dropped = 0
+        out.extend(self.events)
+        self.events.clear()
+        return out
+
+
+class BidHub:
+    def __init__(self, queue_size: int = 64, max_subscribers: int = 10000):
+        self._queue_size = queue_size
+        self._max_subscribers = max_subscribers
+        self._subs: dict[int, set[Subscriber]] = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._count
+
+    def subscribe(self, item_id: int, latest_only: bool = False) -> Subscriber | None:
+        # 이벤트 루프 안에서 호출. 구독자 상한을 넘으면 None
+        sub = Subscriber(item_id, asyncio.get_running_loop(), latest_only, self._queue_size)
+        with self._lock:
+            if self._count >= self._max_subscribers:
+                return None
+            self._subs.setdefault(item_id, set()).add(sub)
+            self._count += 1
+        return sub
+
+    def unsubscribe(self, sub: Subscriber):
+        with self._lock:
+            subs = self._subs.get(sub.item_id)
+            if subs and sub in subs:
+                subs.discard(sub)
+                self._count -= 1
+                if not subs:
+                    del self._subs[sub.item_id]
+
+    def publish(self, item_id: int, event: dict):
+        with self._lock:
+            subs = list(self._subs.get(item_id, ()))
+        for sub in subs:
+            try:
+                sub.loop.call_soon_threadsafe(sub.push, event)
+            except RuntimeError:
+                # 루프가 이미 닫힘 (연결 종료 직후)
+                self.unsubscribe(sub)
+
+    def publish_bid(self, bid):
+        self.publish(bid.itemId, {"type": "bid", "itemId": bid.itemId, "highestBid": bid.amount, "bidderId": bid.bidderId})
+
+    def publish_status(self, item_id: int, status: str):
+        self.publish(item_id, {"type": "status", "itemId": item_id, "status": status})
+
+
+bid_hub = BidHub(queue_size=settings.stream_queue_size, max_subscribers=settings.stream_max_subscribers)
@@ -0,0 +1,131 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from app.core.config import settings
+from app.core.errors import AppError
+from app.db.session import SessionLocal
+from app.schemas.bid import BidRes
+from app.services.bidding import BidCommand, apply_bids
+from app.services.leaderboard import leaderboard
+
+# 입찰 group commit.
+# 몇 ms 안에 들어온 입찰들을 모아서 한 트랜잭션(한 번의 commit, multi-row INSERT)으로 처리한다.
+# 호출한 요청 스레드는 자기 입찰의 Future만 기다리고, 각자 BidRes 또는 AppError를 받는다.
+# 입찰 규칙은 apply_bids가 배치 안에서도 순서대로 적용하므로 단건 처리와 결과가 같다.
+# running 확인과 enqueue는 같은 lock 안에서 -> stop()의 종료 표시(None) 뒤에 요청이 남아 영원히 기다리지 않도록
+
+
+def _unavailable() -> AppError:
+    return AppError(
+        503, "SERVICE_UNAVAILABLE", "서버가 종료 중입니다. 잠시 후 다시 시도해 주세요.", headers={"Retry-After": "1"},
+    )
+
+
+class _Pending:
+    __slots__ = ("cmd", "future")
+
+    def __init__(self, cmd: BidCommand):
+        self.cmd = cmd
+        self.future = Future()
+
+
+class BidWriteCoalescer:
+    def __init__(self, session_factory, window_ms: int = 5, max_batch: int = 100):
+        self._session_factory = session_factory
+        self._window = window_ms / 1000
+        self._max_batch = max_batch
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self.running = False
+
+        # 통계 (배치 수 / 처리한 입찰 수)
+        self.batches = 0
+        self.bids = 0
+
+    def start(self):
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="bid-group-commit", daemon=True)
+        self._thread.start()
+        self.running = True
+
+    def stop(self):
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+            self._queue.put(None)
+        self._thread.join()
+        # 종료 표시 뒤에 남은 요청은 처리되지 않으므로 에러로 끝냄
+        while True:
+            try:
+                p = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if p is not None:
+                p.future.set_exception(_unavailable())
+
+    def submit(self, item_id: int, bidder_id: int, amount: int) -> BidRes:
+        p = _Pending(BidCommand(item_id, bidder_id, amount))
+        with self._lock:
+            if not self.running:
+                raise _unavailable()
+            self._queue.put(p)
+        return p.future.result()
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self._window
+            stopping = False
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    p = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if p is None:
+                    stopping = True
+                    break
+                batch.append(p)
+            self._process(batch)
+            if stopping:
+                break
+
+    def _process(self, batch: list[_Pending]):
+        db = self._session_factory()
+        counts: dict[int, int] = {}
+        try:
+            results = apply_bids(db, [p.cmd for p in batch], counts)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            for p in batch:
+                p.future.set_exception(e)
+            return
+        finally:
+            db.close()
+
+        leaderboard.record_many(counts)
+        self.batches += 1
+        self.bids += len(batch)
+        for p, r in zip(batch, results):
+            if isinstance(r, AppError):
+                p.future.set_exception(r)
+            else:
+                p.future.set_result(r)
+
+
+bid_writer = BidWriteCoalescer(
+    SessionLocal,
+    window_ms=settings.bid_batch_window_ms,
+    max_batch=settings.bid_batch_max_size,
+)
@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.errors import AppError
+from app.db.ids import IdAllocator
+from app.models.item import Item, ItemStatus
+from app.models.bid import Bid
+from app.schemas.bid import BidRes
+
+# 입찰 id는 autoincrement 대신 DB 카운터에서 (인메모리 엔진이 미리 발급한 id와 겹치지 않도록, app/db/ids.py)
+bid_ids = IdAllocator(Bid.__table__, settings.bid_id_block_size)
+
+def auction_ended(ends_at, now: datetime) -> bool:
+    # MySQL DATETIME / SQLite는 tz 없는 값으로 돌아오므로 UTC로 간주
+    if ends_at is None:
+        return False
+    if ends_at.tzinfo is None:
+        ends_at = ends_at.replace(tzinfo=timezone.utc)
+    return ends_at <= now
+
+@dataclass(frozen=True)
+class BidCommand:
+    item_id: int
+    bidder_id: int
+    amount: int
+
+# 입찰 여러 건을 한 트랜잭션 안에서 순서대로 검증/반영한다 (commit은 호출 측).
+# - 아이템은 IN (...) 한 번으로 읽고, 같은 아이템에 대한 입찰은 앞선 입찰가를 기준으로 검증
+# - 아이템당 조건부 UPDATE 1번: DB 현재가가 그 사이 바뀌었어도 첫 입찰이 여전히 유효할 때만 반영
+#   (아니면 그 아이템의 입찰은 모두 409)
+# - 수락된 입찰은 한 번의 flush로 insert (지원하는 DB에선 multi-row INSERT)
+# 결과는 cmds와 같은 순서의 BidRes 또는 AppError.
+# counts를 넘기면 입찰이 반영된 아이템의 갱신 후 bid_count(읽은 값 + 건수)를 채운다 (리더보드용, commit 후 반영)
+def apply_bids(db: Session, cmds: list[BidCommand], counts: dict[int, int] | None = None) -> list[BidRes | AppError]:
+    results: list[BidRes | AppError | None] = [None] * len(cmds)
+
+    item_ids = {c.item_id for c in cmds}
+    rows = db.execute(
+        select(
+            Item.id, Item.seller_id, Item.status, Item.start_price, Item.bid_unit, Item.current_price, Item.bid_count,
+            Item.ends_at,
+        )
+        .where(Item.id.in_(item_ids))
+    ).all()
+    items = {r.id: r for r in rows}
+
+    current = {r.id: r.current_price for r in rows}
+    now = datetime.now(timezone.utc)
+    accepted: dict[int, list[int]] = {}
+    for idx, c in enumerate(cmds):
+        it = items.get(c.item_id)
+        if not it:
+            results[idx] = AppError(404, "RESOURCE_NOT_FOUND", "아이템을 찾을 수 없습니다.")
+            continue
+        if it.status != ItemStatus.OPEN:
+            results[idx] = AppError(409, "STATE_CONFLICT", "경매 진행 중인 아이템만 입찰할 수 있습니다.")
+            continue
+        # 마감 시각이 지났지만 아직 expiry 스케줄러가 CLOSED로 바꾸지 않은 아이템
+        if auction_ended(it.ends_at, now):
+            results[idx] = AppError(409, "STATE_CONFLICT", "경매가 종료된 아이템입니다.", {"endsAt": it.ends_at.isoformat()})
+            continue
+        if it.seller_id == c.bidder_id:
+            results[idx] = AppError(403, "FORBIDDEN", "판매자는 자기 아이템에 입찰할 수 없습니다.")
+            continue
+
+        # 최소 입찰가 = 현재가 + bid_unit
+        min_bid = current[c.item_id] + it.bid_unit
+        if c.amount < min_bid:
+            results[idx] = AppError(422, "UNPROCESSABLE_ENTITY", "입찰 금액이 너무 낮습니다.", {"minBid": min_bid})
+            continue
+        # bid_unit 배수 검증
+        if (c.amount - it.start_price) % it.bid_unit != 0:
+            results[idx] = AppError(422, "UNPROCESSABLE_ENTITY", "입찰 단위가 올바르지 않습니다.", {"bidUnit": it.bid_unit})
+            continue
+
+        current[c.item_id] = c.amount
+        accepted.setdefault(c.item_id, []).append(idx)
+
+    # 이 트랜잭션이 쓰기 전에 예약 (조건부 UPDATE에서 빠지는 입찰의 id는 버려짐)
+    ids = iter(bid_ids.take(db.get_bind(), sum(map(len, accepted.values())))) if accepted else None
+    bids: list[tuple[int, Bid]] = []
+    for item_id, idxs in accepted.items():
+        first, last = cmds[idxs[0]], cmds[idxs[-1]]
+        # 조건부 UPDATE: 동시에 들어온 입찰은 행 잠금 순서대로 처리되고, 조건을 못 맞춘 쪽은 0 rows -> 409
+        res = db.execute(
+            update(Item)
+            .where(
+                Item.id == item_id,
+                Item.status == ItemStatus.OPEN,
+                Item.current_price + Item.bid_unit <= first.amount,
+            )
+            .values(current_price=last.amount, top_bidder_id=last.bidder_id, bid_count=Item.bid_count + len(idxs))
+            .execution_options(synchronize_session=False)
+        )
+        if res.rowcount != 1:
+            for idx in idxs:
+                results[idx] = AppError(409, "STATE_CONFLICT", "다른 입찰이 먼저 처리되었습니다. 다시 시도해 주세요.")
+            continue
+        if counts is not None:
+            counts[item_id] = items[item_id].bid_count + len(idxs)
+        for idx in idxs:
+            c = cmds[idx]
+            bids.append((idx, Bid(id=next(ids), item_id=c.item_id, bidder_id=c.bidder_id, amount=c.amount, created_at=now)))
+
+    if bids:
+        db.add_all([b for _, b in bids])
+        db.flush()
+        # commit 후 expire 되기 전에 응답 값을 만들어 둔다 (refresh 쿼리 방지)
+        for idx, b in bids:
+            results[idx] = BidRes(id=b.id, itemId=b.item_id, bidderId=b.bidder_id, amount=b.amount, createdAt=b.created_at)
+
+    return results
@@ -0,0 +1,73 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 목록 API의 totalElements용 COUNT 캐시 (자주 쓰는 필터 조합만: 전체 / 카테고리별 아이템 등)
+# - 처음 요청은 바로 세고, 이후엔 캐시 값을 반환
+# - ttl이 지나면 캐시 값을 그대로 돌려주면서 백그라운드 스레드 하나가 다시 센다 (요청은 COUNT를 기다리지 않음)
+# - 이 워커에서 일어난 생성/삭제는 invalidate로 바로 버림 -> 다음 요청이 다시 셈
+#   다른 워커의 변경은 최대 ttl만큼 늦게 반영되는 근사값
+# - ttl=0이면 캐시 끔 (매 요청 COUNT)
+
+
+class CountCache:
+    def __init__(self, ttl_sec: int = 30):
+        self._ttl = ttl_sec
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, tuple[int, float]] = {}
+        self._refreshing: set[tuple] = set()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="count-refresh")
+
+    def get(self, db: Session, key: tuple, stmt) -> int:
+        # stmt = SELECT count(...) 한 값을 돌려주는 쿼리
+        # 캐시에 넣는 값은 primary에서 (무효화 직후 레플리카의 예전 값이 TTL 동안 남지 않도록)
+        if self._ttl <= 0:
+            return db.scalar(stmt) or 0
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            stale = entry is not None and now - entry[1] >= self._ttl and key not in self._refreshing
+            if stale:
+                self._refreshing.add(key)
+        if entry is None:
+            value = db.scalar(stmt.execution_options(use_primary=True)) or 0
+            with self._lock:
+                self._entries[key] = (value, now)
+            return value
+        if stale:
+            # 요청 세션은 응답 후 닫히므로 같은 엔진으로 별도 세션을 연다
+            self._executor.submit(self._refresh, db.get_bind(), key, stmt)
+        return entry[0]
+
+    def invalidate(self, *keys: tuple):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _refresh(self, bind, key: tuple, stmt):
+        try:
+            with Session(bind=bind) as db:
+                value = db.scalar(stmt) or 0
+            with self._lock:
+                # 세는 동안 invalidate됐으면 버림 (다음 요청이 새로 셈)
+                if key in self._entries:
+                    self._entries[key] = (value, time.monotonic())
+        except Exception:
+            logger.exception("count refresh failed: %s", key)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+count_cache = CountCache(ttl_sec=settings.count_cache_ttl_sec)
@@ -0,0 +1,201 @@
+import heapq
+import logging
+import threading
+from datetime import datetime, timezone, timedelta
+
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.item import Item, ItemStatus
+from app.services.auction_engine import auction_engine
+from app.services.bid_hub import bid_hub
+from app.services.response_cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+# ends_at이 지난 OPEN 아이템을 CLOSED로 바꾸는 백그라운드 스케줄러.
+# - (ends_at, item_id) min-heap에 "앞으로 lookahead 안에 끝나는" 아이템만 올려둔다
+#   (ix_items_ends_at 범위 스캔으로 채움 -> 메모리는 가까운 마감분만큼만 사용)
+# - resync 주기마다 다시 채우므로 다른 워커에서 publish된 아이템도 잡힌다
+# - 마감은 WHERE status=OPEN AND ends_at<=now 조건부 bulk UPDATE라 여러 워커가 동시에 돌아도 안전
+#   (MySQL에선 FOR UPDATE SKIP LOCKED로 서로 같은 행을 기다리지 않음)
+
+
+def _ts(dt: datetime) -> float:
+    # MySQL DATETIME / SQLite는 tz 없는 값으로 돌아오므로 UTC로 간주
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class ExpiryScheduler:
+    def __init__(self, session_factory, batch_size: int = 500, resync_sec: int = 30):
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._resync_sec = resync_sec
+        self._lookahead = timedelta(seconds=resync_sec * 2)
+
+        self._lock = threading.Lock()
+        self._heap: list[tuple[float, int]] = []
+        self._scheduled: set[int] = set()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self.running = False
+
+        # 지연 지표: 마지막으로 닫은 배치에서 가장 늦게 닫힌 아이템이 ends_at보다 몇 초 늦었는지
+        self.last_lag_sec = 0.0
+        self.closed_total = 0
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="expiry-scheduler", daemon=True)
+        self._thread.start()
+        self.running = True
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        self._stop.set()
+        self._wakeup.set()
+        self._thread.join()
+
+    def schedule(self, item_id: int, ends_at: datetime):
+        # publish 직후 호출. lookahead 밖이면 다음 resync 때 올라옴
+        if ends_at is None or _ts(ends_at) > (datetime.now(timezone.utc) + self._lookahead).timestamp():
+            return
+        with self._lock:
+            self._push(_ts(ends_at), item_id)
+        self._wakeup.set()
+
+    def rebuild(self):
+        now = datetime.now(timezone.utc)
+        db = self._session_factory()
+        try:
+            rows = db.execute(
+                select(Item.id, Item.ends_at)
+                .where(Item.status == ItemStatus.OPEN, Item.ends_at <= now + self._lookahead)
+                .order_by(Item.ends_at)
+            ).all()
+        finally:
+            db.close()
+        with self._lock:
+            for item_id, ends_at in rows:
+                self._push(_ts(ends_at), item_id)
+
+    def lag_seconds(self) -> float:
+        # 지금 기준으로 마감 시각이 지났는데 아직 처리 안 된 가장 오래된 아이템의 지연
+        with self._lock:
+            if not self._heap:
+                return 0.0
+            due = self._heap[0][0]
+        return max(0.0, datetime.now(timezone.utc).timestamp() - due)
+
+    def stats(self) -> dict:
+        return {
+            "running": self.running,
+            "scheduled": len(self._heap),
+            "lagSeconds": round(self.lag_seconds(), 3),
+            "lastLagSeconds": round(self.last_lag_sec, 3),
+            "closedTotal": self.closed_total,
+        }
+
+    def run_once(self, now: datetime | None = None) -> list[int]:
+        # 마감 시각이 지난 아이템을 batch_size씩 닫고, 실제로 닫힌 id 목록 반환
+        now = now or datetime.now(timezone.utc)
+        closed: list[int] = []
+        while True:
+            with self._lock:
+                due = []
+                while self._heap and self._heap[0][0] <= now.timestamp() and len(due) < self._batch_size:
+                    ts, item_id = heapq.heappop(self._heap)
+                    self._scheduled.discard(item_id)
+                    due.append((ts, item_id))
+            if not due:
+                return closed
+
+            ids = [item_id for _, item_id in due]
+            # 인메모리 엔진이 들고 있으면 먼저 내려서 입찰을 막고 밀린 입찰 반영
+            if auction_engine.running:
+                try:
+                    for item_id in ids:
+                        auction_engine.close(item_id)
+                except Exception:
+                    # 밀린 입찰 반영 실패 -> 마감하지 않고 다음 턴에 다시 시도
+                    with self._lock:
+                        for ts, item_id in due:
+                            self._push(ts, item_id)
+                    raise
+
+            db = self._session_factory()
+            try:
+                done = db.scalars(
+                    select(Item.id)
+                    .where(Item.id.in_(ids), Item.status == ItemStatus.OPEN, Item.ends_at <= now)
+                    .with_for_update(skip_locked=True)
+                ).all()
+                if done:
+                    db.execute(
+                        update(Item)
+                        .where(Item.id.in_(done), Item.status == ItemStatus.OPEN)
+                        .values(status=ItemStatus.CLOSED)
+                        .execution_options(synchronize_session=False)
+                    )
+                db.commit()
+            except Exception:
+                db.rollback()
+                # 다음 턴에 다시 시도
+                with self._lock:
+                    for ts, item_id in due:
+                        self._push(ts, item_id)
+                raise
+            finally:
+                db.close()
+
+            done_set = set(done)
+            if done_set:
+                self.last_lag_sec = max(now.timestamp() - ts for ts, item_id in due if item_id in done_set)
+                self.closed_total += len(done_set)
+            if done:
+                response_cache.invalidate("items", *[f"item:{item_id}" for item_id in done])
+            for item_id in done:
+                bid_hub.publish_status(item_id, ItemStatus.CLOSED.value)
+            closed.extend(done)
+
+    def _push(self, ts: float, item_id: int):
+        # lock 안에서 호출
+        if item_id in self._scheduled:
+            return
+        self._scheduled.add(item_id)
+        heapq.heappush(self._heap, (ts, item_id))
+
+    def _run(self):
+        next_resync = 0.0
+        while not self._stop.is_set():
+            now = datetime.now(timezone.utc).timestamp()
+            try:
+                if now >= next_resync:
+                    next_resync = now + self._resync_sec
+                    self.rebuild()
+                self.run_once()
+            except Exception:
+                logger.exception("expiry scheduler iteration failed")
+                # DB 장애 시 바로 재시도하며 부하를 키우지 않도록 잠깐 쉼
+                self._stop.wait(1.0)
+
+            with self._lock:
+                next_due = self._heap[0][0] if self._heap else next_resync
+            timeout = max(0.0, min(next_due, next_resync) - datetime.now(timezone.utc).timestamp())
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+
+
+expiry_scheduler = ExpiryScheduler(
+    SessionLocal,
+    batch_size=settings.expiry_batch_size,
+    resync_sec=settings.expiry_resync_sec,
+)
@@ -0,0 +1,150 @@
+import heapq
+import logging
+import threading
+
+from sqlalchemy import select, update, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.bid import Bid
+from app.models.item import Item
+
+logger = logging.getLogger(__name__)
+
+# 입찰 수 상위 K개 아이템 (GET /stats/items/top-bid-count).
+# - 원본 카운터: items.bid_count (입찰과 같은 트랜잭션에서 증가, ix_items_bid_count)
+# - 메모리: item_id -> bid_count, 최대 K개 + (bid_count, item_id) min-heap. 입찰 commit 후 record()로 갱신
+#   밖에 있는 아이템의 수는 항상 안쪽 최솟값 이하 -> 새 값이 최솟값(heap[0])보다 크면 최솟값을 내보내고 들어옴
+#   값이 바뀐 아이템은 새 항목을 push하고 예전 항목은 꺼낼 때 버림 (dict 값과 다르면 지난 항목)
+#   -> 입찰당 O(log K). 지난 항목이 K의 2배를 넘으면 dict에서 heap을 다시 만듦
+# - 같은 수면 id가 큰(최근) 아이템 우선 (DB 쪽 ORDER BY bid_count DESC, id DESC 인덱스 순서와 맞춤)
+# - 값은 단조 증가이므로 max로만 반영 (동시 입찰에서 조금 작게 들어온 값은 다음 입찰/resync에서 보정)
+# - 다른 워커의 입찰은 resync_sec마다 DB 상위 K개(인덱스 범위 스캔)로 교체해서 반영
+#   (인메모리 엔진의 아직 flush 안 된 입찰은 그 사이 잠깐 빠질 수 있으나 다음 입찰에서 다시 반영)
+
+class Leaderboard:
+    def __init__(self, session_factory, size: int = 50, resync_sec: int = 30):
+        self._session_factory = session_factory
+        self._size = size
+        self._resync_sec = resync_sec
+        self._lock = threading.Lock()
+        self._top: dict[int, int] = {}
+        self._heap: list[tuple[int, int]] = []  # (bid_count, item_id), 지난 항목 포함
+        self._stop = threading.Event()
+        self._thread = None
+        self.running = False
+
+    def start(self):
+        if self.running:
+            return
+        try:
+            self.load()
+        except Exception:
+            logger.exception("leaderboard load failed")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="leaderboard-resync", daemon=True)
+        self._thread.start()
+        self.running = True
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        self._stop.set()
+        self._thread.join()
+
+    def record(self, item_id: int, bid_count: int):
+        with self._lock:
+            self._record(item_id, bid_count)
+
+    def record_many(self, counts: dict[int, int]):
+        with self._lock:
+            for item_id, bid_count in counts.items():
+                self._record(item_id, bid_count)
+
+    def top(self, limit: int) -> list[tuple[int, int]]:
+        with self._lock:
+            entries = list(self._top.items())
+        entries.sort(key=lambda e: (-e[1], -e[0]))
+        return entries[:limit]
+
+    def load(self):
+        # DB 상위 K개로 교체 (rebuild 결과도 이걸로 다른 워커에 반영됨)
+        db = self._session_factory()
+        try:
+            self._replace(self._read_top(db))
+        finally:
+            db.close()
+
+    def rebuild(self, db: Session) -> int:
+        # items.bid_count를 bids에서 다시 계산(commit 포함) 후 상위 K개 재로드. 값이 바뀐 아이템 수 반환
+        counted = select(func.count(Bid.id)).where(Bid.item_id == Item.id).scalar_subquery()
+        res = db.execute(
+            update(Item)
+            .where(Item.bid_count != counted)
+            .values(bid_count=counted)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        self._replace(self._read_top(db))
+        return res.rowcount
+
+    def stats(self) -> dict:
+        return {"running": self.running, "size": len(self._top), "capacity": self._size}
+
+    def _read_top(self, db: Session) -> dict[int, int]:
+        rows = db.execute(
+            select(Item.id, Item.bid_count)
+            .where(Item.bid_count > 0)
+            .order_by(Item.bid_count.desc(), Item.id.desc())
+            .limit(self._size)
+        ).all()
+        return {item_id: n for item_id, n in rows}
+
+    def _replace(self, fresh: dict[int, int]):
+        heap = [(n, item_id) for item_id, n in fresh.items()]
+        heapq.heapify(heap)
+        with self._lock:
+            self._top = fresh
+            self._heap = heap
+
+    def _record(self, item_id: int, bid_count: int):
+        # lock 안에서 호출
+        top, heap = self._top, self._heap
+        cur = top.get(item_id)
+        if cur is not None:
+            if bid_count > cur:
+                top[item_id] = bid_count
+                self._push(bid_count, item_id)
+            return
+        if len(top) < self._size:
+            top[item_id] = bid_count
+            self._push(bid_count, item_id)
+            return
+        if not top:
+            return
+        # 맨 앞의 지난 항목을 버려서 heap[0] = 안쪽 최솟값
+        while top.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        low_n, low_id = heap[0]
+        if bid_count > low_n:
+            del top[low_id]
+            top[item_id] = bid_count
+            heapq.heapreplace(heap, (bid_count, item_id))
+
+    def _push(self, bid_count: int, item_id: int):
+        heapq.heappush(self._heap, (bid_count, item_id))
+        if len(self._heap) > 2 * self._size + 16:
+            self._heap = [(n, i) for i, n in self._top.items()]
+            heapq.heapify(self._heap)
+
+    def _run(self):
+        while not self._stop.wait(self._resync_sec):
+            try:
+                self.load()
+            except Exception:
+                logger.exception("leaderboard resync failed")
+
+
+leaderboard = Leaderboard(SessionLocal, size=settings.leaderboard_size, resync_sec=settings.leaderboard_resync_sec)
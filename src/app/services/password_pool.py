@@ -0,0 +1,96 @@
+import multiprocessing
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from app.core.config import settings
+from app.core.errors import AppError
+from app.core.security import hash_password, verify_password
+
+# bcrypt 해시/검증 전용 프로세스 풀.
+# - bcrypt 한 번에 CPU 수백 ms -> 요청 스레드에서 돌리면 같은 워커의 입찰 요청까지 밀리므로 별도 프로세스에서 계산
+# - 대기 + 처리 중인 작업 수를 max_pending으로 제한. 꽉 차면 기다리지 않고 바로 503 + Retry-After
+#   (로그인 폭주 시 threadpool 슬롯을 최대 max_pending개만 점유)
+# - workers=0 이면 풀 없이 요청 스레드에서 바로 계산 (기본값, 테스트)
+
+
+def _noop():
+    return None
+
+
+class PasswordPool:
+    def __init__(self, workers: int = 0, max_pending: int = 16):
+        self._workers = workers
+        self._max_pending = max_pending
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._latencies = deque(maxlen=1000)
+        self.running = False
+        self.completed = 0
+        self.rejected = 0
+
+    def start(self):
+        if self.running or self._workers <= 0:
+            return
+        # fork는 부모의 스레드/DB 커넥션 상태를 복사하므로 spawn
+        self._executor = ProcessPoolExecutor(max_workers=self._workers, mp_context=multiprocessing.get_context("spawn"))
+        # 첫 로그인에서 프로세스 기동 비용을 내지 않도록 미리 띄움
+        for f in [self._executor.submit(_noop) for _ in range(self._workers)]:
+            f.result()
+        self.running = True
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def hash(self, password: str) -> str:
+        return self._run(hash_password, password)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return self._run(verify_password, password, hashed)
+
+    def stats(self) -> dict:
+        lat = sorted(self._latencies)
+        q = statistics.quantiles(lat, n=100) if len(lat) >= 2 else [lat[0] if lat else 0.0] * 99
+        return {
+            "running": self.running,
+            "workers": self._workers,
+            "pending": self._pending,
+            # 프로세스가 비기를 기다리는 작업 수
+            "queued": max(0, self._pending - self._workers),
+            "maxPending": self._max_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "p50Ms": round(q[49] * 1000, 1),
+            "p95Ms": round(q[94] * 1000, 1),
+        }
+
+    def _run(self, fn, *args):
+        if not self.running:
+            return fn(*args)
+
+        with self._lock:
+            if self._pending >= self._max_pending:
+                self.rejected += 1
+                raise AppError(
+                    503, "SERVICE_UNAVAILABLE", "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+
+        started = time.perf_counter()
+        try:
+            return self._executor.submit(fn, *args).result()
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self.completed += 1
+                self._latencies.append(time.perf_counter() - started)
+
+
+password_pool = PasswordPool(workers=settings.password_pool_workers, max_pending=settings.password_pool_max_pending)
@@ -0,0 +1,101 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.core.bus import bus
+from app.core.config import settings
+from app.core.errors import AppError
+from app.models.user import User, UserRole, UserStatus
+
+# 인증된 사용자(principal) 캐시: get_current_user가 매 요청 users 테이블을 읽지 않도록.
+# - user_id -> Principal, 크기 상한 LRU + TTL (TTL은 무효화 메시지를 놓쳤을 때의 최후 보루)
+# - 사용자 정보/권한이 바뀌는 곳(비활성화, 닉네임/비밀번호 변경)은 invalidate 호출 -> 버스로 모든 워커에 전달
+# - epoch: 무효화가 일어날 때마다 증가. DB를 읽기 전 epoch를 잡아두고, 읽는 사이 무효화가 있었으면 캐시에 넣지 않음
+#   (읽기 직후 비활성화된 사용자가 ACTIVE로 다시 캐시되는 경쟁 방지)
+
+CHANNEL = "principal"
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    id: int
+    email: str
+    nickname: str
+    role: UserRole
+    status: UserStatus
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, email=user.email, nickname=user.nickname, role=user.role, status=user.status)
+
+
+class PrincipalCache:
+    def __init__(self, max_size: int = 10000, ttl_sec: int = 60):
+        self._max_size = max_size
+        self._ttl = ttl_sec
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, tuple[Principal, float]] = OrderedDict()
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0 and self._max_size > 0
+
+    def epoch(self) -> int:
+        return self._epoch
+
+    def get(self, user_id: int) -> Principal | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[1] <= now:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, principal: Principal, epoch: int):
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            self._entries[principal.id] = (principal, time.monotonic() + self._ttl)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def drop(self, user_id: int | None):
+        # 버스 핸들러 (None = 전체 비움)
+        with self._lock:
+            self._epoch += 1
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+    def invalidate(self, user_id: int, attempts: int = 3) -> bool:
+        # DB commit 이후 호출. 모든 워커가 반영했는지 여부 반환 (LocalBus는 항상 True)
+        # ack 타임아웃/전송 실패면 다시 전송 (drop은 여러 번 받아도 같음)
+        for _ in range(attempts):
+            if bus.publish(CHANNEL, {"userId": user_id}, wait=True):
+                return True
+        return False
+
+    def invalidate_or_raise(self, user_id: int):
+        # 모든 워커 반영을 확인하지 못하면 ok 대신 503: 변경은 저장됐지만 다른 워커가 TTL 동안 예전 principal을 쓸 수 있음
+        # (같은 요청을 다시 보내면 다시 무효화하므로 멱등한 변경에만 사용)
+        if not self.invalidate(user_id):
+            raise AppError(
+                503, "SERVICE_UNAVAILABLE", "변경 사항을 모든 서버에 반영하지 못했습니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": "1"},
+            )
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+principal_cache = PrincipalCache(max_size=settings.principal_cache_size, ttl_sec=settings.principal_cache_ttl_sec)
+bus.subscribe(CHANNEL, lambda m: principal_cache.drop(m["userId"] if m else None))
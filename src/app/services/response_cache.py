@@ -0,0 +1,214 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from app.core.bus import bus
+from app.core.config import settings
+from app.db.replicas import primary_reads
+
+logger = logging.getLogger(__name__)
+
+# 조회 API 응답 캐시 (stale-while-revalidate + single-flight + 태그 무효화).
+# - 키: 라우트 이름 + 정규화된 쿼리 파라미터 (key("items", page=0, ...) -> "items?page=0&...")
+# - ttl 안: 캐시 값 그대로
+# - ttl ~ ttl+stale_ttl: 캐시 값을 바로 돌려주고 백그라운드 스레드 하나가 다시 읽음
+# - 그 이후/없음: 동시에 들어온 같은 키 요청은 한 번만 DB를 읽고 결과를 같이 받음 (single-flight)
+# - 태그: 항목마다 저장 시점의 태그 버전을 같이 저장. invalidate(tag)는 버전만 올림
+#   버전이 달라진 항목은 stale로도 쓰지 않음 (쓰기 직후 조회에 예전 값이 나오지 않도록)
+# - backend: 프로세스 메모리(기본, 무효화는 버스로 다른 워커에 전달) / Redis(RESPONSE_CACHE_URL, 워커 공유)
+
+CHANNEL = "response-cache"
+
+
+class MemoryBackend:
+    shared = False
+
+    def __init__(self, max_entries: int = 10000):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._tags: dict[str, int] = {}
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: tuple, expire_sec: float):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def tag_versions(self, tags: tuple) -> tuple:
+        return tuple(self._tags.get(t, 0) for t in tags)
+
+    def bump(self, tags):
+        with self._lock:
+            for t in tags:
+                self._tags[t] = self._tags.get(t, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    shared = True
+
+    def __init__(self, url: str):
+        import redis  # 선택 의존성 (RESPONSE_CACHE_URL=redis://... 일 때만 필요)
+
+        self._redis = redis.Redis.from_url(url)
+        self._prefix = f"{settings.app_name}:rc:"
+
+    def get(self, key: str):
+        raw = self._redis.get(self._prefix + key)
+        if raw is None:
+            return None
+        value, stored_at, versions = json.loads(raw)
+        return value, stored_at, tuple(versions)
+
+    def set(self, key: str, entry: tuple, expire_sec: float):
+        self._redis.set(self._prefix + key, json.dumps(entry), ex=max(1, int(expire_sec)))
+
+    def tag_versions(self, tags: tuple) -> tuple:
+        if not tags:
+            return ()
+        return tuple(int(v or 0) for v in self._redis.mget([self._prefix + "tag:" + t for t in tags]))
+
+    def bump(self, tags):
+        pipe = self._redis.pipeline()
+        for t in tags:
+            pipe.incr(self._prefix + "tag:" + t)
+        pipe.execute()
+
+    def clear(self):
+        pass
+
+
+class ResponseCache:
+    def __init__(self, backend, enabled: bool = True):
+        self._backend = backend
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self._refreshing: set[str] = set()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="response-cache")
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(name: str, **params) -> str:
+        # None 파라미터는 빼고 이름순 정렬 -> 같은 의미의 요청은 같은 키
+        qs = "&".join(f"{k}={params[k]}" for k in sorted(params) if params[k] is not None)
+        return f"{name}?{qs}"
+
+    def get_or_load(
+        self, db: Session, key: str, loader, ttl: float, stale_ttl: float = 0, tags: tuple = (),
+    ):
+        # loader(db) -> 응답 값. 캐시에는 JSON으로 바꿀 수 있는 형태로 저장하고 그 값을 반환
+        if not self.enabled:
+            return loader(db)
+
+        now = time.time()
+        entry = self._backend.get(key)
+        if entry is not None:
+            value, stored_at, versions = entry
+            if versions == self._backend.tag_versions(tags):
+                age = now - stored_at
+                if age < ttl:
+                    self.hits += 1
+                    return value
+                if age < ttl + stale_ttl:
+                    self.stale_hits += 1
+                    self._refresh_later(db.get_bind(), key, loader, ttl, stale_ttl, tags)
+                    return value
+
+        self.misses += 1
+        return self._load_once(key, lambda: self._load(db, key, loader, ttl, stale_ttl, tags))
+
+    def invalidate(self, *tags: str):
+        if not self.enabled or not tags:
+            return
+        if self._backend.shared:
+            self._backend.bump(tags)
+        else:
+            # 이 워커는 publish 안에서 바로 반영, 다른 워커는 버스로
+            bus.publish(CHANNEL, {"tags": list(tags)})
+
+    def stats(self) -> dict:
+        return {"enabled": self.enabled, "hits": self.hits, "staleHits": self.stale_hits, "misses": self.misses}
+
+    def _load(self, db: Session, key: str, loader, ttl: float, stale_ttl: float, tags: tuple):
+        # 읽기 전 태그 버전을 잡아둠 -> 읽는 도중 invalidate되면 저장된 항목은 다음 조회에서 무효
+        versions = self._backend.tag_versions(tags)
+        # 캐시를 채우는 조회는 primary에서 (무효화 직후 레플리카의 예전 값이 캐시에 들어가면 쓴 사람도 예전 값을 봄)
+        with primary_reads(db):
+            value = jsonable_encoder(loader(db))
+        self._backend.set(key, (value, time.time(), versions), ttl + stale_ttl)
+        return value
+
+    def _load_once(self, key: str, fn):
+        with self._lock:
+            fut = self._inflight.get(key)
+            owner = fut is None
+            if owner:
+                fut = Future()
+                self._inflight[key] = fut
+        if not owner:
+            return fut.result()
+        try:
+            value = fn()
+            fut.set_result(value)
+            return value
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _refresh_later(self, bind, key: str, loader, ttl: float, stale_ttl: float, tags: tuple):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        self._executor.submit(self._refresh, bind, key, loader, ttl, stale_ttl, tags)
+
+    def _refresh(self, bind, key: str, loader, ttl: float, stale_ttl: float, tags: tuple):
+        try:
+            # 요청 세션은 이미 닫혔을 수 있으므로 같은 엔진으로 별도 세션
+            with Session(bind=bind) as db:
+                self._load_once(key, lambda: self._load(db, key, loader, ttl, stale_ttl, tags))
+        except Exception:
+            logger.exception("response cache refresh failed: %s", key)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _on_message(self, message: dict | None):
+        if message is None:
+            self._backend.clear()
+            return
+        self._backend.bump(message["tags"])
+
+
+def make_backend(url: str):
+    if url.startswith(("redis://", "rediss://")):
+        return RedisBackend(url)
+    return MemoryBackend(max_entries=settings.response_cache_max_entries)
+
+
+response_cache = ResponseCache(make_backend(settings.response_cache_url), enabled=settings.response_cache_enabled)
+bus.subscribe(CHANNEL, response_cache._on_message)
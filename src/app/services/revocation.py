@@ -0,0 +1,168 @@
+import hashlib
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import select, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.bus import bus
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.revoked_token import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+# 서버측 토큰 폐기 목록 (로그아웃 / refresh 회전).
+# - 원본: revoked_tokens 테이블 (jti, expires_at). 새 워커는 시작 시 만료 안 된 것만 읽어옴
+# - 메모리: Bloom filter + 정확한 dict(jti -> 만료 시각)
+#   대부분의 요청(폐기 안 된 토큰)은 Bloom filter에서 "없음"으로 끝나므로 해시 몇 번이면 판정 완료,
+#   Bloom이 "있을 수도"라고 할 때만 dict 확인 (오탐은 dict가 걸러냄)
+# - 다른 워커에는 버스로 전달, 버스 리셋(메시지 유실 가능) 시 DB에서 다시 읽음
+# - 만료된 항목은 purge 때 dict에서 지우고 Bloom을 다시 만듦 (Bloom은 삭제 불가)
+# - DB의 만료된 행은 revoke한 워커가 purge 주기마다 chunk 단위로 삭제 (버스로 받은 워커는 DB를 건드리지 않음)
+#   refresh 회전마다 행이 쌓이므로 시작 시 load()에서만 지우면 테이블이 계속 커짐
+
+CHANNEL = "revocation"
+
+
+def _ts(dt: datetime) -> float:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class BloomFilter:
+    def __init__(self, bits: int, hashes: int):
+        self._bits = bits
+        self._hashes = hashes
+        self._arr = bytearray((bits + 7) // 8)
+
+    def _positions(self, key: str):
+        # double hashing: h1 + i*h2
+        d = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        return [(h1 + i * h2) % self._bits for i in range(self._hashes)]
+
+    def add(self, key: str):
+        for p in self._positions(key):
+            self._arr[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, key: str) -> bool:
+        arr = self._arr
+        return all(arr[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+
+class RevocationList:
+    def __init__(self, session_factory, bloom_bits: int = 1 << 20, bloom_hashes: int = 7, purge_sec: int = 300):
+        self._session_factory = session_factory
+        self._bloom_bits = bloom_bits
+        self._bloom_hashes = bloom_hashes
+        self._purge_sec = purge_sec
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(bloom_bits, bloom_hashes)
+        self._exact: dict[str, float] = {}
+        self._next_purge = time.time() + purge_sec
+        self._next_db_purge = time.time() + purge_sec
+
+    def is_revoked(self, jti: str | None) -> bool:
+        # 요청마다 호출되는 경로: 락 없이 읽기만
+        if not jti or jti not in self._bloom:
+            return False
+        exp = self._exact.get(jti)
+        return exp is not None and exp > time.time()
+
+    def revoke(self, db: Session, jti: str, expires_at: datetime) -> bool:
+        # DB에 기록(commit 포함) 후 모든 워커에 전달. 이미 폐기된 jti면 False (refresh 재사용 감지에 사용)
+        db.add(RevokedToken(jti=jti, expires_at=expires_at))
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return False
+        bus.publish(CHANNEL, {"jti": jti, "exp": _ts(expires_at)}, wait=True)
+        if time.time() >= self._next_db_purge:
+            self._purge_db(db)
+        return True
+
+    def _purge_db(self, db: Session, chunk: int = 1000) -> int:
+        # 만료된 행 삭제 (ix_revoked_tokens_expires_at 범위 스캔). 실패해도 폐기 자체는 이미 반영됨
+        self._next_db_purge = time.time() + self._purge_sec
+        now = datetime.now(timezone.utc)
+        deleted = 0
+        try:
+            while True:
+                jtis = db.scalars(select(RevokedToken.jti).where(RevokedToken.expires_at <= now).limit(chunk)).all()
+                if jtis:
+                    db.execute(delete(RevokedToken).where(RevokedToken.jti.in_(jtis)))
+                    db.commit()
+                    deleted += len(jtis)
+                if len(jtis) < chunk:
+                    return deleted
+        except Exception:
+            db.rollback()
+            logger.exception("revoked token purge failed")
+            return deleted
+
+    def load(self):
+        # 시작 시 / 버스 리셋 시 DB에서 만료 안 된 항목 전체 로드
+        db = self._session_factory()
+        try:
+            now = datetime.now(timezone.utc)
+            db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+            db.commit()
+            rows = db.execute(select(RevokedToken.jti, RevokedToken.expires_at)).all()
+        finally:
+            db.close()
+        self._rebuild({jti: _ts(exp) for jti, exp in rows})
+
+    def stats(self) -> dict:
+        return {"size": len(self._exact)}
+
+    def _add(self, jti: str, exp: float):
+        with self._lock:
+            self._exact[jti] = exp
+            self._bloom.add(jti)
+        if time.time() >= self._next_purge:
+            self._purge()
+
+    def _purge(self):
+        now = time.time()
+        self._next_purge = now + self._purge_sec
+        with self._lock:
+            alive = {jti: exp for jti, exp in self._exact.items() if exp > now}
+        self._rebuild(alive)
+
+    def _rebuild(self, entries: dict[str, float]):
+        bloom = BloomFilter(self._bloom_bits, self._bloom_hashes)
+        for jti in entries:
+            bloom.add(jti)
+        with self._lock:
+            # 새 Bloom을 먼저 채운 뒤 교체 -> 교체 중에도 조회는 항상 완전한 필터를 봄
+            # (dict는 새로 만들어 교체하고, 그 사이 _add된 항목은 양쪽에 넣음)
+            for jti, exp in self._exact.items():
+                if jti not in entries and exp > time.time():
+                    entries[jti] = exp
+                    bloom.add(jti)
+            self._exact = entries
+            self._bloom = bloom
+
+    def _on_message(self, message: dict | None):
+        if message is None:
+            try:
+                self.load()
+            except Exception:
+                logger.exception("revocation reload failed")
+            return
+        self._add(message["jti"], message["exp"])
+
+
+revocation_list = RevocationList(
+    SessionLocal,
+    bloom_bits=settings.revocation_bloom_bits,
+    bloom_hashes=settings.revocation_bloom_hashes,
+)
+bus.subscribe(CHANNEL, revocation_list._on_message)
@@ -0,0 +1,92 @@
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import select, delete, insert, func
+from sqlalchemy.orm import Session
+
+from app.models.daily_sales import DailySales
+from app.models.order import Order, OrderStatus
+
+# 일별 매출 롤업 (daily_sales) 유지.
+# - 주문 상태가 집계 대상(PAID/SHIPPED/COMPLETED)으로 들어오면 +, 빠지면(취소 등) - 를 그 날짜 행에 upsert
+#   (같은 트랜잭션, commit은 호출 측). 날짜는 주문 created_at의 UTC 날짜
+# - upsert는 DB별 구문 (MySQL: ON DUPLICATE KEY UPDATE, SQLite/PostgreSQL: ON CONFLICT DO UPDATE)이라
+#   같은 날짜에 동시에 반영돼도 행 단위로 원자적으로 더해짐
+# - rebuild_range: 범위를 orders에서 다시 집계해서 덮어씀 (orders.created_at 범위 스캔)
+
+COUNTED = (OrderStatus.PAID, OrderStatus.SHIPPED, OrderStatus.COMPLETED)
+
+
+def _day(dt: datetime) -> date:
+    # MySQL DATETIME / SQLite는 tz 없는 UTC 값으로 돌아옴
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.date()
+
+
+def _upsert(db: Session, day: date, sales: int, orders: int):
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(DailySales).values(day=day, sales=sales, orders=orders)
+        stmt = stmt.on_duplicate_key_update(
+            sales=DailySales.sales + stmt.inserted.sales,
+            orders=DailySales.orders + stmt.inserted.orders,
+        )
+    else:
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(DailySales).values(day=day, sales=sales, orders=orders)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DailySales.day],
+            set_={"sales": DailySales.sales + stmt.excluded.sales, "orders": DailySales.orders + stmt.excluded.orders},
+        )
+    db.execute(stmt)
+
+
+def record_status_change(db: Session, order: Order, old: OrderStatus | None, new: OrderStatus):
+    # old=None: 새 주문
+    was, now = old in COUNTED, new in COUNTED
+    if was == now:
+        return
+    sign = 1 if now else -1
+    _upsert(db, _day(order.created_at), sign * order.total_price, sign)
+
+
+def rebuild_range(db: Session, start: date, end: date) -> int:
+    # [start, end) 날짜의 롤업을 orders에서 다시 계산 (commit 포함). 만든 행 수 반환
+    lo = datetime(start.year, start.month, start.day)
+    hi = datetime(end.year, end.month, end.day)
+    day = func.date(Order.created_at)
+    rows = db.execute(
+        select(day, func.sum(Order.total_price), func.count(Order.id))
+        .where(Order.created_at >= lo, Order.created_at < hi, Order.status.in_(COUNTED))
+        .group_by(day)
+    ).all()
+
+    db.execute(delete(DailySales).where(DailySales.day >= start, DailySales.day < end))
+    if rows:
+        db.execute(insert(DailySales), [
+            # SQLite의 date()는 문자열, MySQL은 date
+            {"day": d if isinstance(d, date) else date.fromisoformat(d), "sales": int(s or 0), "orders": int(n)}
+            for d, s, n in rows
+        ])
+    db.commit()
+    return len(rows)
+
+
+def backfill(db: Session, start: date, end: date, chunk_days: int = 7, progress=None) -> int:
+    # 큰 범위를 chunk_days씩 나눠 재계산 (청크마다 commit -> 잠금/트랜잭션 크기 제한)
+    total = 0
+    cur = start
+    while cur < end:
+        nxt = min(cur + timedelta(days=chunk_days), end)
+        n = rebuild_range(db, cur, nxt)
+        total += n
+        if progress:
+            progress(cur, nxt, n)
+        cur = nxt
+    return total
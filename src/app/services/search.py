@@ -0,0 +1,109 @@
+import re
+import unicodedata
+from collections import Counter
+
+from sqlalchemy import select, delete, insert
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.models.item import Item
+from app.models.item_token import ItemToken
+
+# 아이템 제목/설명 검색 (bigram 역색인).
+# - 한국어는 띄어쓰기/조사 때문에 형태소 분석 없이 단어 단위로 자르면 잘 안 맞으므로
+#   단어를 2글자씩 겹쳐 자른 bigram을 토큰으로 쓴다 ("닌텐도" -> "닌텐", "텐도")
+# - 검색어의 bigram을 "모두" 가진 아이템만 결과 (AND), 점수 = 토큰 weight 합
+# - 아이템 생성/수정/삭제와 같은 트랜잭션에서 해당 아이템 토큰만 다시 씀
+# - 1글자 검색어는 bigram이 없으므로 호출 측에서 LIKE로 처리
+# - 검색 토큰 하나당 self-join 1번이므로 SEARCH_MAX_TOKENS개까지만 사용
+#   (긴 검색어는 검색어 전체에서 고르게 고른 bigram만 확인 -> 결과는 모든 bigram을 가진 아이템의 상위 집합)
+
+TITLE_WEIGHT = 3
+
+_WORD = re.compile(r"\w+")
+
+
+def _words(text: str | None) -> list[str]:
+    # 전각/반각 등 통일 + 소문자
+    return _WORD.findall(unicodedata.normalize("NFKC", text or "").lower())
+
+
+def tokenize(text: str | None) -> Counter:
+    tokens = Counter()
+    for w in _words(text):
+        tokens.update(w[i:i + 2] for i in range(len(w) - 1))
+    return tokens
+
+
+def query_tokens(keyword: str, limit: int | None = None) -> list[str]:
+    limit = limit or settings.search_max_tokens
+    tokens = list(tokenize(keyword))  # 검색어 안의 등장 순서
+    if len(tokens) > limit:
+        step = (len(tokens) - 1) / max(limit - 1, 1)
+        tokens = [tokens[round(i * step)] for i in range(limit)]
+    return sorted(tokens)
+
+
+def _weights(title: str | None, description: str | None) -> Counter:
+    weights = Counter()
+    for token, n in tokenize(title).items():
+        weights[token] += n * TITLE_WEIGHT
+    for token, n in tokenize(description).items():
+        weights[token] += n
+    return weights
+
+
+def token_rows(item_id: int, title: str | None, description: str | None) -> list[dict]:
+    # item_tokens INSERT 파라미터 (bulk seed 등에서 아이템 행과 함께 만들 때도 사용)
+    return [{"token": t, "item_id": item_id, "weight": w} for t, w in _weights(title, description).items()]
+
+
+def index_item(db: Session, item: Item):
+    # item.id가 있어야 함 (생성 시 flush 후 호출). commit은 호출 측에서
+    rows = token_rows(item.id, item.title, item.description)
+    db.execute(delete(ItemToken).where(ItemToken.item_id == item.id))
+    if rows:
+        db.execute(insert(ItemToken), rows)
+
+
+def unindex_item(db: Session, item_id: int):
+    db.execute(delete(ItemToken).where(ItemToken.item_id == item_id))
+
+
+def match(tokens: list[str]):
+    # (item_id, score) 서브쿼리.
+    # 첫 토큰의 posting을 읽고 나머지 토큰은 PK(token, item_id)로 한 건씩 확인하는 self-join
+    # (GROUP BY + HAVING보다 임시 테이블/정렬이 없어 빠름, 조인 순서는 DB 옵티마이저가 인덱스 통계로 결정)
+    aliases = [aliased(ItemToken) for _ in tokens]
+    first = aliases[0]
+    q = select(first.item_id.label("item_id"), sum((a.weight for a in aliases[1:]), first.weight).label("score"))
+    q = q.where(first.token == tokens[0])
+    for a, token in zip(aliases[1:], tokens[1:]):
+        q = q.join(a, (a.token == token) & (a.item_id == first.item_id))
+    return q.subquery()
+
+
+def reindex_all(db: Session, chunk: int = 1000) -> int:
+    # 전체 재색인 (초기 구축 / 토크나이저 변경 시). id 순으로 chunk씩 커밋
+    last_id, done = 0, 0
+    while True:
+        rows = db.execute(
+            select(Item.id, Item.title, Item.description)
+            .where(Item.id > last_id)
+            .order_by(Item.id)
+            .limit(chunk)
+        ).all()
+        if not rows:
+            return done
+
+        ids = [r.id for r in rows]
+        db.execute(delete(ItemToken).where(ItemToken.item_id.in_(ids)))
+        params = []
+        for r in rows:
+            params.extend(token_rows(r.id, r.title, r.description))
+        if params:
+            db.execute(insert(ItemToken), params)
+        db.commit()
+
+        last_id = ids[-1]
+        done += len(rows)
@@ -2,15 +2,16 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.db.base import Base
 from app.db.session import get_db
-import app.models  # noqa
+import app.models as _models  # noqa
 
 TEST_DB_URL = "sqlite+pysqlite:///:memory:"
 
-engine = create_engine(TEST_DB_URL, connect_args={"check_same_thread": False})
+engine = create_engine(TEST_DB_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool)
 TestingSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
 def override_get_db():
@@ -34,6 +35,10 @@ def db():
     finally:
         d.close()
 
+@pytest.fixture()
+def session_factory():
+    return TestingSessionLocal
+
 @pytest.fixture()
 def client():
     app.dependency_overrides[get_db] = override_get_db
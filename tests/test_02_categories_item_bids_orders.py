@@ -2,7 +2,7 @@ from sqlalchemy import select
 
 from tests.utils import register, login, auth_header, create_category_as_admin, create_item, publish_item
 from app.models.user import User, UserRole
-from app.models.item import ItemStatus
+from app.models.item import Item, ItemStatus
 
 def make_admin(client, db):
     # admin 생성
@@ -184,3 +184,28 @@ def test_admin_force_close_ok(client, db):
 
     r = client.patch(f"/api/v1/admin/items/{item_id}/force-close", headers=auth_header(admin_tok))
     assert r.status_code == 200
+
+def test_bid_updates_item_current_price(client, db):
+    admin_tok = make_admin(client, db)
+    cid = create_category_as_admin(client, admin_tok, "현재가")
+    seller_tok = make_user(client, "seller11@example.com", "seller11")
+    bidder_tok = make_user(client, "bidder11@example.com", "bidder11")
+
+    item_id = create_item(client, seller_tok, cid, title="lamp", start_price=1000, bid_unit=100)
+    publish_item(client, seller_tok, item_id)
+
+    assert client.get(f"/api/v1/items/{item_id}/bids/highest").json()["highestBid"] == 1000
+
+    client.post(f"/api/v1/items/{item_id}/bids", headers=auth_header(bidder_tok), json={"amount": 1100})
+    client.post(f"/api/v1/items/{item_id}/bids", headers=auth_header(bidder_tok), json={"amount": 1500})
+
+    item = db.get(Item, item_id)
+    bidder = db.scalar(select(User).where(User.email == "bidder11@example.com"))
+    assert item.current_price == 1500
+    assert item.bid_count == 2
+    assert item.top_bidder_id == bidder.id
+
+    # 현재가 이하 입찰은 최소 입찰가 검증에 걸림
+    r = client.post(f"/api/v1/items/{item_id}/bids", headers=auth_header(bidder_tok), json={"amount": 1500})
+    assert r.status_code == 422
+    assert r.json()["details"]["minBid"] == 1600
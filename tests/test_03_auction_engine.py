@@ -0,0 +1,219 @@
+import glob
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from tests.utils import auth_header, create_category_as_admin, create_item, publish_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.api.v1 import admin as admin_api, items as items_api
+from app.core.errors import AppError
+from app.models.bid import Bid
+from app.models.item import Item, ItemStatus
+from app.models.user import User
+from app.services.auction_engine import AuctionEngine
+from app.services.bidding import BidCommand, apply_bids
+
+def _open_item(client, db, suffix):
+    admin_tok = make_admin(client, db)
+    cid = create_category_as_admin(client, admin_tok, f"엔진{suffix}")
+    seller_tok = make_user(client, f"eseller{suffix}@example.com", f"eseller{suffix}")
+    make_user(client, f"ebidder{suffix}@example.com", f"ebidder{suffix}")
+    item_id = create_item(client, seller_tok, cid, title="engine", start_price=1000, bid_unit=100)
+    publish_item(client, seller_tok, item_id)
+    bidder = db.scalar(select(User).where(User.email == f"ebidder{suffix}@example.com"))
+    return item_id, bidder.id
+
+def test_engine_accepts_bids_and_flushes(client, db, session_factory, tmp_path):
+    item_id, bidder_id = _open_item(client, db, "1")
+    engine = AuctionEngine(session_factory, str(tmp_path), flush_interval_ms=3_600_000, fsync=False)
+    engine.start()
+
+    b1 = engine.place(item_id, bidder_id, 1100)
+    b2 = engine.place(item_id, bidder_id, 1300)
+    assert b2.id == b1.id + 1
+    assert engine.get(item_id).current_price == 1300
+
+    try:
+        engine.place(item_id, bidder_id, 1300)
+        assert False, "현재가 이하 입찰은 거절되어야 함"
+    except AppError as e:
+        assert e.status == 422 and e.details["minBid"] == 1400
+
+    assert engine.flush() == 2
+    db.expire_all()
+    item = db.get(Item, item_id)
+    assert item.current_price == 1300 and item.bid_count == 2 and item.top_bidder_id == bidder_id
+    assert db.scalars(select(Bid.amount).where(Bid.item_id == item_id).order_by(Bid.id)).all() == [1100, 1300]
+
+    engine.stop()
+
+def test_engine_replays_wal_after_crash(client, db, session_factory, tmp_path):
+    item_id, bidder_id = _open_item(client, db, "2")
+    crashed = AuctionEngine(session_factory, str(tmp_path), flush_interval_ms=3_600_000, fsync=False)
+    crashed.start()
+    accepted = crashed.place(item_id, bidder_id, 1500)
+    # flush 없이 프로세스가 죽었다고 가정하고 새 엔진으로 복구
+
+    engine = AuctionEngine(session_factory, str(tmp_path), flush_interval_ms=3_600_000, fsync=False)
+    engine.start()
+    assert engine.get(item_id).current_price == 1500
+    assert engine.flush() == 1
+
+    db.expire_all()
+    assert db.get(Bid, accepted.id).amount == 1500
+    assert db.get(Item, item_id).current_price == 1500
+    engine.stop()
+
+def test_engine_and_db_path_bid_ids_do_not_collide(client, db, session_factory, tmp_path):
+    engine_item, bidder_id = _open_item(client, db, "7")
+    db_item, _ = _open_item(client, db, "8")
+    engine = AuctionEngine(session_factory, str(tmp_path), flush_interval_ms=3_600_000, fsync=False)
+    engine.start()
+    pending = engine.place(engine_item, bidder_id, 1100)
+
+    # 엔진이 들고 있지 않은 아이템 -> DB 경로 (flush 전인 엔진 입찰의 id를 가져가면 안 됨)
+    engine._auctions.pop(db_item, None)
+    s = session_factory()
+    res = apply_bids(s, [BidCommand(db_item, bidder_id, 1100)])[0]
+    s.commit()
+    s.close()
+    assert res.id != pending.id
+
+    assert engine.flush() == 1
+    db.expire_all()
+    assert db.get(Bid, pending.id).item_id == engine_item
+    engine.stop()
+
+def test_engine_and_db_path_reject_bids_after_ends_at(client, db, session_factory, tmp_path):
+    item_id, bidder_id = _open_item(client, db, "10")
+    # 마감 시각은 지났지만 expiry 스케줄러가 아직 CLOSED로 바꾸지 않은 상태
+    db.get(Item, item_id).ends_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    db.commit()
+    engine = AuctionEngine(session_factory, str(tmp_path), flush_interval_ms=3_600_000, fsync=False)
+    engine.start()
+
+    with pytest.raises(AppError) as e:
+        engine.place(item_id, bidder_id, 1100)
+    assert e.value.status == 409 and "endsAt" in e.value.details
+
+    s = session_factory()
+    res = apply_bids(s, [BidCommand(item_id, bidder_id, 1100)])[0]
+    s.rollback()
+    s.close()
+    assert isinstance(res, AppError) and res.status == 409 and res.message == e.value.message
+    engine.stop()
+    # 다른 테스트의 expiry 스케줄러가 이 아이템을 잡지 않도록
+    db.get(Item, item_id).status = ItemStatus.CLOSED
+    db.commit()
+
+def test_engine_dead_letters_poison_batch(client, db, session_factory, tmp_path):
+    poison_item, bidder_id = _open_item(client, db, "3")
+    ok_item, _ = _open_item(client, db, "4")
+    engine = AuctionEngine(session_factory, str(tmp_path), flush_interval_ms=3_600_000, fsync=False, max_flush_attempts=2)
+    engine.start()
+
+    existing = db.scalar(select(func.max(Bid.id)))
+    bad = engine.place(poison_item, bidder_id, 1100)
+    bad.id = existing  # PK 중복 -> 재시도해도 항상 실패
+    engine.place(ok_item, bidder_id, 1200)
+
+    with pytest.raises(IntegrityError):
+        engine.flush()
+    # N번째 실패: 아이템별로 나눠 반영, 실패하는 아이템의 입찰만 격리
+    assert engine.flush() == 2
+    assert engine.dead_lettered == 1
+    assert engine.get(poison_item) is None  # 이후 입찰은 DB 경로
+    db.expire_all()
+    assert db.get(Item, ok_item).current_price == 1200
+    assert db.get(Item, poison_item).bid_count == 0
+    dead = glob.glob(str(tmp_path / "bids-*.dead"))
+    assert len(dead) == 1 and open(dead[0]).read() == bad.to_wal()
+    engine.stop()
+
+    # 재시작 시 격리한 입찰은 재생하지 않고 그 id도 다시 발급하지 않음
+    engine = AuctionEngine(session_factory, str(tmp_path), flush_interval_ms=3_600_000, fsync=False)
+    engine.start()
+    assert engine.flush() == 0
+    assert engine.place(ok_item, bidder_id, 1300).id > existing
+    engine.stop()
+
+def test_engine_keeps_retrying_non_constraint_errors(client, db, session_factory, tmp_path, monkeypatch):
+    item_id, bidder_id = _open_item(client, db, "5")
+    engine = AuctionEngine(session_factory, str(tmp_path), flush_interval_ms=3_600_000, fsync=False, max_flush_attempts=1)
+    engine.start()
+    engine.place(item_id, bidder_id, 1100)
+
+    def down(batch):
+        raise OperationalError("INSERT", {}, Exception("connection lost"))
+
+    monkeypatch.setattr(engine, "_write", down)
+    for _ in range(3):
+        with pytest.raises(Exception):
+            engine.flush()
+    # DB 장애로 인한 실패는 격리하지 않고 계속 pending
+    assert engine.dead_lettered == 0 and engine.get(item_id) is not None
+    monkeypatch.undo()
+    assert engine.flush() == 1
+    engine.stop()
+
+def test_engine_close_keeps_item_when_flush_fails(client, db, session_factory, tmp_path, monkeypatch):
+    item_id, bidder_id = _open_item(client, db, "6")
+    engine = AuctionEngine(session_factory, str(tmp_path), flush_interval_ms=3_600_000, fsync=False)
+    engine.start()
+    engine.place(item_id, bidder_id, 1100)
+
+    def down(batch):
+        raise OperationalError("INSERT", {}, Exception("connection lost"))
+
+    monkeypatch.setattr(engine, "_write", down)
+    with pytest.raises(OperationalError):
+        engine.close(item_id)
+    # DB에서는 아직 OPEN이므로 엔진에 남아 입찰을 계속 받음
+    assert engine.get(item_id).current_price == 1100
+    engine.place(item_id, bidder_id, 1200)
+
+    monkeypatch.undo()
+    assert engine.close(item_id).current_price == 1200
+    assert engine.get(item_id) is None
+    db.expire_all()
+    assert db.get(Item, item_id).current_price == 1200
+    engine.stop()
+
+def test_close_routes_return_503_when_flush_fails(client, db, session_factory, tmp_path, monkeypatch):
+    admin_tok = make_admin(client, db)
+    cid = create_category_as_admin(client, admin_tok, "엔진마감")
+    seller_tok = make_user(client, "eseller9@example.com", "eseller9")
+    make_user(client, "ebidder9@example.com", "ebidder9")
+    item_id = create_item(client, seller_tok, cid, title="engine", start_price=1000, bid_unit=100)
+    publish_item(client, seller_tok, item_id)
+    bidder_id = db.scalar(select(User.id).where(User.email == "ebidder9@example.com"))
+
+    engine = AuctionEngine(session_factory, str(tmp_path), flush_interval_ms=3_600_000, fsync=False)
+    engine.start()
+    monkeypatch.setattr(items_api, "auction_engine", engine)
+    monkeypatch.setattr(admin_api, "auction_engine", engine)
+    engine.place(item_id, bidder_id, 1100)
+
+    def down(batch):
+        raise OperationalError("INSERT", {}, Exception("connection lost"))
+
+    with monkeypatch.context() as m:
+        m.setattr(engine, "_write", down)
+        for r in (
+            client.post(f"/api/v1/items/{item_id}/close", headers=auth_header(seller_tok)),
+            client.patch(f"/api/v1/admin/items/{item_id}/force-close", headers=auth_header(admin_tok)),
+        ):
+            assert r.status_code == 503, r.text
+            assert r.json()["code"] == "SERVICE_UNAVAILABLE" and r.headers["retry-after"] == "1"
+    # 마감되지 않고 엔진에 남아 있음
+    db.expire_all()
+    assert db.get(Item, item_id).status.value == "OPEN"
+    assert engine.get(item_id).current_price == 1100
+
+    r = client.post(f"/api/v1/items/{item_id}/close", headers=auth_header(seller_tok))
+    assert r.status_code == 200, r.text
+    db.expire_all()
+    assert db.get(Item, item_id).current_price == 1100
+    engine.stop()
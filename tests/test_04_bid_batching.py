@@ -0,0 +1,112 @@
+import threading
+
+import pytest
+from sqlalchemy import select
+
+from tests.utils import auth_header, create_category_as_admin, create_item, publish_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.core.errors import AppError
+from app.models.item import Item
+from app.models.user import User
+from app.services.bid_writer import BidWriteCoalescer, _Pending
+from app.services.bidding import BidCommand
+
+def test_group_commit_gives_each_caller_its_own_result(client, db, session_factory):
+    admin_tok = make_admin(client, db)
+    cid = create_category_as_admin(client, admin_tok, "그룹커밋")
+    seller_tok = make_user(client, "gseller@example.com", "gseller")
+    make_user(client, "gbidder@example.com", "gbidder")
+    items = [create_item(client, seller_tok, cid, title=f"g{i}", start_price=0, bid_unit=100) for i in range(3)]
+    for item_id in items:
+        publish_item(client, seller_tok, item_id)
+    bidder = db.scalar(select(User).where(User.email == "gbidder@example.com"))
+
+    writer = BidWriteCoalescer(session_factory, window_ms=300, max_batch=10)
+    writer.start()
+
+    # 두 아이템엔 정상 입찰, 하나는 최소 입찰가 미달
+    reqs = [(items[0], 100), (items[1], 200), (items[2], 0)]
+    results = [None] * len(reqs)
+
+    def bid(i):
+        try:
+            results[i] = writer.submit(reqs[i][0], bidder.id, reqs[i][1])
+        except AppError as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=bid, args=(i,)) for i in range(len(reqs))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    writer.stop()
+
+    assert writer.batches == 1 and writer.bids == 3
+    assert results[0].amount == 100 and results[0].itemId == items[0]
+    assert results[1].amount == 200 and results[1].itemId == items[1]
+    assert isinstance(results[2], AppError) and results[2].status == 422
+
+    db.expire_all()
+    assert db.get(Item, items[0]).current_price == 100
+    assert db.get(Item, items[2]).bid_count == 0
+
+def test_group_commit_stop_does_not_strand_callers(session_factory):
+    writer = BidWriteCoalescer(session_factory, window_ms=5, max_batch=10)
+    writer.start()
+
+    # 종료 표시(None) 뒤에 들어간 요청 -> 처리되지 않으므로 stop()이 에러로 끝내야 함
+    late = _Pending(BidCommand(1, 1, 100))
+    put = writer._queue.put
+
+    def put_then_late(p):
+        put(p)
+        if p is None:
+            put(late)
+
+    writer._queue.put = put_then_late
+    writer.stop()
+    assert isinstance(late.future.exception(timeout=1), AppError) and late.future.exception().status == 503
+
+    # 멈춘 뒤의 submit은 기다리지 않고 바로 503
+    with pytest.raises(AppError) as e:
+        writer.submit(1, 1, 100)
+    assert e.value.status == 503 and e.value.headers == {"Retry-After": "1"}
+
+def _batch_setup(client, db, suffix):
+    admin_tok = make_admin(client, db)
+    cid = create_category_as_admin(client, admin_tok, f"배치{suffix}")
+    seller_tok = make_user(client, f"bseller{suffix}@example.com", f"bseller{suffix}")
+    bidder_tok = make_user(client, f"bbidder{suffix}@example.com", f"bbidder{suffix}")
+    open_id = create_item(client, seller_tok, cid, title="open", start_price=0, bid_unit=100)
+    publish_item(client, seller_tok, open_id)
+    draft_id = create_item(client, seller_tok, cid, title="draft", start_price=0, bid_unit=100)
+    return bidder_tok, open_id, draft_id
+
+def test_bid_batch_partial(client, db):
+    bidder_tok, open_id, draft_id = _batch_setup(client, db, "1")
+    r = client.post("/api/v1/bids:batch", headers=auth_header(bidder_tok), json={
+        "mode": "PARTIAL",
+        "bids": [
+            {"itemId": open_id, "amount": 100},
+            {"itemId": open_id, "amount": 300},
+            {"itemId": open_id, "amount": 300},
+            {"itemId": draft_id, "amount": 100},
+        ],
+    })
+    assert r.status_code == 200
+    body = r.json()
+    assert body["accepted"] == 2 and body["rejected"] == 2
+    assert [x["ok"] for x in body["results"]] == [True, True, False, False]
+    assert body["results"][2]["error"]["details"]["minBid"] == 400
+    assert body["results"][3]["error"]["code"] == "STATE_CONFLICT"
+    assert client.get(f"/api/v1/items/{open_id}/bids/highest").json()["highestBid"] == 300
+
+def test_bid_batch_all_or_nothing_rolls_back(client, db):
+    bidder_tok, open_id, draft_id = _batch_setup(client, db, "2")
+    r = client.post("/api/v1/bids:batch", headers=auth_header(bidder_tok), json={
+        "bids": [{"itemId": open_id, "amount": 100}, {"itemId": draft_id, "amount": 100}],
+    })
+    assert r.status_code == 422
+    assert r.json()["details"]["errors"][0]["index"] == 1
+    assert client.get(f"/api/v1/items/{open_id}/bids/highest").json()["highestBid"] == 0
+    assert client.get(f"/api/v1/items/{open_id}/bids").json()["totalElements"] == 0
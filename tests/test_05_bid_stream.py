@@ -0,0 +1,44 @@
+import asyncio
+
+from tests.utils import auth_header, create_category_as_admin, create_item, publish_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.services.bid_hub import BidHub
+
+def test_ws_stream_pushes_bids_and_close(client, db):
+    admin_tok = make_admin(client, db)
+    cid = create_category_as_admin(client, admin_tok, "스트림")
+    seller_tok = make_user(client, "sseller@example.com", "sseller")
+    bidder_tok = make_user(client, "sbidder@example.com", "sbidder")
+    item_id = create_item(client, seller_tok, cid, title="live", start_price=500, bid_unit=100)
+    publish_item(client, seller_tok, item_id)
+
+    with client.websocket_connect(f"/api/v1/items/{item_id}/bids/ws") as ws:
+        snap = ws.receive_json()
+        assert snap == {"type": "snapshot", "itemId": item_id, "status": "OPEN", "highestBid": 500}
+
+        client.post(f"/api/v1/items/{item_id}/bids", headers=auth_header(bidder_tok), json={"amount": 600})
+        ev = ws.receive_json()
+        assert ev["type"] == "bid" and ev["highestBid"] == 600
+
+        client.post(f"/api/v1/items/{item_id}/close", headers=auth_header(seller_tok))
+        assert ws.receive_json() == {"type": "status", "itemId": item_id, "status": "CLOSED"}
+
+def test_hub_slow_consumer_coalesces():
+    async def run():
+        hub = BidHub(queue_size=2)
+        all_sub = hub.subscribe(1)
+        latest_sub = hub.subscribe(1, latest_only=True)
+        for price in (100, 200, 300):
+            hub.publish(1, {"type": "bid", "itemId": 1, "highestBid": price})
+        await asyncio.sleep(0)
+
+        got = await all_sub.get(0.1)
+        assert got[0] == {"type": "lagged", "itemId": 1, "dropped": 2}
+        assert got[1]["highestBid"] == 300
+
+        assert [e["highestBid"] for e in await latest_sub.get(0.1)] == [300]
+        hub.unsubscribe(all_sub)
+        hub.unsubscribe(latest_sub)
+        assert hub.subscriber_count == 0
+
+    asyncio.run(run())
@@ -0,0 +1,39 @@
+from datetime import datetime, timezone, timedelta
+
+from tests.utils import create_category_as_admin, create_item, publish_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.models.item import Item, ItemStatus
+from app.services.expiry import ExpiryScheduler
+
+def test_expiry_closes_only_expired_items(client, db, session_factory):
+    admin_tok = make_admin(client, db)
+    cid = create_category_as_admin(client, admin_tok, "마감")
+    seller_tok = make_user(client, "xseller@example.com", "xseller")
+    expired = [create_item(client, seller_tok, cid, title=f"old{i}") for i in range(3)]
+    alive = create_item(client, seller_tok, cid, title="alive")
+    for item_id in expired + [alive]:
+        publish_item(client, seller_tok, item_id)
+
+    now = datetime.now(timezone.utc)
+    for item_id in expired:
+        db.get(Item, item_id).ends_at = now - timedelta(minutes=5)
+    db.commit()
+
+    scheduler = ExpiryScheduler(session_factory, batch_size=2, resync_sec=30)
+    scheduler.rebuild()
+    assert scheduler.lag_seconds() >= 300
+
+    assert sorted(scheduler.run_once(now)) == sorted(expired)
+    assert scheduler.closed_total == 3 and scheduler.lag_seconds() == 0
+
+    db.expire_all()
+    assert all(db.get(Item, i).status == ItemStatus.CLOSED for i in expired)
+    assert db.get(Item, alive).status == ItemStatus.OPEN
+
+    # 이미 닫힌 아이템은 다시 잡혀도 아무 일 없음 (여러 워커가 동시에 돌아도 안전)
+    for item_id in expired:
+        scheduler.schedule(item_id, now - timedelta(minutes=5))
+    assert scheduler.run_once(now) == []
+
+    r = client.get("/api/v1/items", params={"status": "OPEN", "categoryId": cid})
+    assert [i["id"] for i in r.json()["content"]] == [alive]
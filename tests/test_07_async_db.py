@@ -0,0 +1,68 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from tests.utils import auth_header
+from app.core.errors import AppError, error_response
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import get_async_db
+from app.models.category import Category
+from app.models.item import Item, ItemStatus
+from app.models.user import User
+from app.services.principal_cache import principal_cache
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+def test_async_routes_match_sync_responses(tmp_path):
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    from app.api.v1.aio import router as aio
+
+    path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(sync_engine)
+    with Session(sync_engine) as s:
+        u = User(email="async@example.com", password_hash="x", nickname="async")
+        c = Category(name="비동기")
+        s.add_all([u, c])
+        s.flush()
+        it = Item(seller_id=u.id, category_id=c.id, title="t", description="d",
+                  start_price=100, bid_unit=10, current_price=150, status=ItemStatus.OPEN)
+        s.add(it)
+        s.commit()
+        user_id, item_id = u.id, it.id
+    # 별도 DB라 id가 겹침 -> 메인 DB 사용자로 캐시된 principal 제거
+    principal_cache.drop(None)
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(aio, prefix="/api/v1")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    @app.exception_handler(AppError)
+    def app_error_handler(req: Request, exc: AppError):
+        return error_response(req, exc.status, exc.code, exc.message, exc.details)
+
+    with TestClient(app) as c:
+        assert c.get(f"/api/v1/items/{item_id}/bids/highest").json()["highestBid"] == 150
+        assert c.get("/api/v1/items/999/bids/highest").status_code == 404
+
+        tok = create_access_token(str(user_id), "ROLE_USER")
+        assert c.get("/api/v1/users/me", headers=auth_header(tok)).json()["email"] == "async@example.com"
+        assert c.get("/api/v1/users/me").status_code == 401
+
+def test_async_routes_do_not_shadow_cached_routes():
+    # ETag / 응답 캐시 / 레플리카 라우팅이 붙은 동기 라우트는 async 버전으로 가리지 않음
+    from app.api.v1.aio import router as aio
+
+    assert {r.path for r in aio.routes}.isdisjoint({"/items/{item_id}", "/categories"})
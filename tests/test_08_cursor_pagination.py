@@ -0,0 +1,64 @@
+from datetime import datetime, timezone, timedelta
+
+from tests.utils import auth_header, create_category_as_admin, create_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.models.item import Item, ItemStatus
+
+def _walk(client, params, size=3):
+    ids, cursor = [], ""
+    while True:
+        r = client.get("/api/v1/items", params={**params, "size": size, "cursor": cursor})
+        assert r.status_code == 200, r.text
+        body = r.json()
+        assert "totalElements" not in body and len(body["content"]) <= size
+        ids += [i["id"] for i in body["content"]]
+        if not body["hasNext"]:
+            assert body["nextCursor"] is None
+            return ids
+        cursor = body["nextCursor"]
+
+def test_items_cursor_walks_all_rows_in_order(client, db):
+    admin_tok = make_admin(client, db)
+    cid = create_category_as_admin(client, admin_tok, "커서")
+    seller_tok = make_user(client, "cseller@example.com", "cseller")
+    # 제목 중복(id로 순서 고정) + ends_at NULL(DRAFT) 섞기
+    ids = [create_item(client, seller_tok, cid, title=f"t{i % 3}") for i in range(8)]
+
+    base = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    for n, item_id in enumerate(ids[:5]):
+        item = db.get(Item, item_id)
+        item.status = ItemStatus.OPEN
+        item.ends_at = base + timedelta(hours=n % 2)
+    db.commit()
+
+    rows = {i: db.get(Item, i) for i in ids}
+    def ends(i):
+        e = rows[i].ends_at
+        return (e is not None, e.replace(tzinfo=None) if e else None, i)
+
+    assert _walk(client, {"categoryId": cid, "sort": "title,ASC"}) == sorted(ids, key=lambda i: (rows[i].title, i))
+    assert _walk(client, {"categoryId": cid, "sort": "endsAt,ASC"}) == sorted(ids, key=ends)
+    assert _walk(client, {"categoryId": cid, "sort": "endsAt,DESC"}) == sorted(ids, key=ends, reverse=True)
+
+    # 기존 page 파라미터 응답은 그대로
+    r = client.get("/api/v1/items", params={"categoryId": cid, "size": 3, "page": 1})
+    assert r.json()["totalElements"] == 8 and r.json()["page"] == 1
+
+def test_cursor_rejects_bad_or_mismatched_cursor(client, db):
+    admin_tok = make_admin(client, db)
+    cid = create_category_as_admin(client, admin_tok, "커서2")
+    seller_tok = make_user(client, "cseller2@example.com", "cseller2")
+    for i in range(3):
+        create_item(client, seller_tok, cid, title=f"x{i}")
+
+    r = client.get("/api/v1/items", params={"categoryId": cid, "size": 1, "cursor": ""})
+    cursor = r.json()["nextCursor"]
+
+    r = client.get("/api/v1/items", params={"categoryId": cid, "cursor": cursor, "sort": "title,ASC"})
+    assert r.status_code == 400 and r.json()["code"] == "INVALID_QUERY_PARAM"
+    r = client.get("/api/v1/items", params={"cursor": "not-a-cursor"})
+    assert r.status_code == 400
+
+    # 다른 목록 API도 같은 방식
+    r = client.get("/api/v1/orders", headers=auth_header(seller_tok), params={"cursor": ""})
+    assert r.status_code == 200 and r.json() == {"content": [], "size": 20, "sort": "createdAt,DESC", "nextCursor": None, "hasNext": False}
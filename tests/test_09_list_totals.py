@@ -0,0 +1,58 @@
+import time
+
+from sqlalchemy import select, func
+
+from tests.utils import auth_header, create_category_as_admin, create_item, publish_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.models.item import Item
+from app.services.count_cache import CountCache
+
+def test_with_total_false_skips_count(client, db):
+    admin_tok = make_admin(client, db)
+    cid = create_category_as_admin(client, admin_tok, "총개수")
+    seller_tok = make_user(client, "tseller@example.com", "tseller")
+    bidder_tok = make_user(client, "tbidder@example.com", "tbidder")
+    for i in range(3):
+        create_item(client, seller_tok, cid, title=f"t{i}")
+
+    r = client.get("/api/v1/items", params={"categoryId": cid, "size": 2, "withTotal": "false"}).json()
+    assert len(r["content"]) == 2 and r["hasNext"] is True and r["totalElements"] is None
+    r = client.get("/api/v1/items", params={"categoryId": cid, "size": 2, "page": 1, "withTotal": "false"}).json()
+    assert len(r["content"]) == 1 and r["hasNext"] is False
+
+    # 카테고리 필터 COUNT는 캐시, 생성 시 바로 무효화
+    r = client.get("/api/v1/items", params={"categoryId": cid, "size": 2}).json()
+    assert r["totalElements"] == 3 and r["totalPages"] == 2 and r["hasNext"] is True
+    create_item(client, seller_tok, cid, title="t3")
+    assert client.get("/api/v1/items", params={"categoryId": cid}).json()["totalElements"] == 4
+
+    # 입찰 목록 총 개수 = items.bid_count
+    item_id = create_item(client, seller_tok, cid, title="bidme", start_price=100, bid_unit=100)
+    publish_item(client, seller_tok, item_id)
+    for amount in (200, 300, 400):
+        client.post(f"/api/v1/items/{item_id}/bids", headers=auth_header(bidder_tok), json={"amount": amount})
+    r = client.get(f"/api/v1/items/{item_id}/bids", params={"size": 2}).json()
+    assert r["totalElements"] == 3 and [b["amount"] for b in r["content"]] == [400, 300]
+
+def test_count_cache_serves_stale_and_refreshes_in_background(client, db):
+    admin_tok = make_admin(client, db)
+    cid = create_category_as_admin(client, admin_tok, "캐시")
+    seller_tok = make_user(client, "cseller9@example.com", "cseller9")
+    create_item(client, seller_tok, cid, title="a")
+
+    cache = CountCache(ttl_sec=1)
+    stmt = select(func.count(Item.id)).where(Item.category_id == cid)
+    assert cache.get(db, ("items", cid), stmt) == 1
+
+    # 다른 워커에서 생긴 아이템 (이 캐시는 모름)
+    create_item(client, seller_tok, cid, title="b")
+    assert cache.get(db, ("items", cid), stmt) == 1
+
+    time.sleep(1.1)
+    # ttl이 지나도 요청은 기다리지 않고 이전 값을 받음, 갱신은 백그라운드
+    assert cache.get(db, ("items", cid), stmt) == 1
+    for _ in range(50):
+        if cache.get(db, ("items", cid), stmt) == 2:
+            break
+        time.sleep(0.02)
+    assert cache.get(db, ("items", cid), stmt) == 2
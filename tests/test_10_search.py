@@ -0,0 +1,57 @@
+from tests.utils import auth_header, create_category_as_admin, create_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from sqlalchemy.dialects import mysql
+from sqlalchemy.schema import CreateTable
+
+from app.models.item_token import ItemToken
+from app.services.search import tokenize, query_tokens
+
+def test_tokenize_bigrams():
+    assert sorted(tokenize("닌텐도 스위치")) == ["닌텐", "스위", "위치", "텐도"]
+    # 전각/대소문자 통일, 1글자 단어는 토큰 없음
+    assert query_tokens("ＰＳ5 a") == ["ps", "s5"]
+    assert query_tokens("폰") == []
+
+def test_query_tokens_are_capped():
+    # 긴 검색어도 self-join은 limit개까지, 검색어 처음과 끝의 bigram은 포함
+    tokens = query_tokens("abcdefghijklmnopqrstuvwxyz", limit=4)
+    assert len(tokens) == 4 and {"ab", "yz"} <= set(tokens)
+    assert len(query_tokens("닌텐도 스위치 프로 컨트롤러 정품 박스 포함 미개봉")) <= 8
+
+def test_token_column_uses_binary_collation_on_mysql():
+    # 기본 collation이면 "fe"와 "fé"가 같은 PK -> 아이템 저장 시 중복 키 오류
+    assert query_tokens("fe fé") == ["fe", "fé"]
+    assert "COLLATE utf8mb4_bin" in str(CreateTable(ItemToken.__table__).compile(dialect=mysql.dialect()))
+
+def _search(client, **params):
+    r = client.get("/api/v1/items", params=params)
+    assert r.status_code == 200, r.text
+    return [i["id"] for i in r.json()["content"]]
+
+def test_search_ranked_and_kept_in_sync(client, db):
+    admin_tok = make_admin(client, db)
+    cid = create_category_as_admin(client, admin_tok, "검색")
+    other = create_category_as_admin(client, admin_tok, "검색2")
+    seller_tok = make_user(client, "sseller@example.com", "sseller")
+
+    in_title = create_item(client, seller_tok, cid, title="닌텐도 스위치 OLED")
+    r = client.post(
+        "/api/v1/items", headers=auth_header(seller_tok),
+        json={"categoryId": cid, "title": "게임기 팝니다", "description": "닌텐도 스위치 본체만", "startPrice": 0, "bidUnit": 100},
+    )
+    in_desc = r.json()["id"]
+    other_cat = create_item(client, seller_tok, other, title="스위치 닌텐도")
+    create_item(client, seller_tok, cid, title="스위치 허브")
+
+    # 제목 일치가 설명 일치보다 위, 카테고리 필터와 함께 사용
+    assert _search(client, keyword="닌텐도 스위치", categoryId=cid, sort="relevance") == [in_title, in_desc]
+    assert set(_search(client, keyword="닌텐도")) >= {in_title, in_desc, other_cat}
+
+    # 수정/삭제 시 색인 갱신
+    client.patch(f"/api/v1/items/{in_desc}", headers=auth_header(seller_tok), json={"description": "플스"})
+    assert _search(client, keyword="닌텐도", categoryId=cid) == [in_title]
+    client.delete(f"/api/v1/items/{in_title}", headers=auth_header(seller_tok))
+    assert _search(client, keyword="닌텐도", categoryId=cid) == []
+
+    r = client.get("/api/v1/items", params={"sort": "relevance"})
+    assert r.status_code == 400
@@ -0,0 +1,74 @@
+from sqlalchemy import event, select
+
+from tests.utils import auth_header
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.core.bus import bus
+from app.models.user import User, UserRole, UserStatus
+from app.services.principal_cache import Principal, PrincipalCache
+
+def _count_user_selects(engine):
+    seen = []
+    def before(conn, cursor, statement, params, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM users" in statement:
+            seen.append(statement)
+    event.listen(engine, "before_cursor_execute", before)
+    return seen, lambda: event.remove(engine, "before_cursor_execute", before)
+
+def test_principal_cached_and_invalidated(client, db, session_factory):
+    admin_tok = make_admin(client, db)
+    tok = make_user(client, "pc1@example.com", "pc1")
+    client.get("/api/v1/users/me", headers=auth_header(tok))
+
+    seen, remove = _count_user_selects(session_factory.kw["bind"])
+    try:
+        for _ in range(3):
+            assert client.get("/api/v1/users/me", headers=auth_header(tok)).status_code == 200
+        assert seen == []
+    finally:
+        remove()
+
+    # 닉네임 변경은 바로 반영
+    client.patch("/api/v1/users/me", headers=auth_header(tok), json={"nickname": "pc1new"})
+    assert client.get("/api/v1/users/me", headers=auth_header(tok)).json()["nickname"] == "pc1new"
+
+    # 비활성화 응답 이후엔 캐시된 principal로도 통과 못함
+    uid = db.scalar(select(User.id).where(User.email == "pc1@example.com"))
+    r = client.patch(f"/api/v1/admin/users/{uid}/deactivate", headers=auth_header(admin_tok))
+    assert r.status_code == 200
+    assert client.get("/api/v1/users/me", headers=auth_header(tok)).status_code == 403
+
+def test_invalidation_during_load_is_not_cached():
+    cache = PrincipalCache(max_size=2, ttl_sec=60)
+    p = Principal(id=1, email="a@a", nickname="aa", role=UserRole.USER, status=UserStatus.ACTIVE)
+
+    # DB에서 읽는 사이 무효화 -> 읽은 값은 버림
+    epoch = cache.epoch()
+    cache.drop(1)
+    cache.put(p, epoch)
+    assert cache.get(1) is None
+
+    cache.put(p, cache.epoch())
+    assert cache.get(1) == p
+
+    # LRU 상한
+    for i in (2, 3):
+        cache.put(Principal(id=i, email="b@b", nickname="bb", role=UserRole.USER, status=UserStatus.ACTIVE), cache.epoch())
+    assert cache.get(1) is None and cache.get(3) is not None
+
+def test_unacknowledged_invalidation_is_not_ok(client, db, monkeypatch):
+    admin_tok = make_admin(client, db)
+    make_user(client, "pc2@example.com", "pc2")
+    uid = db.scalar(select(User.id).where(User.email == "pc2@example.com"))
+
+    # 다른 워커의 ack가 오지 않음 -> 재전송 후에도 실패하면 ok 대신 503
+    sent = []
+    monkeypatch.setattr(bus, "publish", lambda channel, message, wait=False: sent.append(channel) or False)
+    r = client.patch(f"/api/v1/admin/users/{uid}/deactivate", headers=auth_header(admin_tok))
+    assert r.status_code == 503, r.text
+    assert r.headers["retry-after"] == "1"
+    assert sent == ["principal"] * 3
+
+    # 다시 시도해서 반영이 확인되면 ok
+    monkeypatch.undo()
+    r = client.patch(f"/api/v1/admin/users/{uid}/deactivate", headers=auth_header(admin_tok))
+    assert r.status_code == 200 and r.json() == {"ok": True}
@@ -0,0 +1,39 @@
+import threading
+import time
+
+import pytest
+
+from tests.utils import register, login
+from app.core.errors import AppError
+from app.core.security import verify_password
+from app.services.password_pool import PasswordPool, password_pool
+
+def test_pool_hashes_off_thread_and_rejects_when_full():
+    pool = PasswordPool(workers=1, max_pending=1)
+    pool.start()
+    try:
+        hashed = pool.hash("P@ssw0rd!")
+        assert verify_password("P@ssw0rd!", hashed) and pool.verify("P@ssw0rd!", hashed)
+
+        t = threading.Thread(target=pool.hash, args=("x" * 10,))
+        t.start()
+        while pool.stats()["pending"] == 0:
+            time.sleep(0.001)
+        # 상한이 차면 기다리지 않고 바로 503
+        with pytest.raises(AppError) as e:
+            pool.verify("P@ssw0rd!", hashed)
+        assert e.value.status == 503 and e.value.headers == {"Retry-After": "1"}
+        t.join()
+
+        s = pool.stats()
+        assert s["completed"] == 3 and s["rejected"] == 1 and s["pending"] == 0 and s["p95Ms"] > 0
+    finally:
+        pool.stop()
+
+def test_login_returns_503_with_retry_after_when_full(client, monkeypatch):
+    register(client, "pool@example.com", "P@ssw0rd!", "pool")
+    monkeypatch.setattr(password_pool, "running", True)
+    monkeypatch.setattr(password_pool, "_max_pending", 0)
+    r = login(client, "pool@example.com")
+    assert r.status_code == 503
+    assert r.headers["retry-after"] == "1" and r.json()["code"] == "SERVICE_UNAVAILABLE"
@@ -0,0 +1,82 @@
+import time
+from datetime import datetime, timezone, timedelta
+
+import jwt
+from sqlalchemy import func, select
+
+from tests.utils import register, login, auth_header
+from app.core.config import settings
+from app.models.revoked_token import RevokedToken
+from app.services.revocation import BloomFilter, RevocationList
+
+def test_logout_and_refresh_rotation_revoke_tokens(client):
+    register(client, "rv1@example.com", "P@ssw0rd!", "rv1")
+    tokens = login(client, "rv1@example.com").json()
+
+    # refresh 회전: 같은 refresh token은 한 번만
+    r = client.post("/api/v1/auth/refresh", json={"refreshToken": tokens["refreshToken"]})
+    assert r.status_code == 200
+    rotated = r.json()
+    r = client.post("/api/v1/auth/refresh", json={"refreshToken": tokens["refreshToken"]})
+    assert r.status_code == 401
+
+    # 로그아웃: access + refresh 모두 폐기
+    assert client.get("/api/v1/users/me", headers=auth_header(rotated["accessToken"])).status_code == 200
+    r = client.post("/api/v1/auth/logout", headers=auth_header(rotated["accessToken"]), json={"refreshToken": rotated["refreshToken"]})
+    assert r.status_code == 200
+    assert client.get("/api/v1/users/me", headers=auth_header(rotated["accessToken"])).status_code == 401
+    assert client.post("/api/v1/auth/refresh", json={"refreshToken": rotated["refreshToken"]}).status_code == 401
+
+    # 다른 세션 토큰은 영향 없음, 잘못된 토큰으로 로그아웃해도 200
+    other = login(client, "rv1@example.com").json()
+    assert client.get("/api/v1/users/me", headers=auth_header(other["accessToken"])).status_code == 200
+    assert client.post("/api/v1/auth/logout", headers=auth_header("garbage")).status_code == 200
+
+def test_refresh_token_without_jti_is_rejected(client):
+    # 폐기 목록 도입 전 형식(jti 없음)의 refresh token은 회전/폐기할 수 없으므로 401
+    exp = datetime.now(timezone.utc) + timedelta(days=1)
+    legacy = jwt.encode({"sub": "1", "role": "USER", "type": "refresh", "exp": exp}, settings.jwt_secret, algorithm="HS256")
+    r = client.post("/api/v1/auth/refresh", json={"refreshToken": legacy})
+    assert r.status_code == 401 and r.json()["code"] == "UNAUTHORIZED"
+
+def test_bloom_and_expiry(session_factory):
+    bloom = BloomFilter(1 << 12, 5)
+    keys = [f"k{i}" for i in range(200)]
+    for k in keys:
+        bloom.add(k)
+    assert all(k in bloom for k in keys)
+    assert sum(f"x{i}" in bloom for i in range(1000)) < 100
+
+    rl = RevocationList(session_factory, bloom_bits=1 << 12, bloom_hashes=5, purge_sec=0)
+    now = time.time()
+    rl._on_message({"jti": "alive", "exp": now + 60})
+    rl._on_message({"jti": "old", "exp": now - 1})
+    assert rl.is_revoked("alive") and not rl.is_revoked("old") and not rl.is_revoked(None)
+    # purge 후 만료된 항목은 dict/Bloom에서 빠짐
+    assert rl.stats()["size"] == 1
+
+    # DB에서 다시 읽기 (버스 리셋 / 새 워커)
+    db = session_factory()
+    rl.revoke(db, "fromdb", datetime.now(timezone.utc) + timedelta(minutes=5))
+    db.close()
+    fresh = RevocationList(session_factory, bloom_bits=1 << 12, bloom_hashes=5)
+    fresh.load()
+    assert fresh.is_revoked("fromdb") and not fresh.is_revoked("alive")
+
+def test_revoke_purges_expired_rows(session_factory):
+    db = session_factory()
+    past = datetime.now(timezone.utc) - timedelta(minutes=1)
+    db.add_all([RevokedToken(jti=f"expired{i}", expires_at=past) for i in range(5)])
+    db.commit()
+
+    # purge 주기 전: 만료된 행도 그대로
+    rl = RevocationList(session_factory, bloom_bits=1 << 12, bloom_hashes=5, purge_sec=300)
+    rl.revoke(db, "keep1", datetime.now(timezone.utc) + timedelta(minutes=5))
+    assert db.scalar(select(func.count()).select_from(RevokedToken).where(RevokedToken.jti.like("expired%"))) == 5
+
+    # 주기가 되면 revoke한 워커가 chunk 단위로 삭제
+    rl._next_db_purge = 0
+    rl.revoke(db, "keep2", datetime.now(timezone.utc) + timedelta(minutes=5))
+    assert db.scalar(select(func.count()).select_from(RevokedToken).where(RevokedToken.jti.like("expired%"))) == 0
+    assert db.get(RevokedToken, "keep1") and db.get(RevokedToken, "keep2")
+    db.close()
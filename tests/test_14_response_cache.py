@@ -0,0 +1,153 @@
+import importlib
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from tests.utils import auth_header, create_category_as_admin, create_item, publish_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.api.v1 import router as v1_router
+from app.core.config import settings
+from app.core.errors import AppError, error_response
+from app.db.session import get_db
+from app.services.response_cache import MemoryBackend, ResponseCache, response_cache
+
+def _wait(cond, timeout=3.0):
+    deadline = time.time() + timeout
+    while not cond() and time.time() < deadline:
+        time.sleep(0.01)
+    return cond()
+
+def test_concurrent_misses_share_one_load(db):
+    cache = ResponseCache(MemoryBackend())
+    calls = []
+    gate = threading.Event()
+
+    def load(s):
+        calls.append(1)
+        gate.wait(2)
+        return {"v": len(calls)}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load(db, "k", load, ttl=60))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)
+    gate.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == [{"v": 1}] * 8
+
+def test_stale_served_while_single_refresh_runs(db):
+    cache = ResponseCache(MemoryBackend())
+    calls = []
+    gate = threading.Event()
+
+    def load(s):
+        calls.append(1)
+        if len(calls) > 1:
+            gate.wait(2)
+        return len(calls)
+
+    assert cache.get_or_load(db, "k", load, ttl=0.05, stale_ttl=60) == 1
+    time.sleep(0.1)
+    # 만료 후 여러 번 요청해도 예전 값 + 백그라운드 갱신 한 번
+    assert [cache.get_or_load(db, "k", load, ttl=0.05, stale_ttl=60) for _ in range(5)] == [1] * 5
+    gate.set()
+    assert _wait(lambda: cache.get_or_load(db, "k", load, ttl=60) == 2)
+    assert len(calls) == 2
+    assert cache.stale_hits == 5
+
+def test_tags(db):
+    cache = ResponseCache(MemoryBackend())
+    n = {"count": 0}
+
+    def load(s):
+        n["count"] += 1
+        return n["count"]
+
+    assert cache.get_or_load(db, "hard", load, ttl=60, stale_ttl=60, tags=("t",)) == 1
+    assert cache.get_or_load(db, "hard", load, ttl=60, stale_ttl=60, tags=("t",)) == 1
+    cache._on_message({"tags": ["t"]})
+
+    # 무효화 후엔 stale 구간이어도 예전 값 없이 바로 새 값
+    assert cache.get_or_load(db, "hard", load, ttl=60, stale_ttl=60, tags=("t",)) == 2
+
+def test_key_normalizes_params():
+    assert ResponseCache.key("items", size=20, page=0, status=None) == ResponseCache.key("items", page=0, size=20)
+
+def test_write_routes_invalidate_cached_reads(client, db):
+    admin_tok = make_admin(client, db)
+    seller = make_user(client, "rc_seller@example.com", "rcs")
+
+    before = client.get("/api/v1/categories").json()
+    cat_id = create_category_as_admin(client, admin_tok, "응답캐시")
+    assert len(client.get("/api/v1/categories").json()) == len(before) + 1
+
+    client.patch(f"/api/v1/categories/{cat_id}", headers=auth_header(admin_tok), json={"name": "응답캐시2"})
+    assert "응답캐시2" in [c["name"] for c in client.get("/api/v1/categories").json()]
+
+    item_id = create_item(client, seller, cat_id, title="캐시 전")
+    listed = client.get(f"/api/v1/items?categoryId={cat_id}").json()
+    assert [i["title"] for i in listed["content"]] == ["캐시 전"]
+    assert client.get(f"/api/v1/items/{item_id}").json()["title"] == "캐시 전"
+
+    client.patch(f"/api/v1/items/{item_id}", headers=auth_header(seller), json={"title": "캐시 후"})
+    assert client.get(f"/api/v1/items/{item_id}").json()["title"] == "캐시 후"
+    assert client.get(f"/api/v1/items?categoryId={cat_id}").json()["content"][0]["title"] == "캐시 후"
+
+    publish_item(client, seller, item_id)
+    assert client.get(f"/api/v1/items/{item_id}").json()["status"] == "OPEN"
+    assert client.get(f"/api/v1/items?categoryId={cat_id}&status=OPEN").json()["totalElements"] == 1
+
+@pytest.fixture
+def async_enabled_client(session_factory):
+    # ASYNC_DB_ENABLED=true일 때의 v1 라우터 (async 라우트가 먼저 등록됨)
+    settings.async_db_enabled = True
+    try:
+        v1 = importlib.reload(v1_router).router
+    finally:
+        settings.async_db_enabled = False
+        importlib.reload(v1_router)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = override_get_db
+    app.include_router(v1)
+
+    @app.exception_handler(AppError)
+    def app_error_handler(req: Request, exc: AppError):
+        return error_response(req, exc.status, exc.code, exc.message, exc.details, exc.headers)
+
+    with TestClient(app) as c:
+        yield c
+
+def test_async_enabled_reads_use_response_cache(client, db, async_enabled_client):
+    # async 스택을 켜도 아이템 상세/카테고리 목록은 응답 캐시(+ ETag)를 거침
+    admin_tok = make_admin(client, db)
+    seller = make_user(client, "rc_async@example.com", "rca")
+    cat_id = create_category_as_admin(client, admin_tok, "비동기캐시")
+    item_id = create_item(client, seller, cat_id, title="async cache")
+
+    for url in (f"/api/v1/items/{item_id}", "/api/v1/categories"):
+        first = async_enabled_client.get(url)
+        assert first.status_code == 200, first.text
+        hits = response_cache.hits
+        second = async_enabled_client.get(url)
+        assert second.json() == first.json()
+        assert response_cache.hits == hits + 1
+        assert async_enabled_client.get(url, headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+    # 쓰기 라우트의 태그 무효화도 그대로 반영
+    client.patch(f"/api/v1/items/{item_id}", headers=auth_header(seller), json={"title": "async cache 2"})
+    assert async_enabled_client.get(f"/api/v1/items/{item_id}").json()["title"] == "async cache 2"
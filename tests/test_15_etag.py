@@ -0,0 +1,71 @@
+from sqlalchemy import event
+
+from tests.utils import auth_header, create_category_as_admin, create_item, publish_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+
+def _count_selects(engine):
+    seen = []
+    def before(conn, cursor, statement, params, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            seen.append(statement)
+    event.listen(engine, "before_cursor_execute", before)
+    return seen, lambda: event.remove(engine, "before_cursor_execute", before)
+
+def test_item_etag_304_and_change(client, db, session_factory):
+    admin_tok = make_admin(client, db)
+    seller = make_user(client, "etag_seller@example.com", "es")
+    cat_id = create_category_as_admin(client, admin_tok, "이태그")
+    item_id = create_item(client, seller, cat_id, title="etag item")
+
+    r = client.get(f"/api/v1/items/{item_id}")
+    etag = r.headers["etag"]
+    assert r.status_code == 200 and etag.startswith('"')
+
+    # 캐시된 아이템은 DB 조회 없이 304, 본문 없음
+    seen, remove = _count_selects(session_factory.kw["bind"])
+    try:
+        r = client.get(f"/api/v1/items/{item_id}", headers={"If-None-Match": etag})
+    finally:
+        remove()
+    assert r.status_code == 304 and r.content == b"" and r.headers["etag"] == etag
+    assert seen == []
+
+    assert client.get(f"/api/v1/items/{item_id}", headers={"If-None-Match": f'"x", W/{etag}'}).status_code == 304
+
+    # 같은 초 안의 수정도 다른 ETag
+    client.patch(f"/api/v1/items/{item_id}", headers=auth_header(seller), json={"title": "etag item 2"})
+    r = client.get(f"/api/v1/items/{item_id}", headers={"If-None-Match": etag})
+    assert r.status_code == 200 and r.json()["title"] == "etag item 2"
+    assert r.headers["etag"] != etag
+
+def test_bids_etag_follows_bid_count(client, db):
+    admin_tok = make_admin(client, db)
+    seller = make_user(client, "etag_s2@example.com", "es2")
+    bidder = make_user(client, "etag_b2@example.com", "eb2")
+    cat_id = create_category_as_admin(client, admin_tok, "이태그")
+    item_id = create_item(client, seller, cat_id, title="etag bids", start_price=1000, bid_unit=100)
+    publish_item(client, seller, item_id)
+
+    r = client.get(f"/api/v1/items/{item_id}/bids")
+    etag = r.headers["etag"]
+    assert client.get(f"/api/v1/items/{item_id}/bids", headers={"If-None-Match": etag}).status_code == 304
+    # 쿼리가 다르면 다른 ETag
+    assert client.get(f"/api/v1/items/{item_id}/bids?size=5", headers={"If-None-Match": etag}).status_code == 200
+
+    r = client.post(f"/api/v1/items/{item_id}/bids", headers=auth_header(bidder), json={"amount": 1100})
+    assert r.status_code == 200, r.text
+    r = client.get(f"/api/v1/items/{item_id}/bids", headers={"If-None-Match": etag})
+    assert r.status_code == 200 and r.json()["totalElements"] == 1
+
+    assert client.get("/api/v1/items/999999/bids", headers={"If-None-Match": etag}).status_code == 404
+
+def test_categories_etag_changes_on_rename(client, db):
+    admin_tok = make_admin(client, db)
+    cat_id = create_category_as_admin(client, admin_tok, "이태그 카테고리")
+
+    etag = client.get("/api/v1/categories").headers["etag"]
+    assert client.get("/api/v1/categories", headers={"If-None-Match": etag}).status_code == 304
+
+    client.patch(f"/api/v1/categories/{cat_id}", headers=auth_header(admin_tok), json={"name": "이태그 카테고리2"})
+    r = client.get("/api/v1/categories", headers={"If-None-Match": etag})
+    assert r.status_code == 200 and r.headers["etag"] != etag
@@ -0,0 +1,92 @@
+import random
+
+from sqlalchemy import event
+
+from tests.utils import auth_header, create_category_as_admin, create_item, publish_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.core.config import settings
+from app.models.item import Item
+from app.services.leaderboard import Leaderboard, leaderboard
+
+def test_top_k_eviction_and_order(session_factory):
+    lb = Leaderboard(session_factory, size=3)
+    for item_id, n in [(1, 5), (2, 3), (3, 7)]:
+        lb.record(item_id, n)
+    lb.record(4, 2)  # 최솟값(3)보다 작으면 못 들어옴
+    assert lb.top(10) == [(3, 7), (1, 5), (2, 3)]
+
+    lb.record(4, 6)  # 2번을 밀어냄
+    lb.record(1, 4)  # 줄어든 값은 무시 (단조 증가)
+    assert lb.top(10) == [(3, 7), (4, 6), (1, 5)]
+    assert lb.top(1) == [(3, 7)]
+
+def test_top_k_heap_matches_linear_scan(session_factory):
+    # heap으로 최솟값을 찾아도 전체를 훑어서 최솟값을 찾는 것과 같은 결과
+    rnd = random.Random(7)
+    lb = Leaderboard(session_factory, size=5)
+    ref: dict[int, int] = {}
+    counts: dict[int, int] = {}
+    for _ in range(2000):
+        item_id = rnd.randint(1, 40)
+        counts[item_id] = counts.get(item_id, 0) + rnd.randint(1, 3)
+        lb.record(item_id, counts[item_id])
+        if item_id in ref or len(ref) < 5:
+            ref[item_id] = max(ref.get(item_id, 0), counts[item_id])
+        else:
+            low = min(ref, key=lambda i: (ref[i], i))
+            if counts[item_id] > ref[low]:
+                del ref[low]
+                ref[item_id] = counts[item_id]
+    assert lb.top(5) == sorted(ref.items(), key=lambda e: (-e[1], -e[0]))
+    assert len(lb._heap) <= 2 * 5 + 16
+
+def test_endpoint_limit_follows_leaderboard_size(client, monkeypatch):
+    monkeypatch.setattr(settings, "leaderboard_size", 2)
+    monkeypatch.setattr(leaderboard, "_top", {101: 9, 102: 8, 103: 7})
+    content = client.get("/api/v1/stats/items/top-bid-count?limit=50").json()["content"]
+    assert [c["itemId"] for c in content] == [101, 102]
+
+def _bid(client, tok, item_id, amount):
+    r = client.post(f"/api/v1/items/{item_id}/bids", headers=auth_header(tok), json={"amount": amount})
+    assert r.status_code == 200, r.text
+
+def test_endpoint_follows_bids_without_group_by(client, db, session_factory):
+    admin_tok = make_admin(client, db)
+    seller = make_user(client, "lb_seller@example.com", "lbs")
+    bidder = make_user(client, "lb_bidder@example.com", "lbb")
+    cat_id = create_category_as_admin(client, admin_tok, "리더보드")
+    a = create_item(client, seller, cat_id, title="lb a", start_price=1000, bid_unit=100)
+    b = create_item(client, seller, cat_id, title="lb b", start_price=1000, bid_unit=100)
+    publish_item(client, seller, a)
+    publish_item(client, seller, b)
+
+    for i in range(1, 4):
+        _bid(client, bidder, a, 1000 + i * 100)
+    _bid(client, bidder, b, 1100)
+    r = client.post("/api/v1/bids:batch", headers=auth_header(bidder), json={"bids": [{"itemId": b, "amount": 1200}]})
+    assert r.status_code == 200 and r.json()["accepted"] == 1
+
+    seen = []
+    listen = lambda conn, cursor, statement, *args: seen.append(statement)
+    engine = session_factory.kw["bind"]
+    event.listen(engine, "before_cursor_execute", listen)
+    try:
+        content = client.get("/api/v1/stats/items/top-bid-count?limit=50").json()["content"]
+    finally:
+        event.remove(engine, "before_cursor_execute", listen)
+    assert seen == []
+
+    counts = {c["itemId"]: c["bidCount"] for c in content}
+    assert counts[a] == 3 and counts[b] == 2
+    assert [c["bidCount"] for c in content] == sorted([c["bidCount"] for c in content], reverse=True)
+
+    # 카운터가 어긋나도 관리자 rebuild로 bids에서 다시 계산
+    db.get(Item, a).bid_count = 100
+    db.commit()
+    assert client.post("/api/v1/admin/stats/leaderboard/rebuild", headers=auth_header(bidder)).status_code == 403
+    r = client.post("/api/v1/admin/stats/leaderboard/rebuild", headers=auth_header(admin_tok))
+    assert r.status_code == 200 and r.json()["updatedItems"] >= 1
+    db.expire_all()
+    assert db.get(Item, a).bid_count == 3
+    content = client.get("/api/v1/stats/items/top-bid-count?limit=50").json()["content"]
+    assert {c["itemId"]: c["bidCount"] for c in content}[a] == 3
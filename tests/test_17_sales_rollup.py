@@ -0,0 +1,89 @@
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from tests.utils import auth_header
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.models.category import Category
+from app.models.daily_sales import DailySales
+from app.models.item import Item, ItemStatus
+from app.models.order import Order, OrderStatus
+from app.models.user import User
+from app.services.sales_rollup import backfill, record_status_change
+
+def _orders(db, buyer_id, specs):
+    cat = db.scalar(select(Category).where(Category.name == "매출롤업"))
+    if not cat:
+        cat = Category(name="매출롤업")
+        db.add(cat)
+        db.flush()
+    orders = []
+    for created_at, status, price in specs:
+        it = Item(seller_id=buyer_id, category_id=cat.id, title="rollup", description="d",
+                  start_price=price, bid_unit=100, current_price=price, status=ItemStatus.CLOSED)
+        db.add(it)
+        db.flush()
+        o = Order(item_id=it.id, buyer_id=buyer_id, total_price=price, status=status, created_at=created_at)
+        db.add(o)
+        orders.append(o)
+    db.commit()
+    return orders
+
+def _rollup(db, day):
+    db.expire_all()
+    r = db.get(DailySales, day)
+    return (r.sales, r.orders) if r else None
+
+def test_backfill_in_chunks_matches_orders(client, db):
+    make_user(client, "rollup_a@example.com", "ra")
+    uid = db.scalar(select(User.id).where(User.email == "rollup_a@example.com"))
+    d1 = datetime(2020, 1, 1, 10)
+    d2 = datetime(2020, 1, 9, 23, 59)
+    _orders(db, uid, [
+        (d1, OrderStatus.PAID, 1000),
+        (d1, OrderStatus.COMPLETED, 500),
+        (d1, OrderStatus.CANCELLED, 700),
+        (d1, OrderStatus.PENDING, 900),
+        (d2, OrderStatus.SHIPPED, 300),
+    ])
+    # 기존 잘못된 값은 덮어씀
+    db.add(DailySales(day=date(2020, 1, 5), sales=1, orders=1))
+    db.commit()
+
+    chunks = []
+    backfill(db, date(2020, 1, 1), date(2020, 1, 15), chunk_days=4, progress=lambda lo, hi, n: chunks.append((lo, hi)))
+    assert len(chunks) == 4 and chunks[-1][1] == date(2020, 1, 15)
+    assert _rollup(db, date(2020, 1, 1)) == (1500, 2)
+    assert _rollup(db, date(2020, 1, 9)) == (300, 1)
+    assert _rollup(db, date(2020, 1, 5)) is None
+
+    # 상태 전이 반영: 새 날짜는 insert, 기존 날짜는 증감
+    o = db.scalars(select(Order).where(Order.created_at == d2)).one()
+    record_status_change(db, o, OrderStatus.SHIPPED, OrderStatus.CANCELLED)
+    db.commit()
+    assert _rollup(db, date(2020, 1, 9)) == (0, 0)
+    record_status_change(db, o, OrderStatus.PENDING, OrderStatus.PAID)
+    record_status_change(db, o, OrderStatus.PAID, OrderStatus.SHIPPED)  # 둘 다 집계 대상 -> 변화 없음
+    db.commit()
+    assert _rollup(db, date(2020, 1, 9)) == (300, 1)
+
+def test_endpoint_reads_rollup_and_cancel_corrects(client, db):
+    admin_tok = make_admin(client, db)
+    buyer_tok = make_user(client, "rollup_b@example.com", "rb")
+    uid = db.scalar(select(User.id).where(User.email == "rollup_b@example.com"))
+    created = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=100)
+    day = created.date()
+    paid, done = _orders(db, uid, [(created, OrderStatus.PAID, 2000), (created, OrderStatus.COMPLETED, 3000)])
+    backfill(db, day, day + timedelta(days=1))
+
+    def sales_on(days):
+        r = client.get(f"/api/v1/stats/sales/daily?days={days}", headers=auth_header(admin_tok))
+        assert r.status_code == 200
+        return {c["day"]: (c["sales"], c["orders"]) for c in r.json()["content"]}.get(str(day))
+
+    assert sales_on(30) is None
+    assert sales_on(365) == (5000, 2)
+
+    r = client.post(f"/api/v1/orders/{paid.id}/cancel", headers=auth_header(buyer_tok))
+    assert r.status_code == 200
+    assert sales_on(365) == (3000, 1)
@@ -0,0 +1,124 @@
+import logging.config
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, select
+
+from tests.utils import auth_header, capture_plans, full_scans, create_category_as_admin, create_item, publish_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.core.config import settings
+from app.db.base import Base
+from app.models.item import Item
+from app.services.response_cache import response_cache
+
+# 목록/조회 라우트의 주 쿼리가 인덱스를 타는지 (풀 스캔이면 실패)
+HOT_TABLES = {"items", "bids", "orders", "watches", "categories", "users"}
+
+@pytest.fixture()
+def no_response_cache():
+    # 캐시 hit이면 쿼리가 안 나가므로 꺼두고 확인
+    response_cache.enabled = False
+    yield
+    response_cache.enabled = True
+
+@pytest.fixture()
+def setup(client, db):
+    admin_tok = make_admin(client, db)
+    seller = make_user(client, "plan_seller@example.com", "ps")
+    bidder = make_user(client, "plan_bidder@example.com", "pb")
+    cat_id = create_category_as_admin(client, admin_tok, "플랜")
+    item_id = create_item(client, seller, cat_id, title="plan item", start_price=1000, bid_unit=100)
+    publish_item(client, seller, item_id)
+    r = client.post(f"/api/v1/items/{item_id}/bids", headers=auth_header(bidder), json={"amount": 1100})
+    assert r.status_code == 200, r.text
+    client.post(f"/api/v1/items/{item_id}/watch", headers=auth_header(bidder))
+    return {"cat_id": cat_id, "item_id": item_id, "bidder": bidder}
+
+def _routes(s):
+    item_id, cat_id = s["item_id"], s["cat_id"]
+    return [
+        "/api/v1/items?status=OPEN",
+        "/api/v1/items?status=OPEN&withTotal=false",
+        "/api/v1/items?status=OPEN&cursor=",
+        f"/api/v1/items?categoryId={cat_id}&status=OPEN",
+        f"/api/v1/items?categoryId={cat_id}&withTotal=false",
+        f"/api/v1/items/{item_id}",
+        f"/api/v1/items/{item_id}/bids",
+        f"/api/v1/items/{item_id}/bids?sort=createdAt,DESC",
+        f"/api/v1/items/{item_id}/bids?cursor=",
+        "/api/v1/users/me/bids",
+        "/api/v1/users/me/bids?cursor=",
+        "/api/v1/orders",
+        "/api/v1/orders?cursor=",
+        "/api/v1/users/me/watches",
+    ]
+
+def test_hot_routes_use_indexes(client, session_factory, setup, no_response_cache):
+    engine = session_factory.kw["bind"]
+    for url in _routes(setup):
+        with capture_plans(engine) as plans:
+            r = client.get(url, headers=auth_header(setup["bidder"]))
+        assert r.status_code == 200, (url, r.text)
+        assert plans, url
+        assert full_scans(plans, HOT_TABLES) == [], url
+
+def test_harness_flags_full_scan(db, session_factory):
+    # 인덱스 없는 컬럼 조건은 풀 스캔으로 잡혀야 함
+    with capture_plans(session_factory.kw["bind"]) as plans:
+        db.scalars(select(Item.id).where(Item.description == "x")).all()
+    assert [t for t, _ in full_scans(plans, HOT_TABLES)] == ["items"]
+
+def _alembic(tmp_path, monkeypatch):
+    from alembic.config import Config
+
+    url = f"sqlite:///{tmp_path / 'migrate.db'}"
+    monkeypatch.setattr(settings, "database_url", url)
+    monkeypatch.setattr(logging.config, "fileConfig", lambda *a, **k: None)  # 테스트 로깅 설정 유지
+    root = Path(__file__).resolve().parents[1]
+    cfg = Config(str(root / "alembic.ini"))
+    cfg.set_main_option("script_location", str(root / "src" / "alembic"))
+    return url, cfg
+
+def test_migrations_match_models(tmp_path, monkeypatch):
+    # 빈 DB에 upgrade head -> 모델 메타데이터와 차이 없음, downgrade base까지 왕복
+    pytest.importorskip("alembic")
+    from alembic import command
+    from alembic.autogenerate import compare_metadata
+    from alembic.migration import MigrationContext
+
+    url, cfg = _alembic(tmp_path, monkeypatch)
+    command.upgrade(cfg, "head")
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        assert compare_metadata(MigrationContext.configure(conn), Base.metadata) == []
+    command.downgrade(cfg, "base")
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE name = 'bids'").first() is None
+    engine.dispose()
+
+def test_upgrade_backfills_item_price_columns(tmp_path, monkeypatch):
+    # 최초 스키마(0001)에 입찰이 있는 DB -> upgrade 후 현재가/최고 입찰자/입찰 수가 bids 기준으로 채워짐
+    pytest.importorskip("alembic")
+    from alembic import command
+
+    url, cfg = _alembic(tmp_path, monkeypatch)
+    command.upgrade(cfg, "0001")
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO users (id, email, password_hash, nickname, role, status) VALUES "
+            "(1, 's@x', 'x', 's', 'USER', 'ACTIVE'), (2, 'a@x', 'x', 'a', 'USER', 'ACTIVE'), (3, 'b@x', 'x', 'b', 'USER', 'ACTIVE')"
+        )
+        conn.exec_driver_sql("INSERT INTO categories (id, name) VALUES (1, 'c')")
+        conn.exec_driver_sql(
+            "INSERT INTO items (id, seller_id, category_id, title, description, start_price, bid_unit, status) VALUES "
+            "(1, 1, 1, 'bid', 'd', 1000, 100, 'OPEN'), (2, 1, 1, 'none', 'd', 5000, 100, 'OPEN')"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO bids (item_id, bidder_id, amount) VALUES (1, 2, 1100), (1, 3, 1300), (1, 2, 1200)"
+        )
+    command.upgrade(cfg, "head")
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql("SELECT id, current_price, top_bidder_id, bid_count FROM items ORDER BY id").all()
+    assert [tuple(r) for r in rows] == [(1, 1300, 3, 3), (2, 5000, None, 0)]
+    engine.dispose()
@@ -0,0 +1,62 @@
+from array import array
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine, select, func
+
+from app.core.config import settings
+from app.db.base import Base
+from app.models.bid import Bid
+from app.models.item import Item
+from app.models.order import Order
+from app.models.user import User
+from app.seed_bulk import Plan, item_chunk, run
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+def _plan(**kw):
+    base = dict(seed=7, now=NOW, days=60, prefix="bulk", users=40, items=300, bids=3000, watches=600,
+                orders=40, chunk=100, batch=500, index=False, user_id0=1, item_id0=1)
+    base.update(kw)
+    return Plan(**base)
+
+def test_item_chunk_is_deterministic_and_bids_valid():
+    plan = _plan()
+    users = array("q", range(1, 41))
+    rows = item_chunk(plan, 1, [1, 2], users)
+    assert rows == item_chunk(plan, 1, [1, 2], users)
+    assert rows != item_chunk(_plan(seed=8), 1, [1, 2], users)
+    assert [it["id"] for it in rows["items"]] == list(range(101, 201))
+    assert len(rows["bids"]) == 1000  # 청크별 할당 합 = --bids
+
+    # 아이템별 입찰은 bid_unit 이상씩 오르고, 판매자는 입찰하지 않고, 마지막 입찰이 items 컬럼과 일치
+    items = {it["id"]: it for it in rows["items"]}
+    last: dict[int, dict] = {}
+    for b in rows["bids"]:
+        it = items[b["item_id"]]
+        prev = last[b["item_id"]]["amount"] if b["item_id"] in last else it["start_price"]
+        assert b["amount"] >= prev + it["bid_unit"]
+        assert b["bidder_id"] != it["seller_id"]
+        assert it["starts_at"] <= b["created_at"] <= NOW
+        last[b["item_id"]] = b
+    for item_id, b in last.items():
+        assert (items[item_id]["current_price"], items[item_id]["top_bidder_id"]) == (b["amount"], b["bidder_id"])
+
+    assert len({(w["user_id"], w["item_id"]) for w in rows["watches"]}) == len(rows["watches"])
+    assert all(items[o["item_id"]]["top_bidder_id"] == o["buyer_id"] for o in rows["orders"])
+
+def test_run_bulk_inserts(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'bulk.db'}"
+    monkeypatch.setattr(settings, "database_url", url)
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+
+    totals = run(_plan(), log=lambda *a: None)
+    assert totals["users"] == 40 and totals["items"] == 300 and totals["bids"] == 3000
+
+    with engine.connect() as conn:
+        assert conn.scalar(select(func.count()).select_from(User)) == 40
+        assert conn.scalar(select(func.sum(Item.bid_count))) == conn.scalar(select(func.count()).select_from(Bid))
+        top = select(func.max(Bid.amount)).where(Bid.item_id == Item.id).scalar_subquery()
+        assert conn.scalar(select(func.count()).where(Item.bid_count > 0, Item.current_price != top)) == 0
+        assert conn.scalar(select(func.count()).select_from(Order)) == totals["orders"]
+    engine.dispose()
@@ -0,0 +1,86 @@
+import re
+
+import pytest
+
+from tests.utils import create_category_as_admin, create_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.core.metrics import Histogram, instrument_engine, registry
+from app.services.response_cache import response_cache
+
+def _value(text: str, name: str, **labels) -> float:
+    # 라벨이 모두 일치하는 시계열 값
+    for line in text.splitlines():
+        if not line.startswith(name + "{") and not line.startswith(name + " "):
+            continue
+        got = dict(re.findall(r'(\w+)="([^"]*)"', line.split(" ")[0]))
+        if all(got.get(k) == v for k, v in labels.items()):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{name} {labels} not found")
+
+def test_histogram_buckets_are_cumulative():
+    h = Histogram("t_seconds", "test", ("route",), (0.1, 1.0))
+    for v in (0.05, 0.1, 0.5, 2.0):
+        h.observe(("/x",), v)
+    text = "\n".join(h.render())
+    assert _value(text, "t_seconds_bucket", route="/x", le="0.1") == 2  # le는 경계 포함
+    assert _value(text, "t_seconds_bucket", route="/x", le="1.0") == 3
+    assert _value(text, "t_seconds_bucket", route="/x", le="+Inf") == 4
+    assert _value(text, "t_seconds_count", route="/x") == 4
+    assert _value(text, "t_seconds_sum", route="/x") == pytest.approx(2.65)
+
+_instrumented = set()
+
+@pytest.fixture(autouse=True)
+def instrumented(session_factory):
+    # 테스트 DB 엔진에도 운영 엔진과 같은 훅 (세션 전체 공용 엔진이라 한 번만)
+    engine = session_factory.kw["bind"]
+    if id(engine) not in _instrumented:
+        instrument_engine(engine, name="test")
+        _instrumented.add(id(engine))
+
+def test_route_template_labels_and_db_counts(client, db):
+    admin_tok = make_admin(client, db)
+    seller = make_user(client, "metrics_seller@example.com", "ms")
+    cat_id = create_category_as_admin(client, admin_tok, "메트릭")
+    a = create_item(client, seller, cat_id, title="metrics a")
+    b = create_item(client, seller, cat_id, title="metrics b")
+
+    response_cache.enabled = False
+    try:
+        before = registry.render()
+        for item_id in (a, b):
+            assert client.get(f"/api/v1/items/{item_id}").status_code == 200
+        assert client.get("/api/v1/items/999999").status_code == 404
+        assert client.get("/api/v1/no-such-path/123").status_code == 404
+    finally:
+        response_cache.enabled = True
+
+    text = client.get("/metrics").text
+    route = "/api/v1/items/{item_id}"
+
+    def delta(name, **labels):
+        try:
+            old = _value(before, name, **labels)
+        except AssertionError:
+            old = 0
+        return _value(text, name, **labels) - old
+
+    # 아이템 id가 아니라 경로 템플릿으로 묶임
+    assert delta("http_request_duration_seconds_count", method="GET", route=route, status="200") == 2
+    assert delta("http_request_duration_seconds_count", method="GET", route=route, status="404") == 1
+    assert delta("http_request_duration_seconds_count", method="GET", route="<unmatched>", status="404") == 1
+    assert "/api/v1/items/%d" % a not in text
+
+    # 요청별 SQL 수 / 시간, 풀 대기
+    assert delta("http_request_db_queries_count", method="GET", route=route) == 3
+    assert delta("http_request_db_queries_sum", method="GET", route=route) >= 3
+    assert delta("db_query_duration_seconds_count", operation="SELECT") >= 3
+    assert _value(text, "db_pool_checkout_seconds_count", engine="test") > 0
+
+def test_slow_request_log(client, caplog, monkeypatch):
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "slow_request_ms", 0.0001)
+    with caplog.at_level("WARNING", logger="app.core.metrics"):
+        client.get("/api/v1/categories")
+    assert any("slow request GET /api/v1/categories" in r.getMessage() and "db_queries=" in r.getMessage()
+               for r in caplog.records)
@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+from tests.utils import auth_header, create_category_as_admin, create_item, publish_item, query_budget
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.models.bid import Bid
+from app.models.item import Item
+from app.services.response_cache import response_cache
+
+# 라우트별 SQL 문 수 상한. 관계 로딩이나 추가 조회가 끼어들면 여기서 실패
+# (인증은 토큰 검증 + principal 캐시라 DB를 쓰지 않음 -> 예산은 라우트 본문의 쿼리만)
+BUDGETS = [
+    ("/items?status=OPEN", 2),               # COUNT + 목록
+    ("/items?categoryId={cat}", 1),          # 캐시된 COUNT + 목록
+    ("/items?keyword=qb22", 2),
+    ("/items?status=OPEN&cursor=", 1),
+    ("/items?status=OPEN&withTotal=false", 1),
+    ("/items/{item}", 1),
+    ("/items/{item}/bids", 2),               # bid_count + 목록
+    ("/items/{item}/bids?cursor=", 2),
+    ("/items/{item}/bids/highest", 1),
+    ("/orders", 2),
+    ("/orders?cursor=", 1),
+    ("/orders/{order}", 1),
+    ("/users/me/bids", 2),
+    ("/users/me/watches", 1),
+]
+
+_dataset = {}
+
+@pytest.fixture
+def dataset(client, db):
+    # DB는 세션 전체 공용 -> 한 번만 만들고 재사용
+    if _dataset:
+        return _dataset
+    admin = make_admin(client, db)
+    seller = make_user(client, "qb22_seller@example.com", "qs")
+    bidder = make_user(client, "qb22_bidder@example.com", "qb")
+    cat = create_category_as_admin(client, admin, "쿼리예산")
+    items = []
+    for i in range(3):
+        item = create_item(client, seller, cat, title=f"qb22 {i}", start_price=1000, bid_unit=100)
+        publish_item(client, seller, item)
+        r = client.post(f"/api/v1/items/{item}/bids", headers=auth_header(bidder), json={"amount": 1100})
+        assert r.status_code == 200, r.text
+        client.post(f"/api/v1/items/{item}/watch", headers=auth_header(bidder))
+        items.append(item)
+    assert client.post(f"/api/v1/items/{items[0]}/close", headers=auth_header(seller)).status_code == 200
+    r = client.post(f"/api/v1/items/{items[0]}/orders", headers=auth_header(bidder), json={})
+    assert r.status_code == 200, r.text
+    _dataset.update(cat=cat, item=items[1], order=r.json()["id"], token=bidder)
+    return _dataset
+
+@pytest.fixture
+def no_response_cache():
+    response_cache.enabled = False
+    yield
+    response_cache.enabled = True
+
+@pytest.mark.parametrize("path,budget", BUDGETS)
+def test_route_query_budget(client, session_factory, dataset, no_response_cache, path, budget):
+    url = "/api/v1" + path.format(**dataset)
+    headers = auth_header(dataset["token"])
+    # 첫 호출은 캐시(principal/count 등) 채우기
+    assert client.get(url, headers=headers).status_code == 200
+    with query_budget(session_factory.kw["bind"], budget):
+        r = client.get(url, headers=headers)
+    assert r.status_code == 200, r.text
+
+def test_budget_helper_reports_statements(session_factory):
+    with pytest.raises(AssertionError, match="budget 0"):
+        with query_budget(session_factory.kw["bind"], 0):
+            with session_factory() as s:
+                s.execute(select(Item.id).limit(1)).all()
+
+def test_relationships_are_not_loaded_implicitly(session_factory, dataset):
+    with session_factory() as s:
+        bid = s.scalars(select(Bid).where(Bid.item_id == dataset["item"])).first()
+        with pytest.raises(InvalidRequestError):
+            bid.item
+        # 명시적으로 요청하면 로드
+        item = s.scalars(select(Item).where(Item.id == dataset["item"]).options(selectinload(Item.seller))).one()
+        assert item.seller.id == item.seller_id
@@ -0,0 +1,99 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import TypeAdapter
+
+from tests.utils import auth_header, create_category_as_admin, create_item, publish_item
+from tests.test_02_categories_item_bids_orders import make_admin, make_user
+from app.api import fastjson
+from app.main import app
+from app.schemas.admin import AdminUserRes
+from app.schemas.bid import BidRes
+from app.schemas.common import CursorPageRes, PageRes
+from app.schemas.item import ItemRes
+from app.schemas.order import OrderRes
+from app.schemas.user_bid import MyBidRes
+from app.services.response_cache import response_cache
+
+_dataset = {}
+
+@pytest.fixture
+def dataset(client, db):
+    if _dataset:
+        return _dataset
+    admin = make_admin(client, db)
+    seller = make_user(client, "fj23_seller@example.com", "fs")
+    bidder = make_user(client, "fj23_bidder@example.com", "fb")
+    cat = create_category_as_admin(client, admin, "직렬화")
+    items = []
+    for i in range(3):
+        item = create_item(client, seller, cat, title=f"fj23 {i}", start_price=1000, bid_unit=100)
+        publish_item(client, seller, item)
+        for amount in (1100, 1200):
+            assert client.post(f"/api/v1/items/{item}/bids", headers=auth_header(bidder), json={"amount": amount}).status_code == 200
+        items.append(item)
+    client.post(f"/api/v1/items/{items[0]}/close", headers=auth_header(seller))
+    assert client.post(f"/api/v1/items/{items[0]}/orders", headers=auth_header(bidder), json={"address": "서울"}).status_code == 200
+    _dataset.update(cat=cat, item=items[1], token=bidder, admin=admin)
+    return _dataset
+
+@pytest.fixture(params=[True, False], ids=["cache", "nocache"])
+def cache_mode(request):
+    response_cache.enabled = request.param
+    yield
+    response_cache.enabled = True
+
+LISTS = [
+    ("/items?categoryId={cat}", ItemRes),
+    ("/items?categoryId={cat}&withTotal=false&size=2", ItemRes),
+    ("/items?keyword=fj23", ItemRes),
+    ("/items?categoryId={cat}&cursor=&size=2", ItemRes),
+    ("/items/{item}/bids", BidRes),
+    ("/items/{item}/bids?cursor=&size=1", BidRes),
+    ("/orders", OrderRes),
+    ("/orders?withTotal=false", OrderRes),
+    ("/users/me/bids?size=2", MyBidRes),
+    ("/users/me/bids?cursor=", MyBidRes),
+    ("/admin/users?keyword=fj23", AdminUserRes),
+    ("/admin/users?withTotal=false&size=1", AdminUserRes),
+    ("/admin/users?cursor=&size=1", AdminUserRes),
+]
+
+@pytest.mark.parametrize("path,dto", LISTS)
+def test_fast_path_matches_pydantic_serialization(client, dataset, cache_mode, path, dto):
+    # 응답 본문이 response_model로 검증/직렬화했을 때와 바이트 단위로 같아야 함 (필드 순서/형식 포함)
+    token = dataset["admin"] if path.startswith("/admin") else dataset["token"]
+    r = client.get("/api/v1" + path.format(**dataset), headers=auth_header(token))
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"] == "application/json"
+    adapter = TypeAdapter(PageRes[dto] | CursorPageRes[dto])
+    assert adapter.dump_json(adapter.validate_json(r.content)) == r.content
+    assert r.json()["content"]
+
+def test_bids_list_keeps_etag(client, dataset):
+    url = f"/api/v1/items/{dataset['item']}/bids"
+    r = client.get(url)
+    etag = r.headers["etag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+def test_openapi_schema_unchanged():
+    paths = app.openapi()["paths"]
+    for path, name in [
+        ("/api/v1/items", "ItemRes"), ("/api/v1/items/{item_id}/bids", "BidRes"),
+        ("/api/v1/orders", "OrderRes"), ("/api/v1/users/me/bids", "MyBidRes"),
+        ("/api/v1/admin/users", "AdminUserRes"),
+    ]:
+        schema = paths[path]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        refs = {s["$ref"].rsplit("/", 1)[1] for s in schema["anyOf"]}
+        assert refs == {f"PageRes_{name}_", f"CursorPageRes_{name}_"}
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_matches_pydantic_datetime_format(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(fastjson, "orjson", None)
+    elif fastjson.orjson is None:
+        pytest.skip("orjson not installed")
+    for dt in (datetime(2026, 1, 1, 9, 30), datetime(2026, 1, 1, 9, 30, 0, 120000), datetime(2026, 1, 1, tzinfo=timezone.utc)):
+        res = BidRes(id=1, itemId=2, bidderId=3, amount=1000, createdAt=dt)
+        assert fastjson.dumps({"id": 1, "itemId": 2, "bidderId": 3, "amount": 1000, "createdAt": dt}) == res.model_dump_json().encode()
+    assert fastjson.dumps({"t": "한글"}) == '{"t":"한글"}'.encode()
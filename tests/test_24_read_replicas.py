@@ -0,0 +1,129 @@
+import shutil
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+
+from tests.utils import auth_header
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.replicas import Replica, RoutingSession, replica_router
+from app.db.session import get_db
+from app.main import app
+from app.models.category import Category
+from app.models.item import Item, ItemStatus
+from app.models.replica_heartbeat import ReplicaHeartbeat
+from app.models.user import User
+
+# primary / replica를 SQLite 파일 두 개로: primary를 만든 뒤 파일을 복사해서 레플리카로 쓰고,
+# 이후 primary만 바꿔서 "아직 복제되지 않은" 상태를 만든다. 복제 지연은 레플리카의 heartbeat 값으로 조절
+
+USER_ID = 900001
+ITEM_ID = 900001
+
+@pytest.fixture
+def replicated(tmp_path, monkeypatch):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(primary)
+    with sessionmaker(bind=primary)() as s:
+        s.add(User(id=USER_ID, email="replica@example.com", password_hash="x", nickname="r"))
+        s.add(Category(id=ITEM_ID, name="레플리카"))
+        s.add(Item(
+            id=ITEM_ID, seller_id=USER_ID, category_id=ITEM_ID, title="replica", description="d",
+            start_price=1000, bid_unit=100, current_price=1000, status=ItemStatus.OPEN,
+        ))
+        s.commit()
+    primary.dispose()
+    shutil.copy(tmp_path / "primary.db", tmp_path / "replica.db")
+    # 복제되기 전의 primary 변경
+    with primary.begin() as conn:
+        conn.execute(update(Item).where(Item.id == ITEM_ID).values(current_price=2000))
+
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}", connect_args={"check_same_thread": False})
+    monkeypatch.setattr(replica_router, "replicas", [Replica("replica", replica)])
+    monkeypatch.setattr(replica_router, "_primary", primary)
+    monkeypatch.setattr(replica_router, "_writers", {})
+    monkeypatch.setattr(replica_router, "max_lag_ms", 2000)
+
+    factory = sessionmaker(bind=primary, class_=RoutingSession, autocommit=False, autoflush=False)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    # lifespan(heartbeat 스레드) 없이: 지연은 테스트에서 check()로 직접 측정
+    yield {"client": TestClient(app), "primary": primary, "replica": replica, "factory": factory}
+    app.dependency_overrides.clear()
+    primary.dispose()
+    replica.dispose()
+
+def set_lag(env, lag_ms: int):
+    # 레플리카의 heartbeat를 lag_ms 전 값으로 두고 측정
+    beat = int(time.time() * 1000) - lag_ms
+    with env["replica"].begin() as conn:
+        if conn.execute(update(ReplicaHeartbeat).values(beat_ms=beat)).rowcount == 0:
+            conn.execute(ReplicaHeartbeat.__table__.insert().values(id=1, beat_ms=beat))
+    replica_router.check()
+
+def highest(env, token=None):
+    r = env["client"].get(f"/api/v1/items/{ITEM_ID}/bids/highest", headers=auth_header(token) if token else None)
+    assert r.status_code == 200, r.text
+    return r.json()["highestBid"]
+
+def test_reads_go_to_healthy_replica(replicated):
+    set_lag(replicated, 0)
+    assert replica_router.stats()["replicas"][0]["healthy"]
+    assert highest(replicated) == 1000  # 레플리카 값
+
+def test_lagging_replica_falls_back_to_primary(replicated):
+    set_lag(replicated, 10_000)
+    stats = replica_router.stats()["replicas"][0]
+    assert stats["lagMs"] >= 10_000 and not stats["healthy"]
+    assert highest(replicated) == 2000
+
+    set_lag(replicated, 0)
+    assert highest(replicated) == 1000
+
+def test_unmeasured_replica_is_not_used(replicated):
+    # heartbeat가 아직 복제되지 않음 -> 지연을 알 수 없으므로 primary
+    replica_router.check()
+    assert replica_router.stats()["replicas"][0]["lagMs"] is None
+    assert highest(replicated) == 2000
+
+def test_read_your_writes_window(replicated, monkeypatch):
+    set_lag(replicated, 0)
+    token = create_access_token(str(USER_ID), "USER")
+    assert highest(replicated, token) == 1000
+
+    r = replicated["client"].patch("/api/v1/users/me", headers=auth_header(token), json={"nickname": "rw"})
+    assert r.status_code == 200, r.text
+    # 쓴 사용자는 (비로그인 라우트라도 토큰이 있으면) primary, 다른 사용자는 계속 레플리카
+    assert highest(replicated, token) == 2000
+    assert highest(replicated) == 1000
+    assert highest(replicated, create_access_token(str(USER_ID + 1), "USER")) == 1000
+
+    # 창이 지나면 다시 레플리카
+    monkeypatch.setitem(replica_router._writers, USER_ID, time.monotonic() - 1)
+    assert highest(replicated, token) == 1000
+
+def test_writes_and_pinned_reads_use_primary(replicated):
+    set_lag(replicated, 0)
+    with replicated["factory"]() as s:
+        s.info["read_request"] = object()
+        # 조회 세션이라도 flush/DML은 primary
+        s.get(Category, ITEM_ID).name = "변경"
+        s.commit()
+        assert s.scalar(select(Category.name).where(Category.id == ITEM_ID)) == "레플리카"
+        assert s.scalar(select(Category.name).where(Category.id == ITEM_ID).execution_options(use_primary=True)) == "변경"
+
+def test_health_reports_replicas(replicated):
+    set_lag(replicated, 0)
+    body = replicated["client"].get("/api/v1/health").json()
+    assert body["replicas"]["replicas"][0]["name"] == "replica"
+    assert body["replicas"]["replicas"][0]["healthy"] is True
@@ -0,0 +1,110 @@
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base
+from app.db.pool import PoolMonitor, engine_options, pool_monitor
+from app.db.replicas import RoutingSession
+from app.db.session import get_db
+from app.main import app
+from app.services.response_cache import response_cache
+
+# 크기 1 / overflow 0 / 대기 0.2초인 SQLite 파일 풀로 풀 고갈을 만든다
+
+@pytest.fixture
+def small_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_size", 1)
+    monkeypatch.setattr(settings, "db_max_overflow", 0)
+    monkeypatch.setattr(settings, "db_pool_timeout_ms", 200)
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    engine = create_engine(url, connect_args={"check_same_thread": False}, **engine_options(url))
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, class_=RoutingSession, autocommit=False, autoflush=False)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    monkeypatch.setattr(pool_monitor, "_engines", {"primary": engine})
+    monkeypatch.setattr(pool_monitor, "_liveness", {"primary"})
+    monkeypatch.setattr(pool_monitor, "rejected", 0)
+    # 캐시된 응답은 DB를 거치지 않음
+    monkeypatch.setattr(response_cache, "enabled", False)
+    yield {"client": TestClient(app), "engine": engine}
+    app.dependency_overrides.clear()
+    engine.dispose()
+
+def test_engine_options_from_settings(monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_size", 3)
+    monkeypatch.setattr(settings, "db_pool_timeout_ms", 500)
+    opts = engine_options("mysql+pymysql://u:p@db/auction")
+    assert opts["pool_size"] == 3 and opts["pool_timeout"] == 0.5
+    assert opts["max_overflow"] == settings.db_max_overflow and opts["pool_recycle"] == settings.db_pool_recycle_sec
+    assert opts["pool_pre_ping"] is False
+    # 메모리 SQLite는 크기 옵션을 받지 않는 풀
+    assert set(engine_options("sqlite://")) == {"pool_pre_ping"}
+    assert set(engine_options("sqlite+aiosqlite:///:memory:")) == {"pool_pre_ping"}
+
+def test_exhausted_pool_returns_503_fast(small_pool):
+    client = small_pool["client"]
+    assert client.get("/api/v1/items").status_code == 200
+
+    with small_pool["engine"].connect():
+        t = time.perf_counter()
+        r = client.get("/api/v1/items")
+        elapsed = time.perf_counter() - t
+    assert r.status_code == 503, r.text
+    assert r.headers["retry-after"] == "1"
+    assert r.json()["code"] == "SERVICE_UNAVAILABLE"
+    assert elapsed < 2
+    assert pool_monitor.rejected == 1
+
+    # 반납 후에는 정상
+    assert client.get("/api/v1/items").status_code == 200
+
+def test_rejected_counter_is_thread_safe():
+    monitor = PoolMonitor(liveness_sec=0)
+
+    def hammer():
+        for _ in range(10000):
+            monitor.note_rejected()
+
+    threads = [threading.Thread(target=hammer) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert monitor.stats()["rejected"] == 80000
+
+def test_health_reports_pool(small_pool):
+    with small_pool["engine"].connect():
+        body = small_pool["client"].get("/api/v1/health").json()
+    pool = body["dbPool"]["engines"]["primary"]
+    assert pool["type"] == "QueuePool"
+    assert pool["size"] == 1 and pool["checkedOut"] == 1 and pool["maxOverflow"] == 0
+    assert body["dbPool"]["timeoutMs"] == 200
+
+def test_liveness_check(small_pool, tmp_path):
+    monitor = PoolMonitor(liveness_sec=1)
+    monitor.watch("primary", small_pool["engine"])
+    monitor.check()
+    assert monitor.liveness_failures == 0
+    # 풀이 모두 사용 중이면 실패로 세지 않음
+    with small_pool["engine"].connect():
+        monitor.check()
+    assert monitor.liveness_failures == 0
+
+    monitor.watch("down", create_engine(f"sqlite:///{tmp_path / 'missing' / 'x.db'}"))
+    monitor.watch("stats-only", create_engine(f"sqlite:///{tmp_path / 'missing' / 'y.db'}"), liveness=False)
+    monitor.check()
+    assert monitor.liveness_failures == 1
+    assert monitor.stats()["lastLivenessError"].startswith("down:")
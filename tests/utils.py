@@ -1,3 +1,8 @@
+import re
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
 def auth_header(token: str):
     return {"Authorization": f"Bearer {token}"}
 
@@ -50,3 +55,51 @@ def publish_item(client, token: str, item_id: int):
     r = client.post(f"/api/v1/items/{item_id}/publish", headers=auth_header(token))
     assert r.status_code == 200, r.text
     return r.json()
+
+# 인덱스 없이 테이블 전체를 읽는 계획 (SQLite EXPLAIN QUERY PLAN: "SCAN bids" / 인덱스를 타면 "SCAN bids USING INDEX ...")
+_FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+@contextmanager
+def capture_plans(engine):
+    # 블록 안에서 실행된 SELECT마다 같은 파라미터로 EXPLAIN QUERY PLAN을 떠서 [(sql, [detail, ...])]에 모음
+    plans = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if executemany or not statement.lstrip().upper().startswith("SELECT"):
+            return
+        c = cursor.connection.cursor()
+        try:
+            c.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+            plans.append((statement, [row[3] for row in c.fetchall()]))
+        finally:
+            c.close()
+
+    event.listen(engine, "before_cursor_execute", before)
+    try:
+        yield plans
+    finally:
+        event.remove(engine, "before_cursor_execute", before)
+
+def full_scans(plans, tables):
+    # tables 중 풀 스캔으로 읽힌 (테이블, sql) 목록
+    found = []
+    for sql, details in plans:
+        for d in details:
+            m = _FULL_SCAN.match(d.strip())
+            if m and m.group(1) in tables:
+                found.append((m.group(1), sql))
+    return found
+
+@contextmanager
+def query_budget(engine, max_statements: int):
+    # 블록 안에서 실행된 SQL 문 수가 max_statements를 넘으면 실패 (실행된 문 목록을 메시지에 포함)
+    statements = []
+    listen = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listen)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", listen)
+    assert len(statements) <= max_statements, (
+        f"{len(statements)} statements (budget {max_statements}):\n" + "\n---\n".join(statements)
+    )